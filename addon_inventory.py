@@ -0,0 +1,187 @@
+import os
+import json
+import time
+import zipfile
+import hashlib
+
+# ---------- CONFIGURATION ----------
+
+ADDON_FOLDERS = ("plugins", "mods")
+ADDON_SUFFIXES = (".jar", ".zip")
+ADDON_INDEX_FILE = "addon_index.json"
+HASH_CHUNK = 1024 * 1024
+HISTORY_LIMIT = 200             # change events and crashes kept in the index
+
+# Manifests we know how to read, first found wins
+MANIFEST_JSON = "manifest.json"
+MANIFEST_MF = "META-INF/MANIFEST.MF"
+
+
+# ---------- READING ----------
+
+def hash_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def read_manifest(path):
+    """Name/version info from inside the archive, read via the central directory only."""
+    try:
+        with zipfile.ZipFile(path) as z:
+            names = set(z.namelist())
+            if MANIFEST_JSON in names:
+                data = json.loads(z.read(MANIFEST_JSON).decode("utf-8", "replace"))
+                if isinstance(data, dict):
+                    return {k: data[k] for k in ("Group", "Name", "Version", "Main", "Authors")
+                            if k in data and isinstance(data[k], (str, int, float, list))}
+            if MANIFEST_MF in names:
+                info = {}
+                for line in z.read(MANIFEST_MF).decode("utf-8", "replace").splitlines():
+                    key, sep, value = line.partition(":")
+                    if sep and key in ("Implementation-Title", "Implementation-Version",
+                                       "Specification-Version", "Main-Class"):
+                        info[key] = value.strip()
+                return info
+    except (zipfile.BadZipFile, OSError, ValueError, KeyError):
+        return {"error": "unreadable archive"}
+    return {}
+
+
+def addon_label(rel, entry):
+    m = entry.get("manifest", {})
+    version = m.get("Version") or m.get("Implementation-Version")
+    return f"{rel} ({version})" if version else rel
+
+
+# ---------- INVENTORY ----------
+
+class AddonInventory:
+    """Hashes + manifests of an instance's addons, cached by (size, mtime).
+
+    The index also keeps what changed between boots and the crashes seen with
+    each addon set, so the two can be lined up against boot times.
+    """
+
+    def __init__(self, root, log_dir):
+        self.root = root
+        self.path = os.path.join(log_dir, ADDON_INDEX_FILE)
+        self.files = {}
+        self.changes = []
+        self.crashes = []
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.files = data.get("files", {})
+                self.changes = data.get("changes", [])
+                self.crashes = data.get("crashes", [])
+            except (OSError, ValueError):
+                pass
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "files": self.files,
+                "changes": self.changes[-HISTORY_LIMIT:],
+                "crashes": self.crashes[-HISTORY_LIMIT:],
+            }, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def names(self):
+        return sorted(self.files)
+
+    def fingerprint(self):
+        """Short id of the exact addon set (names + content hashes)."""
+        h = hashlib.sha256()
+        for rel in sorted(self.files):
+            h.update(f"{rel}\0{self.files[rel]['sha256']}\n".encode("utf-8"))
+        return h.hexdigest()[:12]
+
+    def scan(self):
+        """Refresh the index; only files whose size or mtime changed are re-hashed.
+
+        Returns {"added": [...], "removed": [...], "updated": [...]} of labels.
+        """
+        current = {}
+        for folder in ADDON_FOLDERS:
+            base = os.path.join(self.root, folder)
+            if not os.path.isdir(base):
+                continue
+            with os.scandir(base) as it:
+                for e in it:
+                    if e.is_file() and e.name.endswith(ADDON_SUFFIXES):
+                        st = e.stat()
+                        current[f"{folder}/{e.name}"] = (e.path, st.st_size, st.st_mtime_ns)
+
+        added, removed, updated = [], [], []
+        files = {}
+        for rel, (path, size, mtime_ns) in current.items():
+            old = self.files.get(rel)
+            if old and old["size"] == size and old["mtime_ns"] == mtime_ns:
+                files[rel] = old
+                continue
+            entry = {
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "sha256": hash_file(path),
+                "manifest": read_manifest(path),
+            }
+            files[rel] = entry
+            if old is None:
+                added.append(addon_label(rel, entry))
+            elif old["sha256"] != entry["sha256"]:
+                updated.append(f"{addon_label(rel, old)} -> {addon_label(rel, entry)}")
+        for rel in self.files:
+            if rel not in files:
+                removed.append(addon_label(rel, self.files[rel]))
+
+        self.files = files
+        diff = {"added": added, "removed": removed, "updated": updated}
+        if added or removed or updated:
+            self.changes.append({"time": time.time(), "fingerprint": self.fingerprint(), **diff})
+        self.save()
+        return diff
+
+    def note_crash(self, summary):
+        self.crashes.append({"time": time.time(), "fingerprint": self.fingerprint(), "summary": summary})
+        self.save()
+
+    # ----- correlation -----
+
+    def report(self, boot_records):
+        """Boot time and crash count per addon set, newest set first."""
+        sets = {}
+        for r in boot_records:
+            fp = r.get("fingerprint")
+            if fp:
+                s = sets.setdefault(fp, {"boots": [], "crashes": 0})
+                s["boots"].append(r["duration"])
+        for c in self.crashes:
+            sets.setdefault(c["fingerprint"], {"boots": [], "crashes": 0})["crashes"] += 1
+
+        introduced = {c["fingerprint"]: c for c in self.changes}
+        lines = [f"Addons ({len(self.files)}), set {self.fingerprint()}:"]
+        for rel in self.names():
+            lines.append(f"  - {addon_label(rel, self.files[rel])}")
+
+        order = [c["fingerprint"] for c in reversed(self.changes)]
+        order += [fp for fp in sets if fp not in order]
+        for fp in order:
+            if fp not in sets:
+                continue
+            s = sets[fp]
+            boots = s["boots"]
+            mean = f"{sum(boots) / len(boots):.1f}s" if boots else "n/a"
+            lines.append(f"  set {fp}: {len(boots)} boots, mean {mean}, {s['crashes']} crashes")
+            change = introduced.get(fp)
+            if change:
+                when = time.strftime("%Y-%m-%d %H:%M", time.localtime(change["time"]))
+                for kind, sign in (("added", "+"), ("removed", "-"), ("updated", "~")):
+                    for label in change[kind]:
+                        lines.append(f"      {when} {sign} {label}")
+        return "\n".join(lines) + "\n"
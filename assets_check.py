@@ -0,0 +1,202 @@
+import os
+import json
+import time
+import zlib
+import struct
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ---------- CONFIGURATION ----------
+
+ASSETS_INDEX_FILE = "assets_index.json"
+READ_CHUNK = 1024 * 1024
+CHECKPOINT_SECONDS = 5          # persist verification progress this often
+VERIFY_WORKERS = min(8, os.cpu_count() or 1)
+
+LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+LOCAL_SIGNATURE = b"PK\x03\x04"
+
+
+class AssetsError(Exception):
+    pass
+
+
+# ---------- CENTRAL DIRECTORY ----------
+
+def read_central_directory(path):
+    """{name: [crc, header_offset, compress_size, file_size, method]} plus the CD offset."""
+    try:
+        with zipfile.ZipFile(path) as z:
+            members = {
+                i.filename: [i.CRC, i.header_offset, i.compress_size, i.file_size, i.compress_type]
+                for i in z.infolist()
+                if not i.is_dir()
+            }
+            cd_offset = z.start_dir
+    except zipfile.BadZipFile as e:
+        raise AssetsError(f"central directory unreadable: {e}")
+    return members, cd_offset
+
+
+# ---------- MEMBER CHECK ----------
+
+class MemberReader:
+    """Positional reads shared by all worker threads (one fd, no seeks)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        self.local = threading.local()
+
+    def pread(self, n, offset):
+        if hasattr(os, "pread"):
+            return os.pread(self.fd, n, offset)
+        # Windows has no pread: give each thread its own handle
+        f = getattr(self.local, "f", None)
+        if f is None:
+            f = self.local.f = open(self.path, "rb")
+        f.seek(offset)
+        return f.read(n)
+
+    def close(self):
+        os.close(self.fd)
+
+
+def verify_member(reader, name, entry):
+    """Return None if the member's data matches its CRC, else an error string."""
+    crc, offset, csize, usize, method = entry
+    header = reader.pread(LOCAL_HEADER.size, offset)
+    if len(header) < LOCAL_HEADER.size or header[:4] != LOCAL_SIGNATURE:
+        return "bad local header"
+    name_len, extra_len = LOCAL_HEADER.unpack(header)[9:11]
+    pos = offset + LOCAL_HEADER.size + name_len + extra_len
+
+    if method == zipfile.ZIP_STORED:
+        decomp = None
+    elif method == zipfile.ZIP_DEFLATED:
+        decomp = zlib.decompressobj(-15)
+    else:
+        # rare methods (bzip2/lzma): let zipfile do the CRC check
+        try:
+            with zipfile.ZipFile(reader.path) as z, z.open(name) as f:
+                while f.read(READ_CHUNK):
+                    pass
+        except (zipfile.BadZipFile, OSError, EOFError) as e:
+            return str(e)
+        return None
+
+    actual = 0
+    produced = 0
+    remaining = csize
+    try:
+        while remaining > 0:
+            chunk = reader.pread(min(READ_CHUNK, remaining), pos)
+            if not chunk:
+                return "truncated data"
+            pos += len(chunk)
+            remaining -= len(chunk)
+            if decomp is not None:
+                chunk = decomp.decompress(chunk)
+            actual = zlib.crc32(chunk, actual)
+            produced += len(chunk)
+        if decomp is not None:
+            tail = decomp.flush()
+            actual = zlib.crc32(tail, actual)
+            produced += len(tail)
+    except zlib.error as e:
+        return f"inflate failed: {e}"
+
+    if produced != usize:
+        return f"size {produced} != {usize}"
+    if actual != crc:
+        return f"crc {actual:08x} != {crc:08x}"
+    return None
+
+
+# ---------- INDEX ----------
+
+class AssetsIndex:
+    """Cached central directory and verified members of Assets.zip.
+
+    Keyed by archive size + mtime: an untouched archive costs one stat(). When
+    it changes, only members that differ from the last verified entry are
+    re-read, and progress is checkpointed so an interrupted cold check resumes
+    where it stopped.
+    """
+
+    def __init__(self, log_dir):
+        self.path = os.path.join(log_dir, ASSETS_INDEX_FILE)
+        self.data = {}
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.data = json.load(f)
+            except (OSError, ValueError):
+                self.data = {}
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def check(self, archive, progress=None):
+        """Verify archive; raises AssetsError on corruption. Returns a stats dict."""
+        started = time.monotonic()
+        try:
+            st = os.stat(archive)
+        except OSError:
+            raise AssetsError(f"{archive} not found")
+        key = [st.st_size, st.st_mtime_ns]
+
+        if self.data.get("key") == key and self.data.get("complete"):
+            return {"members": len(self.data["members"]), "checked": 0, "cached": True,
+                    "seconds": time.monotonic() - started}
+
+        if self.data.get("key") != key:
+            members, cd_offset = read_central_directory(archive)
+            old_members = self.data.get("members", {})
+            old_verified = set(self.data.get("verified", ()))
+            # members with the same crc, sizes, method and offset as a verified copy
+            # are trusted; the bounds check below still covers truncation for all
+            verified = [n for n in old_verified if n in members and old_members.get(n) == members[n]]
+            for name, (crc, offset, csize, usize, method) in members.items():
+                if offset + csize > cd_offset:
+                    raise AssetsError(f"{name}: data runs past the central directory (truncated?)")
+            self.data = {"key": key, "members": members, "verified": verified, "complete": False}
+            self.save()
+
+        members = self.data["members"]
+        done = set(self.data["verified"])
+        todo = [n for n in members if n not in done]
+        failed = []
+        last_save = time.monotonic()
+
+        reader = MemberReader(archive)
+        try:
+            with ThreadPoolExecutor(VERIFY_WORKERS) as pool:
+                results = pool.map(lambda n: (n, verify_member(reader, n, members[n])), todo)
+                for i, (name, error) in enumerate(results, 1):
+                    if error:
+                        failed.append((name, error))
+                    else:
+                        done.add(name)
+                    if time.monotonic() - last_save > CHECKPOINT_SECONDS:
+                        self.data["verified"] = sorted(done)
+                        self.save()
+                        last_save = time.monotonic()
+                        if progress:
+                            progress(i, len(todo))
+        finally:
+            reader.close()
+
+        self.data["verified"] = sorted(done)
+        self.data["complete"] = not failed
+        self.save()
+
+        if failed:
+            name, error = failed[0]
+            raise AssetsError(f"{len(failed)} corrupt member(s), first: {name}: {error}")
+        return {"members": len(members), "checked": len(todo), "cached": False,
+                "seconds": time.monotonic() - started}
@@ -0,0 +1,132 @@
+import os
+import sys
+import json
+import argparse
+
+try:
+    import numpy as np
+except ImportError:         # only needed when generating; the catalog helpers work without it
+    np = None
+
+from json_parser import OUTPUT_FILE, load_allowed_key_values, respects_restrictions, sort_human_readable
+
+# Bulk random skins for stress-testing the editor's reconciler and the game:
+#   python avatar_generator.py -n 5000 -o random_skins --seed 7
+#   python avatar_generator.py -n 200 --weights weights.json --template MySkin.json
+
+# ---------- CONFIGURATION ----------
+
+GENERATE_COUNT = 1000
+OUTPUT_DIR = "random_skins"
+FILE_PATTERN = "random_{:06d}.json"
+
+
+# ---------- CATALOG ----------
+
+class AvatarCatalog:
+    """Allowed values per key as arrays, so outfits are sampled as index vectors.
+
+    Values that break json_parser's metal-color rules (kneepads, restricted
+    earrings) are dropped up front, so anything drawn from here is valid.
+    """
+
+    def __init__(self, allowed, weights=None):
+        if np is None:
+            raise RuntimeError("NumPy is required for avatar generation (pip install numpy)")
+        self.keys = sorted(allowed)
+        self.values = {}
+        self.probs = {}
+        self.dropped = 0
+        weights = weights or {}
+        if not isinstance(weights, dict) or not all(isinstance(w, dict) for w in weights.values()):
+            raise ValueError("weights must be {key: {value: weight}}")
+        for key in self.keys:
+            values = [v for v in sort_human_readable(allowed[key]) if respects_restrictions(key, v)]
+            self.dropped += len(allowed[key]) - len(values)
+            if not values:
+                raise ValueError(f"no valid values left for {key!r}")
+            self.values[key] = np.array(values, dtype=object)
+            if key in weights:
+                try:
+                    w = np.array([float(weights[key].get(v, 1.0)) for v in values])
+                except TypeError:
+                    raise ValueError(f"weights for {key!r} must be numbers") from None
+                if not np.isfinite(w).all() or (w < 0).any():
+                    raise ValueError(f"weights for {key!r} must be finite and not negative")
+                if w.sum() <= 0:
+                    raise ValueError(f"weights for {key!r} are all zero")
+                self.probs[key] = w / w.sum()
+
+    def sample(self, count, rng):
+        """`count` outfits as a {key: (count,) index array} table."""
+        table = {}
+        for key in self.keys:
+            n = len(self.values[key])
+            p = self.probs.get(key)
+            table[key] = rng.choice(n, size=count, p=p) if p is not None else rng.integers(0, n, size=count)
+        return table
+
+    def outfits(self, count, seed=None):
+        """`count` complete outfits as dicts, one key per catalog entry."""
+        rng = np.random.default_rng(seed)
+        table = self.sample(count, rng)
+        columns = [self.values[key][table[key]].tolist() for key in self.keys]
+        return [dict(zip(self.keys, row)) for row in zip(*columns)]
+
+
+# ---------- OUTPUT ----------
+
+def write_skins(outfits, out_dir, template=None):
+    """One JSON file per outfit; non-catalog fields are copied from `template`."""
+    os.makedirs(out_dir, exist_ok=True)
+    base = dict(template or {})
+    paths = []
+    for i, outfit in enumerate(outfits):
+        path = os.path.join(out_dir, FILE_PATTERN.format(i))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({**base, **outfit}, f, indent=2)
+        paths.append(path)
+    return paths
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write random, schema-valid skin JSON files.")
+    parser.add_argument("-n", "--count", type=int, default=GENERATE_COUNT)
+    parser.add_argument("-o", "--out", default=OUTPUT_DIR)
+    parser.add_argument("--seed", type=int, help="same seed, same skins")
+    parser.add_argument("--catalog", default=OUTPUT_FILE, help="AllowedKeyValues.txt from json_parser.py")
+    parser.add_argument("--weights", help='JSON {key: {value: weight}}; unlisted values weigh 1')
+    parser.add_argument("--template", help="existing skin whose other fields every file copies")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("NumPy is required: pip install numpy", file=sys.stderr)
+        return 1
+    try:
+        if args.count < 0:
+            raise ValueError(f"count must not be negative (got {args.count})")
+        allowed = load_allowed_key_values(args.catalog)
+        weights = template = None
+        if args.weights:
+            with open(args.weights, "r", encoding="utf-8") as f:
+                weights = json.load(f)
+        if args.template:
+            with open(args.template, "r", encoding="utf-8") as f:
+                template = json.load(f)
+            if not isinstance(template, dict):
+                raise ValueError(f"{args.template}: a skin template must be a JSON object")
+        catalog = AvatarCatalog(allowed, weights)
+    except (OSError, ValueError, SyntaxError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    paths = write_skins(catalog.outfits(args.count, args.seed), args.out, template)
+    print(f"Wrote {len(paths)} skins to {args.out} "
+          f"({len(catalog.keys)} keys, {catalog.dropped} restricted values excluded)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
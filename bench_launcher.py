@@ -0,0 +1,267 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import asyncio
+import zipfile
+import argparse
+import tempfile
+import threading
+
+from jvm_profiles import percentile
+from server_instances import JAVA_ENV, MAIN_INSTANCE
+from server_telemetry import ProcSampler, proc_supported
+from fake_server import ARGS_ENV
+
+# Load test of the launcher against fake_server.py instead of Java:
+#   python bench_launcher.py                   # GUI (offscreen Qt) + all scenarios
+#   python bench_launcher.py --mode core -s steady --duration 20
+
+# ---------- CONFIGURATION ----------
+
+FAKE_SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_server.py")
+
+SCENARIOS = {
+    "steady": "--rate 2000",
+    "ansi-burst": "--rate 500 --ansi 0.5 --burst 5000 --burst-every 2",
+    "long-lines": "--rate 200 --long-every 5 --long-length 16384",
+    "crash-loop": "--rate 200 --crash-after 2",
+    "slow-stop": "--rate 200 --stop-delay 60 --ignore-term",
+}
+BENCH_DURATION = 10.0           # seconds of traffic per scenario
+STOP_DEADLINE = 5.0             # passed to "stop", so slow-stop exercises escalation
+PROBE_MS = 10                   # event-loop probe interval
+STALL_MS = 50                   # a probe later than this counts as a stall
+SEQ_REGEX = re.compile(r"seq=(\d+) t=(\d+\.\d+)")
+
+
+# ---------- MEASUREMENT ----------
+
+class Recorder:
+    """Line latency, loop stalls and RSS for one scenario."""
+
+    def __init__(self):
+        self.latencies = []
+        self.lines = 0
+        self.gaps = []
+        self.rss = []
+        self.shutdown = None
+        self.sampler = ProcSampler() if proc_supported() else None
+        if self.sampler:
+            self.sampler.attach(os.getpid())
+
+    def lines_seen(self, text):
+        """Call after the text is displayed; stamps each numbered line."""
+        now = time.monotonic()
+        for m in SEQ_REGEX.finditer(text):
+            self.latencies.append((now - float(m.group(2))) * 1000)
+        self.lines += text.count("\n")
+
+    def probe(self, late_ms):
+        self.gaps.append(late_ms)
+
+    def sample_rss(self):
+        if self.sampler:
+            s = self.sampler.sample()
+            if s:
+                self.rss.append(s.rss_bytes)
+
+    def result(self):
+        lat = sorted(self.latencies)
+        gaps = sorted(self.gaps)
+        mb = 1024 * 1024
+        return {
+            "lines": self.lines,
+            "latency_p50_ms": round(percentile(lat, 50), 2),
+            "latency_p99_ms": round(percentile(lat, 99), 2),
+            "latency_max_ms": round(lat[-1], 2) if lat else 0.0,
+            "stalls": sum(1 for g in gaps if g > STALL_MS),
+            "stall_max_ms": round(gaps[-1], 1) if gaps else 0.0,
+            "rss_start_mb": round(self.rss[0] / mb, 1) if self.rss else None,
+            "rss_end_mb": round(self.rss[-1] / mb, 1) if self.rss else None,
+            "rss_peak_mb": round(max(self.rss) / mb, 1) if self.rss else None,
+            "shutdown_s": self.shutdown,
+        }
+
+
+def make_app_dir():
+    """Throwaway launcher folder with the Assets.zip the pre-flight check wants."""
+    root = tempfile.mkdtemp(prefix="hytale-bench-")
+    app_dir = os.path.join(root, "server")
+    os.makedirs(os.path.join(app_dir, "logs"))
+    with zipfile.ZipFile(os.path.join(root, "Assets.zip"), "w") as z:
+        z.writestr("bench.txt", "fake assets\n")
+    return root, app_dir
+
+
+# ---------- CORE MODE ----------
+
+def run_core(app_dir, scenarios, duration):
+    """ServerProcess + ControlCore only: latency at the event publisher."""
+    from server_control import ControlCore
+    from server_supervisor import Supervisor
+
+    core = ControlCore(app_dir, Supervisor().start_thread())
+    loop = core.supervisor.loop
+    results = {}
+
+    def call(req):
+        async def run():
+            resp = core.handle(req)
+            return await resp if asyncio.iscoroutine(resp) else resp
+        return asyncio.run_coroutine_threadsafe(run(), loop).result()
+
+    for name in scenarios:
+        rec = Recorder()
+        stopped = threading.Event()
+
+        def on_event(ev, rec=rec, stopped=stopped):
+            if ev.get("instance") != MAIN_INSTANCE:
+                return
+            if ev["event"] == "output":
+                rec.lines_seen(ev["text"])
+            elif ev["event"] == "shutdown":
+                rec.shutdown = ev["total"]
+            elif ev["event"] == "stopped":
+                stopped.set()
+
+        async def probe(rec=rec):
+            while True:
+                t = loop.time()
+                await asyncio.sleep(PROBE_MS / 1000)
+                rec.probe((loop.time() - t) * 1000 - PROBE_MS)
+
+        loop.call_soon_threadsafe(core.subscribers.add, on_event)
+        prober = asyncio.run_coroutine_threadsafe(probe(), loop)
+        os.environ[ARGS_ENV] = SCENARIOS[name]
+        resp = call({"op": "start", "instance": MAIN_INSTANCE})
+        if not resp.get("ok"):
+            raise SystemExit(f"{name}: {resp.get('error')}")
+
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            rec.sample_rss()
+            time.sleep(0.5)
+        call({"op": "stop", "instance": MAIN_INSTANCE, "deadline": STOP_DEADLINE})
+        stopped.wait(STOP_DEADLINE + 10)
+        prober.cancel()
+        loop.call_soon_threadsafe(core.subscribers.discard, on_event)
+        rec.sample_rss()
+        results[name] = rec.result()
+    return results
+
+
+# ---------- GUI MODE ----------
+
+def run_gui(app_dir, scenarios, duration):
+    """Full launcher on the offscreen Qt platform: latency after append_ansi."""
+    if sys.platform.startswith("linux"):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer, QEventLoop
+    from hytale_launcher import Launcher
+
+    class BenchLauncher(Launcher):
+        rec = None
+
+        def append_output(self, name, text):
+            super().append_output(name, text)
+            if self.rec:
+                self.rec.lines_seen(text)
+
+        def on_message(self, msg):
+            if self.rec and msg.get("event") == "shutdown":
+                self.rec.shutdown = msg["total"]
+            super().on_message(msg)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    win = BenchLauncher(app_dir)
+    win.show()
+
+    def pump(seconds):
+        loop = QEventLoop()
+        QTimer.singleShot(int(seconds * 1000), loop.quit)
+        loop.exec()
+
+    def wait_for(condition, timeout):
+        end = time.monotonic() + timeout
+        while not condition() and time.monotonic() < end:
+            pump(0.05)
+        return condition()
+
+    if not wait_for(lambda: MAIN_INSTANCE in win.configs, 10):
+        raise SystemExit("launcher did not load its instances")
+    results = {}
+    for name in scenarios:
+        rec = win.rec = Recorder()
+        last = [time.monotonic()]
+
+        def probe(rec=rec, last=last):
+            now = time.monotonic()
+            rec.probe((now - last[0]) * 1000 - PROBE_MS)
+            last[0] = now
+
+        timer = QTimer()
+        timer.timeout.connect(probe)
+        timer.start(PROBE_MS)
+
+        os.environ[ARGS_ENV] = SCENARIOS[name]
+        win.tabs.setCurrentIndex(0)
+        win.start_server()
+        if not wait_for(lambda: MAIN_INSTANCE in win.running, 10):
+            raise SystemExit(f"{name}: server did not start")
+
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            rec.sample_rss()
+            pump(0.5)
+        win.control.request("stop", instance=MAIN_INSTANCE, deadline=STOP_DEADLINE)
+        wait_for(lambda: MAIN_INSTANCE not in win.running, STOP_DEADLINE + 10)
+        timer.stop()
+        rec.sample_rss()
+        results[name] = rec.result()
+        win.rec = None
+
+    win.close()
+    win.shutdown_control()
+    return results
+
+
+# ---------- MAIN ----------
+
+def print_table(results):
+    cols = ("lines", "latency_p50_ms", "latency_p99_ms", "latency_max_ms",
+            "stalls", "stall_max_ms", "rss_start_mb", "rss_peak_mb", "rss_end_mb", "shutdown_s")
+    print("scenario".ljust(12) + "".join(c.replace("_ms", "").replace("_mb", "").rjust(13) for c in cols))
+    for name, r in results.items():
+        print(name.ljust(12) + "".join(str(r[c] if r[c] is not None else "-").rjust(13) for c in cols))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the launcher against fake_server.py.")
+    parser.add_argument("--mode", choices=("gui", "core"), default="gui")
+    parser.add_argument("-s", "--scenario", action="append", choices=list(SCENARIOS),
+                        help="run only these (repeatable)")
+    parser.add_argument("--duration", type=float, default=BENCH_DURATION)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    os.environ[JAVA_ENV] = FAKE_SERVER
+    root, app_dir = make_app_dir()
+    try:
+        run = run_gui if args.mode == "gui" else run_core
+        results = run(app_dir, args.scenario or list(SCENARIOS), args.duration)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"mode": args.mode, "duration": args.duration, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
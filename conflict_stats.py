@@ -0,0 +1,292 @@
+import os
+import sys
+import json
+import time
+import struct
+import argparse
+import threading
+from collections import deque
+
+# ---------- CONFIGURATION ----------
+
+CONFLICT_LOG = "conflicts.bin"        # fixed-size records, see RECORD
+CONFLICT_NAMES = "conflict_names.json"  # ids used in the log -> key / file names
+CONFLICT_WINDOWS = "heat_windows.json"  # recent-check bits per key, so the heatmap survives a restart
+HEATMAP_CONFIG = "heatmap.json"       # optional threshold overrides, see HEATMAP_DEFAULTS
+
+# t (epoch seconds), key id, file id, kind
+RECORD = struct.Struct("<dHHB")
+WRITE, CONFLICT = 0, 1                # kinds: external write seen / key overwritten
+NO_KEY = 0xFFFF
+
+LOGIN_GAP_S = 300                     # first game write after this much quiet counts as a login
+AFTER_LOGIN_S = 120                   # conflicts this soon after a login count as "after login"
+
+HEATMAP_DEFAULTS = {
+    "window": 10,                     # recent checks per key
+    "window_escalate": [3, 6],        # amber / red at this many conflicts in the window
+    "rate_escalate": None,            # [amber, red] conflicts per hour over all history
+}
+
+
+def load_heatmap_config(directory, defaults=HEATMAP_DEFAULTS):
+    """`defaults` overlaid with heatmap.json from `directory`, if present."""
+    config = dict(defaults)
+    path = os.path.join(directory, HEATMAP_CONFIG)
+    if os.path.isfile(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                config.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+    return config
+
+
+# ---------- RUNNING COUNTERS ----------
+
+class HeatWindow:
+    """Last `size` checks of one key with a running hit count."""
+
+    __slots__ = ("bits", "hits")
+
+    def __init__(self, size):
+        self.bits = deque(maxlen=size)
+        self.hits = 0
+
+    def push(self, hit):
+        if len(self.bits) == self.bits.maxlen:
+            self.hits -= self.bits[0]
+        self.bits.append(hit)
+        self.hits += hit
+
+
+class ConflictStats:
+    """Per-key conflict counters plus an append-only on-disk time series.
+
+    Everything the heatmap needs (window hits, lifetime total, rate) is kept
+    as running values, so recording a check and reading a key are O(1).
+    record() only updates memory; flush() does the file I/O and may run on
+    another thread (the editor's I/O worker).
+    """
+
+    def __init__(self, directory, config=None):
+        os.makedirs(directory, exist_ok=True)
+        self.config = config or load_heatmap_config(directory)
+        self.log_path = os.path.join(directory, CONFLICT_LOG)
+        self.names_path = os.path.join(directory, CONFLICT_NAMES)
+        self.windows_path = os.path.join(directory, CONFLICT_WINDOWS)
+        self.keys, self.files = [], []
+        self.key_ids, self.file_ids = {}, {}
+        self.windows = {}
+        self.totals = {}
+        self.first = None               # first record ever, for rates
+        self.lock = threading.Lock()    # record() vs flush()
+        self.pending = []               # packed records not yet in the log
+        self.names_dirty = False
+        self.orphaned = None            # where an unreadable-names log was moved
+        if not self.load_names() and os.path.isfile(self.log_path) \
+                and os.path.getsize(self.log_path) >= RECORD.size:
+            # without the names the ids can't be mapped back; re-interning from 0
+            # would attribute old records to whatever keys come first
+            self.orphaned = f"{self.log_path}.orphaned-{int(time.time())}"
+            os.replace(self.log_path, self.orphaned)
+        for t, key_id, _, kind in self.records():
+            if self.first is None:
+                self.first = t
+            if kind == CONFLICT and key_id < len(self.keys):
+                key = self.keys[key_id]
+                self.totals[key] = self.totals.get(key, 0) + 1
+        if os.path.isfile(self.log_path):
+            size = os.path.getsize(self.log_path)
+            if size % RECORD.size:
+                os.truncate(self.log_path, size - size % RECORD.size)
+        self.load_windows()
+        self.log = open(self.log_path, "ab")
+
+    def load_names(self):
+        """True if conflict_names.json was read."""
+        try:
+            with open(self.names_path, "r", encoding="utf-8") as f:
+                names = json.load(f)
+            for key in names["keys"]:
+                self.intern(key, self.keys, self.key_ids)
+            for name in names["files"]:
+                self.intern(name, self.files, self.file_ids)
+        except (OSError, ValueError, KeyError, TypeError):
+            self.keys, self.files = [], []
+            self.key_ids, self.file_ids = {}, {}
+            return False
+        return True
+
+    def load_windows(self):
+        try:
+            with open(self.windows_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            for key, bits in saved.items():
+                w = self.window(key)
+                for bit in bits:
+                    w.push(1 if bit else 0)
+        except (OSError, ValueError, AttributeError, TypeError):
+            self.windows = {}
+
+    # ----- ids -----
+    def intern(self, name, names, ids):
+        if name not in ids:
+            ids[name] = len(names)
+            names.append(name)
+            return True
+        return False
+
+    def save_json(self, path, data):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    # ----- recording -----
+    def window(self, key):
+        w = self.windows.get(key)
+        if w is None:
+            w = self.windows[key] = HeatWindow(self.config["window"])
+        return w
+
+    def record(self, file_name, checked, conflicts, now=None):
+        """One external write to `file_name`: every key in `checked` gets a window
+        bit, every key in `conflicts` a record for the next flush()."""
+        now = time.time() if now is None else now
+        with self.lock:
+            if self.first is None:
+                self.first = now
+            new = self.intern(file_name, self.files, self.file_ids)
+            file_id = self.file_ids[file_name]
+            self.pending.append(RECORD.pack(now, NO_KEY, file_id, WRITE))
+            for key in checked:
+                hit = key in conflicts
+                self.window(key).push(1 if hit else 0)
+                if hit:
+                    new |= self.intern(key, self.keys, self.key_ids)
+                    self.totals[key] = self.totals.get(key, 0) + 1
+                    self.pending.append(RECORD.pack(now, self.key_ids[key], file_id, CONFLICT))
+            self.names_dirty |= new
+
+    def flush(self):
+        """Write pending records, new names (first, so every id in the log
+        resolves) and the window bits."""
+        with self.lock:
+            if not self.pending:
+                return
+            out, self.pending = self.pending, []
+            dirty, self.names_dirty = self.names_dirty, False
+            names = {"keys": list(self.keys), "files": list(self.files)}
+            windows = {key: list(w.bits) for key, w in self.windows.items()}
+        try:
+            if dirty:
+                self.save_json(self.names_path, names)
+            self.log.write(b"".join(out))
+            self.log.flush()
+        except OSError:
+            with self.lock:
+                self.pending[:0] = out
+                self.names_dirty |= dirty
+            raise
+        self.save_json(self.windows_path, windows)
+
+    def close(self):
+        self.flush()
+        self.log.close()
+
+    # ----- heatmap -----
+    def rate(self, key, now=None):
+        """Lifetime conflicts per hour for `key`."""
+        if self.first is None:
+            return 0.0
+        now = time.time() if now is None else now
+        return self.totals.get(key, 0) / max((now - self.first) / 3600.0, 1.0)
+
+    def level(self, key):
+        """None, "amber" or "red" from the window and, if configured, the long-term rate."""
+        level = 0
+        w = self.windows.get(key)
+        amber, red = self.config["window_escalate"]
+        if w is not None:
+            level = 2 if w.hits >= red else 1 if w.hits >= amber else 0
+        if self.config["rate_escalate"] and level < 2:
+            amber, red = self.config["rate_escalate"]
+            r = self.rate(key)
+            level = max(level, 2 if r >= red else 1 if r >= amber else 0)
+        return (None, "amber", "red")[level]
+
+    # ----- queries -----
+    def records(self):
+        """(t, key id, file id, kind) for every record on disk, oldest first."""
+        if not os.path.isfile(self.log_path):
+            return
+        with open(self.log_path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % RECORD.size     # ignore a torn last record
+        yield from RECORD.iter_unpack(data[:usable])
+
+    def after_login(self, gap=LOGIN_GAP_S, window=AFTER_LOGIN_S):
+        """{key: conflicts} within `window` seconds of a login, most first."""
+        counts = {}
+        last_write = {}
+        login_at = {}
+        for t, key_id, file_id, kind in self.records():
+            if kind == WRITE:
+                if t - last_write.get(file_id, -gap - 1) > gap:
+                    login_at[file_id] = t
+                last_write[file_id] = t
+            elif key_id < len(self.keys) and t - login_at.get(file_id, -window - 1) <= window:
+                key = self.keys[key_id]
+                counts[key] = counts.get(key, 0) + 1
+        return dict(sorted(counts.items(), key=lambda kv: -kv[1]))
+
+    def hourly(self, key=None, file_name=None):
+        """{hour start: conflicts} for one key / file, or all of them."""
+        key_id = self.key_ids.get(key) if key is not None else None
+        file_id = self.file_ids.get(file_name) if file_name is not None else None
+        buckets = {}
+        for t, k, f, kind in self.records():
+            if kind != CONFLICT or (key is not None and k != key_id) or (file_name is not None and f != file_id):
+                continue
+            hour = t - t % 3600
+            buckets[hour] = buckets.get(hour, 0) + 1
+        return dict(sorted(buckets.items()))
+
+    def report(self, top=15):
+        lines = ["Conflicts by key (lifetime, per hour):"]
+        for key, n in sorted(self.totals.items(), key=lambda kv: -kv[1])[:top]:
+            lines.append(f"  {key:<24} {n:7d}  {self.rate(key):7.2f}/h")
+        after = self.after_login()
+        if after:
+            lines.append(f"Overwritten within {AFTER_LOGIN_S}s of a login:")
+            for key, n in list(after.items())[:top]:
+                lines.append(f"  {key:<24} {n:7d}")
+        return "\n".join(lines) + "\n"
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report conflicts recorded by the skin editor.")
+    parser.add_argument("directory", help="the editor's editor_state/conflicts folder")
+    parser.add_argument("--hourly", action="store_true", help="conflicts per hour instead of the summary")
+    parser.add_argument("--key", help="limit --hourly to one key")
+    parser.add_argument("--file", help="limit --hourly to one skin file")
+    args = parser.parse_args(argv)
+
+    stats = ConflictStats(args.directory)
+    if stats.orphaned:
+        print(f"{CONFLICT_NAMES} was missing or unreadable; old records moved to {stats.orphaned}",
+              file=sys.stderr)
+    if args.hourly:
+        for hour, n in stats.hourly(args.key, args.file).items():
+            print(f"{time.strftime('%Y-%m-%d %H:00', time.localtime(hour))}  {n}")
+    else:
+        print(stats.report(), end="")
+    stats.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import random
+import signal
+import time
+from collections import deque
+
+from server_readiness import PatternSet
+
+# ---------- CONFIGURATION ----------
+
+BACKOFF_BASE = 2.0             # first restart delay, seconds
+BACKOFF_MAX = 120.0            # cap on a single restart delay
+STABLE_RUN_SECONDS = 120       # a run this long resets the backoff
+CRASH_LOOP_LIMIT = 5           # crashes ...
+CRASH_LOOP_WINDOW = 300        # ... within this many seconds pause auto-restart
+CRASH_TAIL_LINES = 60          # stdout lines kept for classification
+
+# (name, regex, hint) – first match in the tail wins
+CRASH_SIGNATURES = [
+    ("Out of memory",
+     r"java\.lang\.OutOfMemoryError|Cannot allocate memory|insufficient memory for the Java Runtime",
+     "Raise Max RAM or pick a smaller-footprint profile."),
+    ("Port in use",
+     r"BindException|Address already in use|Failed to bind",
+     "Another server (or a stale one) already holds the port."),
+    ("Corrupt world",
+     r"(?i:corrupt|malformed|truncated)\S*\s.*(?i:chunk|region|world)|EOFException.*(?i:chunk|region)",
+     "Restore the world folder from a backup."),
+    ("Bad JVM options",
+     r"Unrecognized VM option|Could not create the Java Virtual Machine|Invalid maximum heap size",
+     "The Java version does not accept the selected profile's flags."),
+    ("Missing assets",
+     r"Assets\.zip.*(?:not found|NoSuchFile)|NoSuchFileException",
+     "Check that Assets.zip sits next to the server folder."),
+]
+
+# Exit codes that identify the crash on their own. asyncio/subprocess report a
+# signal death as -signal; a shell-wrapped launch exits with 128 + signal.
+_SIGKILL = getattr(signal, "SIGKILL", 9)      # not defined on Windows
+_KILLED = ("Killed (SIGKILL)", "Usually the kernel OOM killer – lower Max RAM.")
+_ABORTED = ("JVM abort (SIGABRT)", "See hs_err_pid*.log in the server folder.")
+EXIT_SIGNATURES = {
+    -_SIGKILL: _KILLED,
+    128 + _SIGKILL: _KILLED,
+    -signal.SIGABRT: _ABORTED,
+    128 + signal.SIGABRT: _ABORTED,
+}
+
+
+# ---------- BACKOFF ----------
+
+class Backoff:
+    """Exponential restart delay with equal jitter, reset after a stable run."""
+
+    def __init__(self, base=BACKOFF_BASE, cap=BACKOFF_MAX, stable=STABLE_RUN_SECONDS):
+        self.base = base
+        self.cap = cap
+        self.stable = stable
+        self.attempt = 0
+
+    def next_delay(self, run_seconds):
+        if run_seconds >= self.stable:
+            self.attempt = 0
+        delay = min(self.cap, self.base * (2 ** self.attempt))
+        self.attempt += 1
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+class CrashLoopBreaker:
+    """Trips when `limit` crashes land inside a sliding `window`."""
+
+    def __init__(self, limit=CRASH_LOOP_LIMIT, window=CRASH_LOOP_WINDOW):
+        self.limit = limit
+        self.window = window
+        self.crashes = deque()
+
+    def record(self, now=None):
+        """Record a crash; returns True if the loop breaker trips."""
+        now = time.monotonic() if now is None else now
+        self.crashes.append(now)
+        while self.crashes and now - self.crashes[0] > self.window:
+            self.crashes.popleft()
+        return len(self.crashes) >= self.limit
+
+    def reset(self):
+        self.crashes.clear()
+
+
+# ---------- CLASSIFICATION ----------
+
+_signature_set = PatternSet(regex for _, regex, _ in CRASH_SIGNATURES)
+_signature_by_regex = {regex: (name, hint) for name, regex, hint in CRASH_SIGNATURES}
+
+
+class CrashReport:
+    """What we know about one crash: signature, hint, exit code and the last lines."""
+
+    def __init__(self, exit_code, tail, name=None, hint=None, evidence=None):
+        self.exit_code = exit_code
+        self.tail = list(tail)
+        self.name = name or "Unknown crash"
+        self.hint = hint or "See logs/server.log for the full output."
+        self.evidence = evidence
+
+    def summary(self):
+        text = f"{self.name} (exit code {self.exit_code}) – {self.hint}"
+        if self.evidence:
+            text += f"\n    > {self.evidence.strip()}"
+        return text
+
+
+def classify_crash(exit_code, tail):
+    """Match the last stdout lines (newest first) and exit code against known signatures."""
+    for line in reversed(tail):
+        regex = _signature_set.match(line)
+        if regex:
+            name, hint = _signature_by_regex[regex]
+            return CrashReport(exit_code, tail, name, hint, line)
+    if exit_code in EXIT_SIGNATURES:
+        name, hint = EXIT_SIGNATURES[exit_code]
+        return CrashReport(exit_code, tail, name, hint)
+    return CrashReport(exit_code, tail)
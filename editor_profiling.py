@@ -0,0 +1,168 @@
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import functools
+from collections import deque
+
+# Opt-in timing for the skin editor. Nothing here is wrapped unless enabled:
+#   HYTALE_EDITOR_PROFILE=editor_trace.json python json_gui_editor.py
+#   python json_gui_editor.py --profile [editor_trace.json] [--profile-sample 5]
+# The trace opens in chrome://tracing or https://ui.perfetto.dev.
+
+# ---------- CONFIGURATION ----------
+
+PROFILE_ENV = "HYTALE_EDITOR_PROFILE"         # "1" or a trace path
+PROFILE_SAMPLE_ENV = "HYTALE_EDITOR_SAMPLE_MS"
+PROFILE_TRACE = "editor_trace.json"
+PROFILE_MAX_SPANS = 200000                    # newest spans kept for the trace
+PROFILE_BUCKETS = 24                          # log2 histogram: <1us ... ~8s
+
+
+# ---------- SPANS ----------
+
+class SpanStats:
+    """Count, total, max and a log2 histogram of one span's durations (us)."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * PROFILE_BUCKETS
+
+    def add(self, us):
+        self.count += 1
+        self.total += us
+        if us > self.max:
+            self.max = us
+        self.buckets[min(int(us).bit_length(), PROFILE_BUCKETS - 1)] += 1
+
+    def percentile(self, pct):
+        """Upper bound (us) of the bucket holding the pct-th duration."""
+        want = self.count * pct / 100.0
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= want:
+                return min(float(1 << i), self.max)
+        return self.max
+
+
+class Profiler:
+    """Timing spans around named functions, a Chrome trace and an optional sampler."""
+
+    def __init__(self, trace_path=PROFILE_TRACE, sample_ms=None):
+        self.trace_path = trace_path
+        self.sample_ms = sample_ms
+        self.origin = time.perf_counter()
+        self.spans = deque(maxlen=PROFILE_MAX_SPANS)
+        self.stats = {}
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.sampler = None
+        self.stopping = threading.Event()
+
+    # ----- instrumentation -----
+    def wrap(self, fn, name=None):
+        name = name or fn.__qualname__
+        clock = time.perf_counter
+        record = self.record
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, start, clock())
+        return timed
+
+    def instrument(self, owner, names):
+        """Replace `names` on a class or module namespace with timed versions.
+        Call before instances exist or signals are connected."""
+        for name in names:
+            if isinstance(owner, dict):
+                owner[name] = self.wrap(owner[name], name)
+            else:
+                setattr(owner, name, self.wrap(getattr(owner, name)))
+
+    def record(self, name, start, end):
+        us = (end - start) * 1e6
+        with self.lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = SpanStats()
+            stats.add(us)
+            self.spans.append((name, threading.get_ident(), (start - self.origin) * 1e6, us))
+
+    # ----- sampling -----
+    def start(self):
+        if self.sample_ms:
+            self.sampler = threading.Thread(target=self.sample_loop, name="profiler-sampler", daemon=True)
+            self.sampler.start()
+        return self
+
+    def sample_loop(self):
+        me = threading.get_ident()
+        interval = self.sample_ms / 1000.0
+        while not self.stopping.wait(interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                folded = ";".join(reversed(stack))
+                self.samples[folded] = self.samples.get(folded, 0) + 1
+
+    # ----- output -----
+    def stop(self):
+        """Stop sampling and write the trace (and folded stacks, if sampled)."""
+        self.stopping.set()
+        if self.sampler is not None:
+            self.sampler.join()
+        with self.lock:
+            spans = list(self.spans)
+        pid = os.getpid()
+        events = [{"name": name, "ph": "X", "ts": round(ts, 1), "dur": round(dur, 1), "pid": pid, "tid": tid}
+                  for name, tid, ts, dur in spans]
+        with open(self.trace_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        if self.samples:
+            # Brendan Gregg's collapsed format, for flamegraph.pl / speedscope
+            with open(os.path.splitext(self.trace_path)[0] + ".folded", "w", encoding="utf-8") as f:
+                for stack, n in sorted(self.samples.items(), key=lambda kv: -kv[1]):
+                    f.write(f"{stack} {n}\n")
+
+    def report(self):
+        lines = [f"{'span':<36}{'count':>8}{'total ms':>11}{'mean us':>10}{'p50 us':>9}{'p99 us':>9}{'max us':>10}"]
+        with self.lock:
+            items = sorted(self.stats.items(), key=lambda kv: -kv[1].total)
+        for name, s in items:
+            lines.append(f"{name:<36}{s.count:>8}{s.total / 1000:>11.1f}{s.total / s.count:>10.0f}"
+                         f"{s.percentile(50):>9.0f}{s.percentile(99):>9.0f}{s.max:>10.0f}")
+        lines.append(f"trace: {self.trace_path}")
+        return "\n".join(lines) + "\n"
+
+
+def profiler_from_argv(argv):
+    """A started Profiler if --profile / PROFILE_ENV asks for one, else None.
+    Returns (profiler, argv without the profiling flags)."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile", nargs="?", const=PROFILE_TRACE)
+    parser.add_argument("--profile-sample", type=float, metavar="MS")
+    args, rest = parser.parse_known_args(argv[1:])
+
+    trace = args.profile or os.environ.get(PROFILE_ENV)
+    if not trace or trace == "0":
+        return None, [argv[0]] + rest
+    if trace == "1":
+        trace = PROFILE_TRACE
+    sample_ms = args.profile_sample or float(os.environ.get(PROFILE_SAMPLE_ENV, 0)) or None
+    return Profiler(trace, sample_ms).start(), [argv[0]] + rest
@@ -0,0 +1,141 @@
+import os
+import sys
+import time
+import shlex
+import random
+import signal
+import argparse
+import threading
+
+# Stand-in for HytaleServer.jar when load-testing the launcher:
+#   HYTALE_JAVA=fake_server.py FAKE_SERVER_ARGS="--rate 5000 --ansi 0.2" python hytale_launcher.py
+# Every line carries "seq=<n> t=<monotonic>" so a reader can measure latency.
+
+# ---------- CONFIGURATION ----------
+
+ARGS_ENV = "FAKE_SERVER_ARGS"
+TICK = 0.01                     # pacing granularity, seconds
+ANSI_CODES = (31, 32, 33, 34, 35, 36, 37)
+LEVEL_MIX = (("INFO", 90), ("WARN", 8), ("SEVERE", 2))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Fake Hytale server for launcher benchmarks.")
+    parser.add_argument("--rate", type=float, default=1000, help="lines per second")
+    parser.add_argument("--duration", type=float, default=0, help="exit after this many seconds (0 = run until /stop)")
+    parser.add_argument("--boot-delay", type=float, default=0.5)
+    parser.add_argument("--ansi", type=float, default=0.0, help="fraction of lines in ANSI colour")
+    parser.add_argument("--burst", type=int, default=0, help="extra lines dumped at once every --burst-every s")
+    parser.add_argument("--burst-every", type=float, default=1.0)
+    parser.add_argument("--long-every", type=int, default=0, help="every Nth line is long")
+    parser.add_argument("--long-length", type=int, default=8192)
+    parser.add_argument("--tps-every", type=float, default=5.0, help="print a TPS line this often (0 = never)")
+    parser.add_argument("--crash-after", type=float, default=0, help="exit with --crash-code after N s")
+    parser.add_argument("--crash-code", type=int, default=1)
+    parser.add_argument("--stop-delay", type=float, default=0.2, help="seconds /stop takes to save")
+    parser.add_argument("--ignore-term", action="store_true", help="ignore SIGTERM (forces SIGKILL)")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args(argv)
+
+
+# ---------- OUTPUT ----------
+
+class Emitter:
+    def __init__(self, args):
+        self.args = args
+        self.seq = 0
+        self.rng = random.Random(args.seed)
+        self.levels = [name for name, weight in LEVEL_MIX for _ in range(weight)]
+        self.out = sys.stdout.buffer
+        self.lock = threading.Lock()
+
+    def line(self, text, level="INFO", logger="FakeServer"):
+        stamp = time.strftime("%Y/%m/%d %H:%M:%S")
+        return f"[{stamp} {level:>6}] [{logger}] {text}\n"
+
+    def traffic(self, count):
+        """`count` numbered lines, written with one syscall."""
+        args = self.args
+        chunks = []
+        for _ in range(count):
+            self.seq += 1
+            text = f"seq={self.seq} t={time.monotonic():.6f}"
+            if args.long_every and self.seq % args.long_every == 0:
+                text += " " + "x" * args.long_length
+            line = self.line(text, self.rng.choice(self.levels))
+            if args.ansi and self.rng.random() < args.ansi:
+                line = f"\x1b[{self.rng.choice(ANSI_CODES)}m{line[:-1]}\x1b[0m\n"
+            chunks.append(line)
+        self.write("".join(chunks))
+
+    def write(self, text):
+        try:
+            with self.lock:
+                self.out.write(text.encode("utf-8"))
+                self.out.flush()
+        except BrokenPipeError:
+            os._exit(0)
+
+
+# ---------- MAIN ----------
+
+def main():
+    # launched as "java": the real argv is JVM flags, so options come from the env
+    argv = shlex.split(os.environ.get(ARGS_ENV, ""))
+    if "-jar" not in sys.argv:
+        argv += sys.argv[1:]
+    args = parse_args(argv)
+    if args.ignore_term and hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    out = Emitter(args)
+    stop = threading.Event()
+
+    def read_stdin():
+        for command in sys.stdin:
+            command = command.strip()
+            if command == "/stop":
+                stop.set()
+                return
+            if command:
+                out.write(out.line(f"Unknown command: {command}", "WARN", "CommandManager"))
+
+    threading.Thread(target=read_stdin, daemon=True).start()
+
+    time.sleep(args.boot_delay)
+    out.write(out.line("Hytale Server Booted!", logger="HytaleServer"))
+
+    started = time.monotonic()
+    paced = 0
+    next_burst = started + args.burst_every
+    next_tps = started + args.tps_every if args.tps_every else None
+    while not stop.is_set():
+        now = time.monotonic()
+        if args.duration and now - started >= args.duration:
+            break
+        if args.crash_after and now - started >= args.crash_after:
+            out.write(out.line("java.lang.OutOfMemoryError: Java heap space", "SEVERE"))
+            os._exit(args.crash_code)
+
+        due = int(args.rate * (now - started)) - paced
+        if due > 0:
+            out.traffic(due)
+            paced += due
+        if args.burst and now >= next_burst:
+            out.traffic(args.burst)
+            next_burst += args.burst_every
+        if next_tps and now >= next_tps:
+            out.write(out.line(f"TPS: {19.5 + out.rng.random():.1f}", logger="World|default")
+                      + out.line(f"Tick time: {out.rng.uniform(5, 45):.1f} ms", logger="World|default"))
+            next_tps += args.tps_every
+        time.sleep(TICK)
+
+    if stop.is_set():
+        out.write(out.line("Shutting down...", logger="HytaleServer"))
+        time.sleep(args.stop_delay)
+        out.write(out.line("Saved all worlds", logger="Universe"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,30 @@
+import time
+STARTED = time.perf_counter()   # before the other imports, for the startup report
+
 import sys
 import os
-import subprocess
-import threading
-import time
 import re
+import json
 
+# Only what the first paint needs is imported here. The control core (asyncio,
+# zip/hash checks), QtNetwork, the tray and /proc telemetry load after the
+# first frame, in Launcher.finish_startup().
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTextEdit, QLineEdit, QLabel, QSlider, QCheckBox,
-    QSystemTrayIcon, QMenu
+    QComboBox, QTabWidget
+)
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer, QPointF
+from PyQt6.QtGui import QTextCharFormat, QColor, QTextCursor, QPainter, QPen, QPolygonF
+
+from jvm_profiles import (
+    PROFILES, DEFAULT_PROFILE, auto_heap,
+    gc_log_files, summarize_gc_log, format_gc_summary,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer
-from PyQt6.QtGui import QTextCharFormat, QColor, QTextCursor, QIcon
+from server_logs import LogParser, LogFilter, LEVELS, TRACE
+from server_instances import MAIN_INSTANCE
+
+IMPORTED = time.perf_counter()
 
 #      ▄████  ██▓     ██▓▄▄▄█████▓▒██   ██▒ ██░ ██ 
 #     ██▒ ▀█▒▓██▒    ▓██▒▓  ██▒ ▓▒▒▒ █ █ ▒░▓██░ ██▒
@@ -30,8 +43,6 @@ APP_DIR = os.path.dirname(os.path.abspath(__file__))
 LOG_DIR = os.path.join(APP_DIR, "logs")
 LOG_FILE = os.path.join(LOG_DIR, "server.log")
 
-os.makedirs(LOG_DIR, exist_ok=True)
-
 ANSI_REGEX = re.compile(r"\x1b\[(\d+(?:;\d+)*)m")
 
 ANSI_COLORS = {
@@ -47,104 +58,324 @@ ANSI_COLORS = {
 
 DEFAULT_TEXT_COLOR = QColor("#b266ff")  # purple
 
-# ---------------- SIGNALS ----------------
-
-class Signals(QObject):
-    text = pyqtSignal(str)
-    stopped = pyqtSignal(bool)
-
-signals = Signals()
-
-# ---------------- SERVER THREAD ----------------
-
-class ServerProcess(threading.Thread):
-    def __init__(self, min_ram, max_ram, auto_restart):
-        super().__init__(daemon=True)
-        self.min_ram = min_ram
-        self.max_ram = max_ram
-        self.auto_restart = auto_restart
-        self.process = None
-        self.stop_requested = False
-
-    def run(self):
-        while True:
-            self.start_process()
-            self.process.wait()
-
-            if self.stop_requested:
-                signals.stopped.emit(False)
-                break
-
-            signals.text.emit("\n[Server crashed]\n")
-            if not self.auto_restart:
-                signals.stopped.emit(True)
-                break
-
-            time.sleep(2)
-            signals.text.emit("Restarting server...\n")
-
-    def start_process(self):
-        cmd = [
-            "java",
-            "-Dfile.encoding=UTF-8",
-            f"-Xms{self.min_ram}G",
-            f"-Xmx{self.max_ram}G",
-            "-jar",
-            "HytaleServer.jar",
-            "--assets",
-            os.path.join(APP_DIR, "..", "Assets.zip"),
-            "--auth-mode",
-            "offline",
-        ]
-
-        self.process = subprocess.Popen(
-            cmd,
-            cwd=APP_DIR,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            encoding="utf-8",
-            errors="replace",
-            bufsize=1,
-            creationflags=subprocess.CREATE_NO_WINDOW
-            if sys.platform == "win32"
-            else 0,
-        )
+LOG_VIEW_LEVELS = ["All levels"] + [f"{name}+" for name in LEVELS[1:]]
+ALL_LOGGERS = "All loggers"
+LOG_COUNTS_INTERVAL_MS = 1000
+METRICS_INTERVAL_MS = 1000
+
+STARTUP_FILE = "startup_times.json"
+STARTUP_HISTORY = 50            # launches kept for the regression baseline
+STARTUP_SLOW_FACTOR = 1.5       # flag a phase this much slower than its median...
+STARTUP_SLOW_MIN_MS = 20        # ...and at least this many ms slower (ignores jitter)
+FIRST_PAINT_TIMEOUT_MS = 1000   # finish startup anyway if no paint arrives (started hidden)
+
+# ---------------- STARTUP ----------------
+
+STARTUP_MARKS = {"imports": (IMPORTED - STARTED) * 1000}
+
+
+def mark_startup(phase):
+    """Milliseconds from interpreter start of this module to `phase`."""
+    STARTUP_MARKS.setdefault(phase, (time.perf_counter() - STARTED) * 1000)
+
+
+def startup_report(log_dir):
+    """Append this launch to startup_times.json and compare against the median."""
+    path = os.path.join(log_dir, STARTUP_FILE)
+    history = []
+    if os.path.isfile(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            history = []
+
+    parts = []
+    for phase, ms in STARTUP_MARKS.items():
+        past = sorted(h[phase] for h in history if phase in h)
+        text = f"{phase} {ms:.0f} ms"
+        if past:
+            median = past[len(past) // 2]
+            if ms > median * STARTUP_SLOW_FACTOR and ms - median > STARTUP_SLOW_MIN_MS:
+                text += f" (slow, median {median:.0f})"
+        parts.append(text)
+
+    history.append({"time": time.time(), **{k: round(v, 1) for k, v in STARTUP_MARKS.items()}})
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(history[-STARTUP_HISTORY:], f, indent=1)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return "Startup: " + ", ".join(parts)
+
+# ---------------- SPARKLINE ----------------
+
+class Sparkline(QWidget):
+    def __init__(self, title, unit="", color="#55ffaa"):
+        super().__init__()
+        self.title = title
+        self.unit = unit
+        self.color = QColor(color)
+        self.values = []
+        self.setMinimumSize(140, 36)
+
+    def set_values(self, values):
+        self.values = values
+        self.update()
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        w, h = self.width(), self.height()
+
+        last = self.values[-1] if self.values else 0
+        p.setPen(QColor("#aaffcc"))
+        p.drawText(4, 12, f"{self.title}: {last:.1f}{self.unit}")
+
+        if len(self.values) < 2:
+            return
 
-        with open(LOG_FILE, "a", encoding="utf-8", errors="replace") as log:
-            for line in self.process.stdout:
-                signals.text.emit(line)
-                log.write(line)
+        top = 16
+        peak = max(self.values) or 1
+        step = w / (len(self.values) - 1)
+        poly = QPolygonF([
+            QPointF(i * step, h - 2 - (v / peak) * (h - top - 4))
+            for i, v in enumerate(self.values)
+        ])
+        p.setPen(QPen(self.color, 1.5))
+        p.drawPolyline(poly)
 
-    def send(self, text):
-        if self.process and self.process.stdin:
-            try:
-                self.process.stdin.write(text + "\n")
-                self.process.stdin.flush()
-            except Exception:
-                pass
+# ---------------- CONTROL CLIENT ----------------
+
+class ControlClient(QObject):
+    """GUI end of the control protocol.
+
+    Talks to a daemon (or the launcher's own core) over the Unix socket with
+    QLocalSocket; without Unix sockets it hands the same JSON messages to an
+    in-process core on the supervisor loop. Responses and events both arrive
+    on the GUI thread through `message`.
+    """
+    message = pyqtSignal(object)
 
-    def stop(self):
-        self.stop_requested = True
-        self.send("/stop")
+    def __init__(self):
+        super().__init__()
+        self.socket = None
+        self.core = None
+        self.buffer = b""
+        self.next_id = 0
+        self.pending = {}
+        self.queued = []        # requests made before the deferred connect
+        self.message.connect(self.dispatch_response)
+
+    def connect_socket(self, path):
+        from PyQt6.QtNetwork import QLocalSocket
+        self.socket = QLocalSocket(self)
+        self.socket.readyRead.connect(self.read_socket)
+        self.socket.connectToServer(path)
+        connected = self.socket.waitForConnected(2000)
+        self.flush_queued()
+        return connected
+
+    def attach_core(self, core):
+        self.core = core
+        core.supervisor.loop.call_soon_threadsafe(core.subscribers.add, self.message.emit)
+        self.flush_queued()
+
+    def flush_queued(self):
+        queued, self.queued = self.queued, []
+        for op, callback, params in queued:
+            self.request(op, callback, **params)
+
+    def request(self, op, callback=None, **params):
+        if self.socket is None and self.core is None:
+            self.queued.append((op, callback, params))
+            return
+        self.next_id += 1
+        req = {"id": self.next_id, "op": op, **params}
+        if callback:
+            self.pending[self.next_id] = callback
+
+        if self.socket is not None:
+            self.socket.write((json.dumps(req) + "\n").encode("utf-8"))
+        else:
+            core = self.core
+            if op == "subscribe":
+                resp = {"ok": True}
+                core.supervisor.loop.call_soon_threadsafe(
+                    lambda: self.message.emit({**resp, "id": req["id"]})
+                )
+            else:
+                core.supervisor.loop.call_soon_threadsafe(self.handle_local, req)
+
+    def handle_local(self, req):
+        # runs on the supervisor loop
+        import asyncio
+        resp = self.core.handle(req)
+        if asyncio.iscoroutine(resp):
+            task = asyncio.ensure_future(resp)
+            task.add_done_callback(lambda t: self.message.emit({**t.result(), "id": req["id"]}))
+        else:
+            self.message.emit({**resp, "id": req["id"]})
+
+    def read_socket(self):
+        self.buffer += bytes(self.socket.readAll())
+        *lines, self.buffer = self.buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                self.message.emit(json.loads(line))
+
+    def dispatch_response(self, msg):
+        callback = self.pending.pop(msg.get("id"), None) if "event" not in msg else None
+        if callback:
+            callback(msg)
 
 # ---------------- GUI ----------------
 
 class Launcher(QMainWindow):
-    def __init__(self):
+    def __init__(self, app_dir=APP_DIR):
         super().__init__()
+        self.app_dir = app_dir
         self.setWindowTitle("Hytale Server Console")
         self.resize(980, 580)
 
-        self.server = None
-        self.current_color = DEFAULT_TEXT_COLOR
+        self.configs = {}
+        self.consoles = {}
+        self.colors = {}
+        self.statuses = {}
+        self.samplers = {}
+        self.pids = {}
+        self.logs = {}
+        self.filters = {}
+        self.running = set()
         self.exit_after_stop = False
+        self.core = None
+        self.control_server = None
+        self.exporter = None
+        self.tray = None
+        self.control = ControlClient()
+        self.started_up = False
 
         self.init_ui()
+        mark_startup("window")
+        QTimer.singleShot(FIRST_PAINT_TIMEOUT_MS, self.finish_startup)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if "first_paint" not in STARTUP_MARKS:
+            mark_startup("first_paint")
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        """Everything the first frame does not need: tray, telemetry, control core."""
+        if self.started_up:
+            return
+        self.started_up = True
         self.init_tray()
+        self.init_telemetry()
+        self.init_control()
+        mark_startup("deferred")
+
+    @property
+    def current(self):
+        return self.tabs.tabText(self.tabs.currentIndex()) or MAIN_INSTANCE
+
+    # ---------- Control ----------
+
+    def init_control(self):
+        import asyncio
+        from server_supervisor import Supervisor
+        from server_control import (
+            ControlCore, ControlServer, control_socket_path,
+            daemon_running, unix_sockets_supported,
+        )
+
+        self.control.message.connect(self.on_message)
+        path = control_socket_path(self.app_dir)
 
-        signals.text.connect(self.append_ansi)
-        signals.stopped.connect(self.on_stopped)
+        if daemon_running(path):
+            self.control.connect_socket(path)
+            self.setWindowTitle("Hytale Server Console (daemon)")
+        else:
+            # no daemon: host the core ourselves, and still serve the socket for scripts
+            self.core = ControlCore(self.app_dir, Supervisor().start_thread())
+            if unix_sockets_supported():
+                self.control_server = ControlServer(self.core, path)
+                asyncio.run_coroutine_threadsafe(
+                    self.control_server.start(), self.core.supervisor.loop
+                ).result()
+                self.control.connect_socket(path)
+            else:
+                self.control.attach_core(self.core)
+            try:
+                self.exporter = asyncio.run_coroutine_threadsafe(
+                    self.core.start_exporter(), self.core.supervisor.loop
+                ).result()
+            except OSError as e:
+                self.append_text(f"Metrics exporter disabled: {e}\n")
+            QApplication.instance().aboutToQuit.connect(self.shutdown_control)
+
+        self.control.request("subscribe")
+        self.control.request("instances", self.on_instances)
+        self.control.request("status", self.on_status_snapshot)
+
+    def shutdown_control(self):
+        if self.control_server:
+            self.core.supervisor.loop.call_soon_threadsafe(self.control_server.close)
+        if self.exporter:
+            self.core.supervisor.loop.call_soon_threadsafe(self.exporter.close)
+
+    def on_message(self, msg):
+        event = msg.get("event")
+        if event is None:
+            return
+        name = msg["instance"]
+        if name not in self.consoles:
+            return
+        if event == "output":
+            self.append_output(name, msg["text"])
+        elif event == "booting":
+            self.on_booting(name)
+        elif event == "spawned":
+            self.pids[name] = msg["pid"]
+        elif event == "ready":
+            self.on_ready(name, msg["pattern"], msg["duration"])
+        elif event == "crashed":
+            self.on_crashed(name, msg["summary"])
+        elif event == "stopped":
+            self.on_stopped(name, msg["crashed"])
+
+    def on_instances(self, resp):
+        for data in resp.get("instances", []):
+            self.configs[data["name"]] = data
+            if data["name"] not in self.consoles:
+                self.add_console(data["name"])
+        self.on_tab_changed()
+        if "ready" not in STARTUP_MARKS:
+            mark_startup("ready")
+            self.append_text(startup_report(os.path.join(self.app_dir, "logs")) + "\n")
+        self.append_text("Ready.\n")
+
+    def on_status_snapshot(self, resp):
+        colors = {"starting": "yellow", "running": "#55ff55", "stopping": "#55aaff",
+                  "crashed": "#ff8800", "stopped": "red"}
+        for name, state in resp.get("instances", {}).items():
+            if name not in self.consoles:
+                continue
+            if state["status"] in ("starting", "running", "stopping"):
+                self.running.add(name)
+            if state.get("pid"):
+                self.pids[name] = state["pid"]
+            self.set_status(state["status"].capitalize(), colors[state["status"]],
+                            name, state.get("summary", ""))
+
+    def report_error(self, resp):
+        if not resp.get("ok"):
+            self.append_text(f"\n[Launcher] {resp.get('error')}\n")
+            return True
+        return False
 
     # ---------- UI ----------
 
@@ -181,6 +412,8 @@ class Launcher(QMainWindow):
         self.stop_btn = QPushButton("Stop)")
         self.auto_restart = QCheckBox("Auto-restart")
         self.auto_restart.setChecked(True)
+        self.boot_stats_btn = QPushButton("Boot Stats")
+        self.add_instance_btn = QPushButton("Add Instance")
 
         self.status_label = QLabel("● Stopped")
         self.status_label.setStyleSheet("color: red; font-weight: bold;")
@@ -188,6 +421,8 @@ class Launcher(QMainWindow):
         top.addWidget(self.start_btn)
         top.addWidget(self.stop_btn)
         top.addWidget(self.auto_restart)
+        top.addWidget(self.boot_stats_btn)
+        top.addWidget(self.add_instance_btn)
         top.addStretch()
         top.addWidget(self.status_label)
         layout.addLayout(top)
@@ -207,14 +442,54 @@ class Launcher(QMainWindow):
         ram.addWidget(self.min_slider)
         ram.addWidget(self.max_label)
         ram.addWidget(self.max_slider)
+
+        self.profile_box = QComboBox()
+        self.profile_box.addItems(PROFILES.keys())
+        self.profile_box.setCurrentText(DEFAULT_PROFILE)
+        self.auto_heap = QCheckBox("Auto heap")
+        self.gc_btn = QPushButton("GC Summary")
+        ram.addWidget(self.profile_box)
+        ram.addWidget(self.auto_heap)
+        ram.addWidget(self.gc_btn)
         layout.addLayout(ram)
 
-        self.console = QTextEdit()
-        self.console.setReadOnly(True)
-        self.console.setStyleSheet(
-            "background-color: black; font-family: Consolas; color: #b266ff;"
-        )
-        layout.addWidget(self.console)
+        stats = QHBoxLayout()
+        self.cpu_spark = Sparkline("CPU", "%", "#ffff55")
+        self.rss_spark = Sparkline("RSS", "M", "#b266ff")
+        self.threads_spark = Sparkline("Threads", "", "#55ffff")
+        self.io_spark = Sparkline("I/O", "K/s", "#ff55ff")
+        self.ctxt_spark = Sparkline("Ctx/s", "", "#5599ff")
+        self.tps_spark = Sparkline("TPS", "", "#55ff55")
+        self.tick_spark = Sparkline("Tick", "ms", "#ff8800")
+        self.players_spark = Sparkline("Players", "", "#aaffcc")
+        for spark in (self.cpu_spark, self.rss_spark, self.threads_spark,
+                      self.io_spark, self.ctxt_spark):
+            stats.addWidget(spark)
+        self.export_btn = QPushButton("Export CSV")
+        stats.addWidget(self.export_btn)
+        layout.addLayout(stats)
+
+        health = QHBoxLayout()
+        for spark in (self.tps_spark, self.tick_spark, self.players_spark):
+            health.addWidget(spark)
+        health.addStretch()
+        layout.addLayout(health)
+
+        view = QHBoxLayout()
+        self.level_box = QComboBox()
+        self.level_box.addItems(LOG_VIEW_LEVELS)
+        self.logger_box = QComboBox()
+        self.logger_box.addItem(ALL_LOGGERS)
+        self.logger_box.setMinimumWidth(180)
+        self.log_counts = QLabel("")
+        view.addWidget(self.level_box)
+        view.addWidget(self.logger_box)
+        view.addStretch()
+        view.addWidget(self.log_counts)
+        layout.addLayout(view)
+
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
 
         self.input = QLineEdit()
         self.input.setPlaceholderText("Enter server command...")
@@ -223,6 +498,26 @@ class Launcher(QMainWindow):
         self.start_btn.clicked.connect(self.start_server)
         self.stop_btn.clicked.connect(self.stop_server)
         self.input.returnPressed.connect(self.send_command)
+        self.export_btn.clicked.connect(self.export_telemetry)
+        self.gc_btn.clicked.connect(self.show_gc_summary)
+        self.add_instance_btn.clicked.connect(self.add_instance)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        self.level_box.activated.connect(self.apply_log_filter)
+        self.logger_box.activated.connect(self.apply_log_filter)
+        self.log_timer = QTimer(self)
+        self.log_timer.timeout.connect(self.refresh_log_counts)
+        self.log_timer.start(LOG_COUNTS_INTERVAL_MS)
+        self.auto_heap.toggled.connect(lambda on: on and self.apply_auto_heap())
+        self.profile_box.currentTextChanged.connect(
+            lambda _: self.auto_heap.isChecked() and self.apply_auto_heap()
+        )
+        self.boot_stats_btn.clicked.connect(
+            lambda: self.control.request(
+                "boot_stats",
+                lambda r: self.report_error(r) or self.append_text("\n" + r["report"]),
+                instance=self.current,
+            )
+        )
 
         self.min_slider.valueChanged.connect(
             lambda v: self.min_label.setText(f"Min RAM: {v}G")
@@ -231,11 +526,93 @@ class Launcher(QMainWindow):
             lambda v: self.max_label.setText(f"Max RAM: {v}G")
         )
 
-        self.append_text("Ready.\n")
+    def add_console(self, name):
+        console = QTextEdit()
+        console.setReadOnly(True)
+        console.setStyleSheet(
+            "background-color: black; font-family: Consolas; color: #b266ff;"
+        )
+        self.consoles[name] = console
+        self.colors[name] = DEFAULT_TEXT_COLOR
+        self.statuses[name] = ("Stopped", "red", "")
+        self.logs[name] = LogParser()
+        self.filters[name] = LogFilter()
+        self.tabs.addTab(console, name)
+        return console
+
+    # ---------- Instances ----------
+
+    def add_instance(self):
+        def created(resp):
+            if self.report_error(resp):
+                return
+            cfg = resp["instance"]
+            self.configs[cfg["name"]] = cfg
+            self.add_console(cfg["name"])
+            self.tabs.setCurrentIndex(self.tabs.count() - 1)
+            self.append_text(f"Instance {cfg['name']} on port {cfg['port']}: {cfg['root']}\n")
+
+        self.control.request(
+            "add_instance", created,
+            min_ram=self.min_slider.value(),
+            max_ram=self.max_slider.value(),
+            profile=self.profile_box.currentText(),
+        )
+
+    def on_tab_changed(self, *_):
+        cfg = self.configs.get(self.current)
+        if not cfg:
+            return
+        self.min_slider.setValue(cfg["min_ram"])
+        self.max_slider.setValue(cfg["max_ram"])
+        self.profile_box.setCurrentText(cfg["profile"])
+        text, color, tip = self.statuses[cfg["name"]]
+        self.show_status(text, color, tip)
+        self.refresh_sparklines()
+        for spark in (self.tps_spark, self.tick_spark, self.players_spark):
+            spark.set_values([])
+        self.request_metrics()
+        flt = self.filters[cfg["name"]]
+        self.level_box.setCurrentIndex(flt.min_level)
+        self.refresh_log_counts()
+
+    # ---------- Log Views ----------
+
+    def apply_log_filter(self, *_):
+        """Rebuild the current console from parsed lines; the server log is not re-read."""
+        name = self.current
+        if name not in self.logs:
+            return
+        logger = self.logger_box.currentText()
+        flt = LogFilter(self.level_box.currentIndex(), None if logger == ALL_LOGGERS else logger)
+        self.filters[name] = flt
+        console = self.consoles[name]
+        console.clear()
+        self.colors[name] = DEFAULT_TEXT_COLOR
+        self.append_ansi(name, "".join(self.logs[name].view(flt)))
+
+    def refresh_log_counts(self):
+        log = self.logs.get(self.current)
+        if log is None:
+            return
+        self.log_counts.setText(log.summary())
+        self.log_counts.setToolTip(log.summary(TRACE))
+
+        flt = self.filters[self.current]
+        wanted = [ALL_LOGGERS] + sorted(log.loggers)
+        if flt.logger and flt.logger not in log.loggers:
+            wanted.append(flt.logger)
+        if wanted != [self.logger_box.itemText(i) for i in range(self.logger_box.count())]:
+            self.logger_box.clear()
+            self.logger_box.addItems(wanted)
+        self.logger_box.setCurrentText(flt.logger or ALL_LOGGERS)
 
     # ---------- Tray ----------
 
     def init_tray(self):
+        from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
+        from PyQt6.QtGui import QIcon
+
         self.tray = QSystemTrayIcon(QIcon.fromTheme("applications-games"), self)
         self.tray.setToolTip("Hytale Server")
 
@@ -253,30 +630,118 @@ class Launcher(QMainWindow):
         )
         self.tray.show()
 
+    # ---------- Telemetry ----------
+
+    def init_telemetry(self):
+        from server_telemetry import proc_supported, TELEMETRY_INTERVAL_MS
+
+        self.telemetry_timer = QTimer(self)
+        self.telemetry_timer.timeout.connect(self.sample_telemetry)
+        if proc_supported():
+            self.telemetry_timer.start(TELEMETRY_INTERVAL_MS)
+        else:
+            self.export_btn.setEnabled(False)
+
+        # server-reported health comes from the control core, so it works everywhere
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.timeout.connect(self.request_metrics)
+        self.metrics_timer.start(METRICS_INTERVAL_MS)
+
+    def request_metrics(self):
+        if self.current in self.running:
+            self.control.request("metrics", self.on_metrics, instance=self.current)
+
+    def on_metrics(self, resp):
+        if not resp.get("ok") or resp["instance"] != self.current:
+            return
+        series = resp["series"]
+        self.tps_spark.set_values([v for _, v in series["tps"]])
+        self.tick_spark.set_values([v for _, v in series["tick_ms"]])
+        self.players_spark.set_values([v for _, v in series["players"]])
+
+    def sample_telemetry(self):
+        from server_telemetry import ProcSampler, TELEMETRY_HISTORY
+
+        for name, pid in self.pids.items():
+            sampler = self.samplers.setdefault(name, ProcSampler(TELEMETRY_HISTORY))
+            if pid is None:
+                sampler.detach()
+                continue
+            sampler.attach(pid)
+            sampler.sample()
+        self.refresh_sparklines()
+
+    def refresh_sparklines(self):
+        sampler = self.samplers.get(self.current)
+        if sampler is None:
+            for spark in (self.cpu_spark, self.rss_spark, self.threads_spark,
+                          self.io_spark, self.ctxt_spark):
+                spark.set_values([])
+            return
+
+        self.cpu_spark.set_values(sampler.series("cpu_percent"))
+        self.rss_spark.set_values([v / 1048576 for v in sampler.series("rss_bytes")])
+        self.threads_spark.set_values(sampler.series("threads"))
+        reads = sampler.rate_series("read_bytes")
+        writes = sampler.rate_series("write_bytes")
+        self.io_spark.set_values([(r + w) / 1024 for r, w in zip(reads, writes)])
+        vol = sampler.rate_series("voluntary_ctxt")
+        invol = sampler.rate_series("nonvoluntary_ctxt")
+        self.ctxt_spark.set_values([a + b for a, b in zip(vol, invol)])
+
+    def export_telemetry(self):
+        from server_telemetry import export_csv
+
+        sampler = self.samplers.get(self.current)
+        if not sampler or not sampler.samples:
+            self.append_text("\nNo telemetry samples yet.\n")
+            return
+        log_dir = os.path.join(self.configs[self.current]["root"], "logs")
+        path = os.path.join(log_dir, time.strftime("telemetry-%Y%m%d-%H%M%S.csv"))
+        export_csv(sampler.samples, path)
+        self.append_text(f"\nTelemetry exported: {path}\n")
+
     def closeEvent(self, event):
+        if self.tray is None:
+            event.accept()
+            return
         event.ignore()
         self.hide()
         self.tray.showMessage(
             "Hytale Server",
             "Running in system tray",
-            QSystemTrayIcon.MessageIcon.Information,
+            self.tray.MessageIcon.Information,
             2500,
         )
 
     # ---------- Output ----------
 
-    def append_text(self, text):
-        cursor = self.console.textCursor()
+    def append_output(self, name, text):
+        records = self.logs[name].feed(text.splitlines(keepends=True))
+        flt = self.filters[name]
+        if flt.active:
+            text = "".join(r.line for r in records if flt.accepts(r))
+        if text:
+            self.append_ansi(name, text)
+
+    def append_text(self, text, name=None):
+        name = name or self.current
+        console = self.consoles.get(name)
+        if console is None:
+            return
+        self.logs[name].annotate(text)
+        cursor = console.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         cursor.insertText(text)
-        self.console.setTextCursor(cursor)
+        console.setTextCursor(cursor)
 
-    def append_ansi(self, text):
-        cursor = self.console.textCursor()
+    def append_ansi(self, name, text):
+        console = self.consoles[name]
+        cursor = console.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
         pos = 0
-        color = self.current_color
+        color = self.colors[name]
 
         for m in ANSI_REGEX.finditer(text):
             cursor.insertText(text[pos:m.start()], self.format(color))
@@ -285,8 +750,8 @@ class Launcher(QMainWindow):
             pos = m.end()
 
         cursor.insertText(text[pos:], self.format(color))
-        self.current_color = color
-        self.console.setTextCursor(cursor)
+        self.colors[name] = color
+        console.setTextCursor(cursor)
 
     def format(self, color):
         fmt = QTextCharFormat()
@@ -295,66 +760,154 @@ class Launcher(QMainWindow):
 
     # ---------- Server ----------
 
-    def set_status(self, text, color):
+    def set_status(self, text, color, name=None, tooltip=""):
+        name = name or self.current
+        self.statuses[name] = (text, color, tooltip)
+        if name == self.current:
+            self.show_status(text, color, tooltip)
+
+    def show_status(self, text, color, tooltip=""):
         self.status_label.setText(f"● {text}")
         self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        self.status_label.setToolTip(tooltip)
 
     def start_server(self):
-        if self.server:
+        name = self.current
+        if name in self.running or name not in self.configs:
             return
-        self.set_status("Starting", "yellow")
-        self.detect_addons()
-        self.server = ServerProcess(
-            self.min_slider.value(),
-            self.max_slider.value(),
-            self.auto_restart.isChecked(),
+        if self.auto_heap.isChecked():
+            self.apply_auto_heap()
+
+        cfg = self.configs[name]
+        cfg["min_ram"] = self.min_slider.value()
+        cfg["max_ram"] = self.max_slider.value()
+        cfg["profile"] = self.profile_box.currentText()
+        self.running.add(name)
+        self.set_status("Starting", "yellow", name)
+
+        def started(resp):
+            if self.report_error(resp):
+                self.running.discard(name)
+                self.set_status("Stopped", "red", name)
+                return
+            if resp["addons"]:
+                self.append_text("\nDetected Addons:\n", name)
+                for f in resp["addons"]:
+                    self.append_text(f"  - {f}\n", name)
+            changes = resp["addon_changes"]
+            for kind, sign in (("added", "+"), ("removed", "-"), ("updated", "~")):
+                for label in changes[kind]:
+                    self.append_text(f"  {sign} {label} ({kind} since last start)\n", name)
+
+        self.control.request(
+            "start", started,
+            instance=name,
+            min_ram=cfg["min_ram"],
+            max_ram=cfg["max_ram"],
+            profile=cfg["profile"],
+            auto_restart=self.auto_restart.isChecked(),
         )
-        self.server.start()
 
     def stop_server(self):
-        if self.server:
-            self.set_status("Stopping", "#55aaff")
-            self.server.stop()
+        name = self.current
+        if name in self.running:
+            self.set_status("Stopping", "#55aaff", name)
+            self.control.request("stop", self.report_error, instance=name)
 
     def send_command(self):
-        if self.server:
+        name = self.current
+        if name in self.running:
             text = self.input.text().strip()
             if text:
-                self.server.send(text)
+                self.control.request("command", self.on_command_result, instance=name, text=text)
                 self.input.clear()
 
-    def on_stopped(self, crashed):
-        self.server = None
-        self.set_status("Stopped", "red")
-        if self.exit_after_stop:
+    def on_command_result(self, resp):
+        if self.report_error(resp):
+            return
+        latency = resp["first_output_ms"]
+        answer = f"{len(resp['lines'])} lines, {latency:.0f} ms" if latency is not None else "no output"
+        self.input.setPlaceholderText(f"Last: {resp['command']} → {answer}")
+
+    def on_booting(self, name):
+        if self.statuses[name][0] != "Stopping":
+            self.set_status("Starting", "yellow", name)
+
+    def on_ready(self, name, pattern, duration):
+        self.set_status("Running", "#55ff55", name)
+        self.append_text(f"\n[Server ready in {duration:.1f}s]\n", name)
+
+    def on_crashed(self, name, summary):
+        self.pids[name] = None
+        self.append_text(f"[Crash] {summary}\n", name)
+        self.set_status("Crashed", "#ff8800", name, summary)
+
+    def on_stopped(self, name, crashed):
+        self.running.discard(name)
+        self.pids[name] = None
+        if crashed:
+            text, color, tip = self.statuses[name]
+            self.set_status("Crashed", "#ff8800", name, tip)
+        else:
+            self.set_status("Stopped", "red", name)
+        if self.exit_after_stop and not self.running:
             QTimer.singleShot(500, QApplication.quit)
 
-    # ---------- Addons ----------
+    # ---------- JVM ----------
 
-    def detect_addons(self):
-        found = []
-        for folder in ("plugins", "mods"):
-            path = os.path.join(APP_DIR, folder)
-            if os.path.isdir(path):
-                found += [f"{folder}/{f}" for f in os.listdir(path) if f.endswith((".jar", ".zip"))]
-        if found:
-            self.append_text("\nDetected Addons:\n")
-            for f in found:
-                self.append_text(f"  - {f}\n")
+    def apply_auto_heap(self):
+        profile = PROFILES[self.profile_box.currentText()]
+        heap = auto_heap(
+            (self.min_slider.minimum(), self.min_slider.maximum()),
+            (self.max_slider.minimum(), self.max_slider.maximum()),
+            pretouch=profile["pretouch"],
+        )
+        if not heap:
+            self.append_text("\nAuto heap unavailable (no /proc/meminfo).\n")
+            self.auto_heap.setChecked(False)
+            return
+        self.min_slider.setValue(heap[0])
+        self.max_slider.setValue(heap[1])
+
+    def show_gc_summary(self):
+        files = gc_log_files(self.configs[self.current]["root"])
+        if not files:
+            self.append_text("\nNo GC log found.\n")
+            return
+        self.append_text("\n" + format_gc_summary(summarize_gc_log(files)))
 
     # ---------- Graceful Tray Exit ----------
 
     def tray_exit(self):
-        if self.server:
+        # a daemon keeps its servers; only a launcher hosting its own core stops them
+        if self.core and self.running:
             self.exit_after_stop = True
-            self.stop_server()
+            for name in list(self.running):
+                self.set_status("Stopping", "#55aaff", name)
+                self.control.request("stop", instance=name)
         else:
             QApplication.quit()
 
 # ---------------- MAIN ----------------
 
-app = QApplication(sys.argv)
-win = Launcher()
-win.show()
-sys.exit(app.exec())
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    app = QApplication(argv)
+    mark_startup("app")
+    win = Launcher()
+    win.show()
+    if "--startup-report" in argv:
+        # measure and quit: python hytale_launcher.py --startup-report (with QT_QPA_PLATFORM=offscreen)
+        def report():
+            if "ready" in STARTUP_MARKS:
+                print(json.dumps({k: round(v, 1) for k, v in STARTUP_MARKS.items()}), flush=True)
+                app.quit()
+            else:
+                QTimer.singleShot(50, report)
+        QTimer.singleShot(0, report)
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
 
@@ -0,0 +1,191 @@
+import os
+import json
+import time
+from collections import deque
+
+# ---------- CONFIGURATION ----------
+
+JOURNAL_SUFFIX = ".intent.jsonl"      # append-only edits since the last snapshot
+SNAPSHOT_SUFFIX = ".intent.json"      # compacted state + undo/redo stacks
+JOURNAL_COMPACT_EVERY = 500           # journal lines before folding into the snapshot
+UNDO_LIMIT = 500                      # undo steps kept (oldest dropped first)
+UNDO_COALESCE_S = 1.0                 # same-key edits closer than this undo as one step
+
+
+# ---------- JOURNAL ----------
+
+class IntentJournal:
+    """Desired cosmetics backed by an append-only journal of edits.
+
+    Each edit is one JSON line; every JOURNAL_COMPACT_EVERY lines the state
+    and both stacks are written to a snapshot and the journal is truncated,
+    so recovery reads one snapshot plus a short tail. Undo and redo move a
+    single (key, old, new) step between two stacks and are journaled too; a
+    set_many step (a restore or preset) carries key None and two dicts.
+    """
+
+    def __init__(self, directory, name, compact_every=JOURNAL_COMPACT_EVERY):
+        os.makedirs(directory, exist_ok=True)
+        self.journal_path = os.path.join(directory, name + JOURNAL_SUFFIX)
+        self.snapshot_path = os.path.join(directory, name + SNAPSHOT_SUFFIX)
+        self.compact_every = compact_every
+        self.state = {}
+        self.undo_stack = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack = deque(maxlen=UNDO_LIMIT)
+        self.seq = 0            # last edit applied
+        self.tail = 0           # journal lines since the snapshot
+        self.recovered = self.recover()
+        self.file = open(self.journal_path, "a", encoding="utf-8")
+
+    # ----- recovery -----
+    def recover(self):
+        """Load the snapshot, then replay newer journal lines; returns edits replayed."""
+        if os.path.isfile(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    snap = json.load(f)
+                self.state = snap["state"]
+                self.undo_stack.extend(tuple(s) for s in snap["undo"])
+                self.redo_stack.extend(tuple(s) for s in snap["redo"])
+                self.seq = snap["seq"]
+            except (OSError, ValueError, KeyError):
+                self.state = {}
+                self.undo_stack.clear()
+                self.redo_stack.clear()
+                self.seq = 0
+
+        replayed = 0
+        good = 0
+        if os.path.isfile(self.journal_path):
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break           # torn last line from a crash mid-append
+                    good += len(line)
+                    self.tail += 1
+                    if entry["seq"] <= self.seq:
+                        continue        # already in the snapshot (crash before truncate)
+                    self.apply(entry)
+                    replayed += 1
+            if good != os.path.getsize(self.journal_path):
+                os.truncate(self.journal_path, good)
+        return replayed
+
+    # ----- edits -----
+    def apply(self, entry):
+        """Apply one journal entry to the in-memory state and stacks."""
+        op = entry["op"]
+        self.seq = entry["seq"]
+        if op == "seed":
+            # defaults for keys without intent yet; not an undoable edit
+            for key, value in entry["values"].items():
+                self.state.setdefault(key, value)
+            return []
+        if op == "set":
+            key, new, t = entry["key"], entry["new"], entry["t"]
+            old = self.state.get(key)
+            self.state[key] = new
+            top = self.undo_stack[-1] if self.undo_stack else None
+            if top and top[0] == key and t - top[3] < UNDO_COALESCE_S and not self.redo_stack:
+                self.undo_stack[-1] = (key, top[1], new, t)
+            else:
+                self.undo_stack.append((key, old, new, t))
+            self.redo_stack.clear()
+            return [key]
+        if op == "set_many":
+            # one undo step for several keys: (None, {key: old}, {key: new}, t);
+            # a new value of None unpins the key
+            new = entry["new"]
+            old = {key: self.state.get(key) for key in new}
+            for key, value in new.items():
+                self.restore(key, value)
+            self.undo_stack.append((None, old, new, entry["t"]))
+            self.redo_stack.clear()
+            return list(new)
+        if op == "undo":
+            key, old, new, t = self.undo_stack.pop()
+            if key is None:
+                for k, value in old.items():
+                    self.restore(k, value)
+            else:
+                self.restore(key, old)
+            self.redo_stack.append((key, old, new, t))
+            return list(old) if key is None else [key]
+        if op == "redo":
+            key, old, new, t = self.redo_stack.pop()
+            if key is None:
+                for k, value in new.items():
+                    self.restore(k, value)
+            else:
+                self.state[key] = new
+            self.undo_stack.append((key, old, new, t))
+            return list(new) if key is None else [key]
+        raise ValueError(f"unknown journal op {op!r}")
+
+    def restore(self, key, value):
+        if value is None:
+            self.state.pop(key, None)
+        else:
+            self.state[key] = value
+
+    def append(self, op, **fields):
+        entry = {"seq": self.seq + 1, "op": op, **fields}
+        keys = self.apply(entry)
+        # one small write per edit; fsync is left to compaction and close
+        self.file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.file.flush()
+        self.tail += 1
+        if self.tail >= self.compact_every:
+            self.compact()
+        return keys
+
+    def set(self, key, value):
+        if self.state.get(key) == value:
+            return []
+        return self.append("set", key=key, new=value, t=time.time())
+
+    def set_many(self, values):
+        """Several keys as one undo step (None unpins); returns the keys that changed."""
+        values = {k: v for k, v in values.items() if self.state.get(k) != v}
+        if not values:
+            return []
+        return self.append("set_many", new=values, t=time.time())
+
+    def seed(self, values):
+        """Journal starting values for keys that have no intent yet."""
+        values = {k: v for k, v in values.items() if k not in self.state}
+        if values:
+            self.append("seed", values=values)
+
+    def undo(self):
+        """Undo the last step; returns the keys it touched."""
+        return self.append("undo") if self.undo_stack else []
+
+    def redo(self):
+        return self.append("redo") if self.redo_stack else []
+
+    # ----- compaction -----
+    def compact(self):
+        """Fold the journal into the snapshot and start an empty journal."""
+        snap = {
+            "seq": self.seq,
+            "state": self.state,
+            "undo": list(self.undo_stack),
+            "redo": list(self.redo_stack),
+        }
+        tmp = self.snapshot_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snap, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        self.file.close()
+        self.file = open(self.journal_path, "w", encoding="utf-8")
+        self.tail = 0
+
+    def close(self):
+        if self.tail:
+            self.compact()
+        self.file.close()
@@ -4,15 +4,25 @@ import json
 import re
 import time
 from pathlib import Path
-from collections import defaultdict, deque
-from PyQt6.QtGui import QColor, QBrush
+from types import MappingProxyType
+from collections import deque
+from PyQt6.QtGui import QColor, QBrush, QKeySequence, QShortcut
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QTableWidget, QTableWidgetItem, QComboBox,
-    QPushButton, QLabel, QListView, QHeaderView, QCheckBox
+    QPushButton, QLabel, QListView, QHeaderView, QCheckBox,
+    QDialog, QListWidget, QListWidgetItem, QPlainTextEdit, QAbstractItemView,
+    QLineEdit, QInputDialog
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, QObject, QStringListModel, pyqtSignal
+
+from intent_journal import IntentJournal
+from skin_history import SkinHistory
+from outfit_presets import PresetLibrary
+from conflict_stats import ConflictStats, load_heatmap_config
+from editor_profiling import profiler_from_argv
+from reconcile_core import ReconcileCore
 
 #      ▄████  ██▓     ██▓▄▄▄█████▓▒██   ██▒ ██░ ██ 
 #     ██▒ ▀█▒▓██▒    ▓██▒▓  ██▒ ▓▒▒▒ █ █ ▒░▓██░ ██▒
@@ -26,15 +36,30 @@ from PyQt6.QtCore import Qt, QTimer
 #   
 
 # ===================== CONFIG =====================
-CACHED_SKINS_DIR = Path(
+CACHED_SKINS_DIR = Path(os.environ.get(
+    "HYTALE_SKINS_DIR",     # e.g. a folder skin_trace.py replay-dir writes into
     r"D:\Hytale\install\release\package\game\latest\Client\UserData\CachedPlayerSkins"
-)
+))
 
 # Cooldown behavior
 WRITE_QUIET_MS = 600          # how long the file must be quiet before we reconcile
-RECONCILE_DELAY_MS = 80       # small delay after detecting overwrite
+RECONCILE_DELAY_MS = 80       # small delay after detecting overwrite (sim_reconcile.py tunes both)
 HEATMAP_WINDOW = 10           # number of recent checks to consider
 HEATMAP_ESCALATE = (3, 6)     # amber at >=3, red at >=6 conflicts in window
+HEATMAP_RATE_ESCALATE = None  # e.g. (2, 10): amber/red at conflicts per hour over all history
+IO_LATENCY_HISTORY = 200      # worker round-trips kept for the I/O latency label
+
+# Pinned choices survive crashes in a journal per skin file (see intent_journal.py)
+INTENT_DIR = Path(__file__).resolve().parent / "editor_state"
+# Every distinct version of each skin file, deduplicated (see skin_history.py)
+HISTORY_DIR = INTENT_DIR / "history"
+# Conflict time series; heatmap.json in here overrides the HEATMAP_* settings
+CONFLICTS_DIR = INTENT_DIR / "conflicts"
+
+# External catalog ({key: [values]}, written by json_parser.py); replaces the
+# built-in ALLOWED_KEY_VALUES below while the editor runs, whenever it changes
+CATALOG_FILE = Path(os.environ.get("HYTALE_CATALOG", Path(__file__).resolve().parent / "allowed_cosmetics.json"))
+CATALOG_POLL_MS = 1000
 
 # Allowed cosmetic keys & values (schema-safe gate)
 ALLOWED_KEY_VALUES = {
@@ -33122,53 +33147,326 @@ def atomic_write(path: Path, data: dict):
         json.dump(data, f, indent=4)
     tmp.replace(path)
 
+def load_catalog(path):
+    data = load_json(path)
+    if not isinstance(data, dict) or not all(isinstance(v, list) for v in data.values()):
+        raise ValueError(f"{path.name}: expected {{key: [values]}}")
+    return {key: frozenset(map(str, values)) for key, values in data.items()}
+
 def newest_skin_file():
     files = list(CACHED_SKINS_DIR.glob("*.json"))
     if not files:
         raise FileNotFoundError("No CachedPlayerSkins JSON files found.")
     return max(files, key=lambda p: p.stat().st_mtime)
 
+# ===================== I/O WORKER =====================
+class SkinSnapshot:
+    """Read-only view of the skin file as the worker last saw it."""
+    __slots__ = ("op", "path", "data", "mtime", "queued_ms", "io_ms", "posted_at")
+
+    def __init__(self, op, path, data, mtime, queued_ms, io_ms):
+        self.op = op
+        self.path = path
+        self.data = MappingProxyType(data)
+        self.mtime = mtime
+        self.queued_ms = queued_ms
+        self.io_ms = io_ms
+        self.posted_at = time.perf_counter()
+
+
+class CatalogUpdate:
+    """A complete replacement catalog plus what changed, prepared off the UI thread."""
+    __slots__ = ("catalog", "previous", "sorted", "changed", "removed", "initial")
+
+    def __init__(self, catalog, previous, sorted_values, changed, removed, initial=False):
+        self.catalog = catalog
+        self.previous = previous
+        self.sorted = sorted_values     # key -> sort_human(values), every key
+        self.changed = changed
+        self.removed = removed
+        self.initial = initial          # the first catalog of this run (previous is empty)
+
+
+class SkinIOWorker(QObject):
+    """Owns every stat/read/write of the skin file, on its own QThread.
+
+    Requests arrive as queued signals carrying the time they were made, and
+    results go back as SkinSnapshot objects, so the UI never touches the disk.
+    """
+    snapshot = pyqtSignal(object)          # SkinSnapshot: loaded / external / reloaded / written
+    done = pyqtSignal(str, float, float)   # op, queue wait ms, disk time ms (every request)
+    failed = pyqtSignal(str, str)          # op, message
+    catalog_ready = pyqtSignal(object)     # CatalogUpdate
+    diff_ready = pyqtSignal(str, str, object)  # old, new, [(key, a, b)] or an error message
+
+    def __init__(self):
+        super().__init__()
+        self.path = None
+        self.mtime = None
+        self.history = None
+        self.catalog = None
+        self.catalog_stamp = False      # never checked; None = no file, built-in table
+        self.sorted = {}                # key -> sort_human(values) for the current catalog
+        self.conflicts = None           # ConflictStats; recorded on the UI thread, flushed here
+
+    def finish(self, op, requested_at, started):
+        now = time.perf_counter()
+        self.done.emit(op, (started - requested_at) * 1000.0, (now - started) * 1000.0)
+
+    def post(self, op, data, requested_at, started):
+        if self.history is not None:
+            try:
+                self.history.record(data, op)
+            except OSError as e:
+                self.failed.emit("history", str(e))
+        now = time.perf_counter()
+        self.snapshot.emit(SkinSnapshot(
+            op, self.path, data, self.mtime,
+            (started - requested_at) * 1000.0, (now - started) * 1000.0,
+        ))
+
+    def open(self):
+        started = time.perf_counter()
+        # the first catalog (with its sorted lists) reaches the UI before the skin does
+        self.check_catalog(started)
+        try:
+            if not CACHED_SKINS_DIR.exists():
+                raise FileNotFoundError(CACHED_SKINS_DIR)
+            self.path = newest_skin_file()
+            self.mtime = self.path.stat().st_mtime
+            data = load_json(self.path)
+        except (OSError, ValueError) as e:
+            self.failed.emit("open", str(e))
+            return
+        try:
+            self.history = SkinHistory(str(HISTORY_DIR / self.path.stem))
+        except OSError as e:
+            self.failed.emit("history", str(e))
+        self.post("loaded", data, started, started)
+
+    def poll(self, requested_at):
+        started = time.perf_counter()
+        if self.path is not None:
+            try:
+                mtime = self.path.stat().st_mtime
+                if mtime != self.mtime:
+                    data = load_json(self.path)
+                    # only now: a half-written file is simply read again next poll
+                    self.mtime = mtime
+                    self.post("external", data, requested_at, started)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                self.failed.emit("poll", str(e))
+        self.finish("poll", requested_at, started)
+
+    def reload(self, requested_at):
+        started = time.perf_counter()
+        if self.path is not None:
+            try:
+                mtime = self.path.stat().st_mtime
+                data = load_json(self.path)
+                self.mtime = mtime
+                self.post("reloaded", data, requested_at, started)
+            except (OSError, ValueError) as e:
+                self.failed.emit("reload", str(e))
+        self.finish("reload", requested_at, started)
+
+    def write(self, data, requested_at):
+        started = time.perf_counter()
+        if self.path is not None:
+            try:
+                atomic_write(self.path, data)
+                self.mtime = self.path.stat().st_mtime
+                self.post("written", data, requested_at, started)
+            except OSError as e:
+                self.failed.emit("write", str(e))
+        self.finish("write", requested_at, started)
+
+    def check_catalog(self, requested_at):
+        started = time.perf_counter()
+        first = self.catalog is None
+        if first:
+            self.catalog = MappingProxyType({})     # every key counts as changed on the first pass
+        try:
+            st = CATALOG_FILE.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stamp = None                # no file (any more): the built-in table
+        except OSError as e:
+            self.failed.emit("catalog", str(e))
+            stamp = None if first else self.catalog_stamp
+        if stamp != self.catalog_stamp:
+            # a half-written file fails to parse, then changes stamp again when complete
+            self.catalog_stamp = stamp
+            try:
+                if stamp is None:
+                    new = {k: frozenset(v) for k, v in ALLOWED_KEY_VALUES.items()}
+                else:
+                    new = load_catalog(CATALOG_FILE)
+            except (OSError, ValueError) as e:
+                self.failed.emit("catalog", str(e))
+                if first:
+                    self.swap_catalog({k: frozenset(v) for k, v in ALLOWED_KEY_VALUES.items()}, True)
+            else:
+                self.swap_catalog(new, first)
+        self.finish("catalog", requested_at, started)
+
+    def swap_catalog(self, new, initial=False):
+        old = self.catalog
+        changed = [k for k, values in new.items() if old.get(k) != values]
+        removed = [k for k in old if k not in new]
+        if not changed and not removed:
+            return
+        self.catalog = MappingProxyType(new)
+        # sorting the largest keys is the slow part; do it here, not in the UI
+        self.sorted = {**{k: v for k, v in self.sorted.items() if k in new},
+                       **{k: sort_human(new[k]) for k in changed}}
+        self.catalog_ready.emit(CatalogUpdate(self.catalog, old, dict(self.sorted), changed, removed, initial))
+
+    def diff(self, old, new, requested_at):
+        # the history cache is only ever touched on this thread
+        started = time.perf_counter()
+        if self.history is not None:
+            try:
+                changes = self.history.diff(old, new)
+            except (OSError, ValueError, KeyError) as e:
+                changes = str(e)
+            self.diff_ready.emit(old, new, changes)
+        self.finish("diff", requested_at, started)
+
+    def flush_conflicts(self, requested_at):
+        started = time.perf_counter()
+        if self.conflicts is not None:
+            try:
+                self.conflicts.flush()
+            except OSError as e:
+                self.failed.emit("conflicts", str(e))
+        self.finish("conflicts", requested_at, started)
+
+    def restore(self, digest, requested_at):
+        started = time.perf_counter()
+        if self.path is not None and self.history is not None:
+            try:
+                data = self.history.load(digest)
+                atomic_write(self.path, data)
+                self.mtime = self.path.stat().st_mtime
+                self.post("restored", data, requested_at, started)
+            except (OSError, ValueError) as e:
+                self.failed.emit("restore", str(e))
+        self.finish("restore", requested_at, started)
+
 # ===================== GUI =====================
 class CachedSkinEditor(QWidget):
+    # UI -> worker; queued across threads, each stamped with time.perf_counter()
+    io_poll = pyqtSignal(float)
+    io_reload = pyqtSignal(float)
+    io_write = pyqtSignal(object, float)
+    io_restore = pyqtSignal(str, float)
+    io_diff = pyqtSignal(str, str, float)
+    io_conflicts = pyqtSignal(float)
+    io_catalog = pyqtSignal(float)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Hytale Cached Skin Editor (Cooldown + Heatmap)")
         self.resize(980, 640)
 
-        if not CACHED_SKINS_DIR.exists():
-            raise FileNotFoundError(CACHED_SKINS_DIR)
+        self.skin_path = None
+        self.skin_data = MappingProxyType({})
 
-        self.skin_path = newest_skin_file()
-        self.skin_data = load_json(self.skin_path)
-        self.last_mtime = self.skin_path.stat().st_mtime
+        # Schema-safe gate; swapped whole when CATALOG_FILE changes. The worker
+        # posts the first one (built-in or external) before the skin arrives.
+        self.catalog = ALLOWED_KEY_VALUES
+        self.sorted_values = {}     # key -> combo items, sorted on the worker
 
-        # Desired intent (authoritative cosmetic state)
-        self.desired_cosmetics = {}
+        # Cooldown tracking and desired intent (authoritative cosmetic state), Qt-free
+        self.core = ReconcileCore(self.catalog, WRITE_QUIET_MS, RECONCILE_DELAY_MS, time.time())
 
-        # Cooldown tracking
-        self.last_write_seen_at = time.time()
-        self.reconcile_scheduled = False
+        # desired_cosmetics is journaled once the skin is known
+        self.journal = None
+        self.rows = {}
+
+        # Named outfits, indexed by key/value (editor_state/presets.json)
+        self.presets = PresetLibrary(str(INTENT_DIR))
 
         # Conflict heatmap tracking per key (rolling window)
-        self.conflict_history = defaultdict(lambda: deque(maxlen=HEATMAP_WINDOW))
+        self.conflicts = ConflictStats(str(CONFLICTS_DIR), load_heatmap_config(str(CONFLICTS_DIR), {
+            "window": HEATMAP_WINDOW,
+            "window_escalate": HEATMAP_ESCALATE,
+            "rate_escalate": HEATMAP_RATE_ESCALATE,
+        }))
 
         self.auto_apply = False
 
+        # Worker round-trips, ms: (queue wait, disk time) per request, delivery per snapshot
+        self.io_pending = set()
+        self.io_latency = deque(maxlen=IO_LATENCY_HISTORY)
+        self.io_delivery = deque(maxlen=IO_LATENCY_HISTORY)
+
         self.setup_ui()
-        self.populate_table()
+        self.start_io_worker()
+        if self.conflicts.orphaned:
+            self.status_lbl.setText("Conflict names were lost; old conflict log set aside")
+            self.status_lbl.setToolTip(self.conflicts.orphaned)
 
         # Poller for external changes
         self.timer = QTimer()
         self.timer.timeout.connect(self.poll_file)
         self.timer.start(200)  # frequent polling; cooldown prevents thrash
 
+        self.catalog_timer = QTimer()
+        self.catalog_timer.timeout.connect(self.poll_catalog)
+        self.catalog_timer.start(CATALOG_POLL_MS)
+
+    @property
+    def desired_cosmetics(self):
+        return self.core.desired
+
+    @desired_cosmetics.setter
+    def desired_cosmetics(self, value):
+        self.core.desired = value
+
+    def start_io_worker(self):
+        self.io_thread = QThread(self)
+        self.io_worker = SkinIOWorker()
+        self.io_worker.conflicts = self.conflicts
+        self.io_worker.moveToThread(self.io_thread)
+
+        self.io_poll.connect(self.io_worker.poll)
+        self.io_reload.connect(self.io_worker.reload)
+        self.io_write.connect(self.io_worker.write)
+        self.io_restore.connect(self.io_worker.restore)
+        self.io_diff.connect(self.io_worker.diff)
+        self.io_conflicts.connect(self.io_worker.flush_conflicts)
+        self.io_catalog.connect(self.io_worker.check_catalog)
+        self.io_worker.snapshot.connect(self.on_snapshot)
+        self.io_worker.done.connect(self.on_io_done)
+        self.io_worker.failed.connect(self.on_io_failed)
+        self.io_worker.catalog_ready.connect(self.on_catalog)
+        self.io_thread.started.connect(self.io_worker.open)
+        self.io_thread.finished.connect(self.io_worker.deleteLater)
+
+        self.io_pending.add("open")
+        self.io_thread.start()
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.catalog_timer.stop()
+        self.io_thread.quit()
+        self.io_thread.wait()
+        if self.journal is not None:
+            self.journal.close()
+        self.conflicts.close()
+        super().closeEvent(event)
+
     # ---------------- UI ----------------
     def setup_ui(self):
         layout = QVBoxLayout()
 
-        header = QLabel(f"Editing newest cache: {self.skin_path.name}")
-        header.setStyleSheet("font-weight: bold;")
-        layout.addWidget(header)
+        self.header = QLabel("Loading newest cache…")
+        self.header.setStyleSheet("font-weight: bold;")
+        layout.addWidget(self.header)
 
         opts = QHBoxLayout()
         self.auto_apply_chk = QCheckBox("Live apply (intent captured immediately)")
@@ -33177,10 +33475,30 @@ class CachedSkinEditor(QWidget):
         )
         opts.addWidget(self.auto_apply_chk)
 
+        self.io_lbl = QLabel("")
+        self.io_lbl.setStyleSheet("color: gray;")
+        opts.addWidget(self.io_lbl)
+
         self.status_lbl = QLabel("Idle")
         opts.addWidget(self.status_lbl, 1, Qt.AlignmentFlag.AlignRight)
         layout.addLayout(opts)
 
+        presets = QHBoxLayout()
+        presets.addWidget(QLabel("Preset:"))
+        self.preset_combo = QComboBox()
+        self.preset_combo.setMinimumWidth(260)
+        presets.addWidget(self.preset_combo, 1)
+        self.preset_filter = QLineEdit()
+        self.preset_filter.setPlaceholderText("Only presets using value…")
+        self.preset_filter.textChanged.connect(self.refresh_presets)
+        presets.addWidget(self.preset_filter, 1)
+        for text, slot in (("Apply", self.apply_preset), ("Save Current As…", self.save_preset),
+                           ("Delete", self.delete_preset)):
+            btn = QPushButton(text)
+            btn.clicked.connect(slot)
+            presets.addWidget(btn)
+        layout.addLayout(presets)
+
         self.table = QTableWidget(0, 2)
         self.table.setHorizontalHeaderLabels(["Key", "Value"])
         self.table.horizontalHeader().setStretchLastSection(True)
@@ -33195,17 +33513,34 @@ class CachedSkinEditor(QWidget):
         save.clicked.connect(self.request_reconcile)
         reload_btn = QPushButton("Reload From Disk")
         reload_btn.clicked.connect(self.reload_from_disk)
+        self.undo_btn = QPushButton("Undo")
+        self.undo_btn.clicked.connect(self.undo_intent)
+        self.redo_btn = QPushButton("Redo")
+        self.redo_btn.clicked.connect(self.redo_intent)
         btns.addWidget(save)
         btns.addWidget(reload_btn)
+        history_btn = QPushButton("History…")
+        history_btn.clicked.connect(self.show_history)
+        btns.addWidget(self.undo_btn)
+        btns.addWidget(self.redo_btn)
+        btns.addWidget(history_btn)
         layout.addLayout(btns)
 
+        self.refresh_presets()
+
+        QShortcut(QKeySequence.StandardKey.Undo, self).activated.connect(self.undo_intent)
+        QShortcut(QKeySequence.StandardKey.Redo, self).activated.connect(self.redo_intent)
+        self.update_undo_buttons()
+
         self.setLayout(layout)
 
     # ---------------- Table ----------------
     def populate_table(self):
         self.table.setRowCount(0)
+        self.rows = {}
+        defaults = {}
 
-        for key, allowed in ALLOWED_KEY_VALUES.items():
+        for key, allowed in self.catalog.items():
             if key not in self.skin_data:
                 continue
 
@@ -33218,122 +33553,361 @@ class CachedSkinEditor(QWidget):
 
             combo = QComboBox()
             combo.setView(QListView())
-            combo.addItems(sort_human(allowed))
+            values = self.sorted_values.get(key)
+            combo.setModel(QStringListModel(values if values is not None else sort_human(allowed), combo))
 
             current = self.skin_data.get(key)
             if current in allowed:
                 combo.setCurrentText(current)
 
-            combo.currentTextChanged.connect(self.on_value_changed)
+            combo.currentTextChanged.connect(lambda text, key=key: self.on_value_changed(key, text))
             self.table.setCellWidget(row, 1, combo)
+            self.rows[key] = row
 
             # initialize desired intent from disk on first load
-            self.desired_cosmetics.setdefault(key, combo.currentText())
+            if key not in self.desired_cosmetics:
+                defaults[key] = combo.currentText()
 
+        if self.journal is not None:
+            self.journal.seed(defaults)
+        else:
+            self.desired_cosmetics.update(defaults)
         self.update_heatmap_styles()
 
     # ---------------- Intent & Merge ----------------
-    def on_value_changed(self):
+    def on_value_changed(self, key, value):
         # Capture intent only for keys present and allowed
-        for row in range(self.table.rowCount()):
-            key = self.table.item(row, 0).text()
-            combo = self.table.cellWidget(row, 1)
-            if key in self.skin_data:
-                self.desired_cosmetics[key] = combo.currentText()
+        if key not in self.skin_data:
+            return
+        if self.journal is not None:
+            self.journal.set(key, value)
+        else:
+            self.desired_cosmetics[key] = value
+        self.update_undo_buttons()
 
         if self.auto_apply:
             self.request_reconcile()
 
-    def collect_schema_safe_merge(self, base: dict):
-        merged = dict(base)
-        for key, val in self.desired_cosmetics.items():
-            if key in merged and key in ALLOWED_KEY_VALUES:
-                # Only overwrite if the value is allowed for that key
-                if val in ALLOWED_KEY_VALUES[key]:
-                    merged[key] = val
-        return merged
+    def set_intent(self, values):
+        """Pin several keys as one undo step (a restore or a preset; None unpins);
+        returns the keys changed."""
+        values = {k: v for k, v in values.items() if k in self.skin_data or v is None}
+        if self.journal is not None:
+            keys = self.journal.set_many(values)
+        else:
+            keys = [k for k, v in values.items() if self.desired_cosmetics.get(k) != v]
+            for key in keys:
+                if values[key] is None:
+                    self.desired_cosmetics.pop(key, None)
+                else:
+                    self.desired_cosmetics[key] = values[key]
+        self.update_undo_buttons()
+        return keys
+
+    # ---------------- Journal & Undo ----------------
+    def open_journal(self, skin_path):
+        try:
+            self.journal = IntentJournal(INTENT_DIR, skin_path.stem)
+        except OSError as e:
+            self.status_lbl.setText(f"Intent journal unavailable: {e}")
+            return
+        self.desired_cosmetics = self.journal.state
+
+    def undo_intent(self):
+        if self.journal is not None:
+            self.show_intent(*self.journal.undo())
+
+    def redo_intent(self):
+        if self.journal is not None:
+            self.show_intent(*self.journal.redo())
+
+    def show_intent(self, *keys):
+        """Put the combos for `keys` back in step with the journal without re-journaling."""
+        shown = [key for key in keys if key in self.rows]
+        for key in shown:
+            combo = self.table.cellWidget(self.rows[key], 1)
+            combo.blockSignals(True)
+            combo.setCurrentText(self.desired_cosmetics.get(key, self.skin_data.get(key)))
+            combo.blockSignals(False)
+        if shown and self.auto_apply:
+            self.request_reconcile()
+        self.update_undo_buttons()
+
+    def update_undo_buttons(self):
+        journal = self.journal
+        self.undo_btn.setEnabled(journal is not None and bool(journal.undo_stack))
+        self.redo_btn.setEnabled(journal is not None and bool(journal.redo_stack))
 
     # ---------------- Cooldown & Reconcile ----------------
     def request_reconcile(self):
         # Schedule reconcile respecting cooldown
-        self.reconcile_scheduled = True
+        self.core.request()
         self.status_lbl.setText("Reconcile requested (waiting for quiet period)")
 
     def maybe_reconcile_after_cooldown(self):
-        now = time.time()
-        quiet_for_ms = (now - self.last_write_seen_at) * 1000.0
-        if self.reconcile_scheduled and quiet_for_ms >= WRITE_QUIET_MS:
-            self.reconcile_scheduled = False
+        if self.core.due(time.time()):
             QTimer.singleShot(RECONCILE_DELAY_MS, self.reconcile_now)
 
     def reconcile_now(self):
-        merged = self.collect_schema_safe_merge(self.skin_data)
-        atomic_write(self.skin_path, merged)
-        self.skin_data = merged
-        self.last_mtime = self.skin_path.stat().st_mtime
-        self.last_write_seen_at = time.time()
-        self.status_lbl.setText("Reconciled to disk")
-        self.update_heatmap_styles()
+        if self.skin_path is None or "write" in self.io_pending:
+            # a write is still queued; the cooldown will schedule another pass
+            self.core.request()
+            return
+        merged = self.core.merge(self.skin_data)
+        self.io_pending.add("write")
+        self.io_write.emit(merged, time.perf_counter())
+        self.status_lbl.setText("Writing…")
 
     # ---------------- External Changes ----------------
     def poll_file(self):
+        # the stat/read happens on the worker; skip a tick while one is in flight
+        if "poll" not in self.io_pending and self.skin_path is not None:
+            self.io_pending.add("poll")
+            self.io_poll.emit(time.perf_counter())
+
+        # Attempt reconcile if quiet long enough
+        self.maybe_reconcile_after_cooldown()
+
+    def on_external_change(self, disk):
+        # Game (or something else) wrote the file; conflicts schedule a reconcile
+        conflicts = self.core.external_write(disk, time.time())
+
+        # Record conflict history; the worker appends it to disk
+        self.conflicts.record(self.skin_path.name, self.desired_cosmetics.keys(), set(conflicts))
+        self.io_conflicts.emit(time.perf_counter())
+
+        self.skin_data = disk
+        self.populate_table()
+
+        if conflicts:
+            self.status_lbl.setText(
+                f"Detected overwrite ({len(conflicts)} conflicts) – waiting cooldown"
+            )
+            self.request_reconcile()
+        else:
+            self.status_lbl.setText("External write detected (no conflicts)")
+
+    def reload_from_disk(self):
+        if "reload" not in self.io_pending:
+            self.io_pending.add("reload")
+            self.io_reload.emit(time.perf_counter())
+
+    # ---------------- Catalog ----------------
+    def poll_catalog(self):
+        if "catalog" not in self.io_pending:
+            self.io_pending.add("catalog")
+            self.io_catalog.emit(time.perf_counter())
+
+    def on_catalog(self, update):
+        """Swap in a new catalog: one assignment, then only the affected rows."""
+        self.catalog = update.catalog
+        self.core.allowed = update.catalog
+        self.sorted_values = update.sorted
+
+        rows_change = any(k in self.rows for k in update.removed) or any(
+            k not in self.rows and k in self.skin_data for k in update.changed
+        )
+        if rows_change:
+            # every combo gets a model over the worker's pre-sorted list
+            self.populate_table()
+        else:
+            for key in update.changed:
+                if key in self.rows:
+                    self.rebuild_combo(key, update.sorted[key])
+
+        if update.initial:
+            # the first catalog: check presets against it, not the built-in table
+            self.report_invalid_presets()
+            self.update_heatmap_styles()
+            return
+
+        # Revalidate intent in one pass (one undo step): pins the catalog dropped fall
+        # back to the file's value, or are unpinned when that is not allowed either
+        fallback = {}
+        unpinned = []
+        for key, value in self.desired_cosmetics.items():
+            allowed = self.catalog.get(key, ())
+            if value in allowed:
+                continue
+            if self.skin_data.get(key) in allowed:
+                fallback[key] = self.skin_data[key]
+            else:
+                fallback[key] = None
+                unpinned.append(key)
+        self.show_intent(*self.set_intent(fallback))
+
+        broken = self.presets.invalidated_by(update.previous, update.catalog)
+        self.status_lbl.setToolTip("")
+        self.report_invalid_presets(broken)
+        if unpinned:
+            tip = self.status_lbl.toolTip()
+            self.status_lbl.setToolTip((tip + "\n" if tip else "") + "Unpinned: " + ", ".join(sorted(unpinned)))
+        self.status_lbl.setText(
+            f"Catalog reloaded: {len(update.changed)} keys changed, {len(update.removed)} removed, "
+            f"{len(fallback) - len(unpinned)} pins reset to the file's value, {len(unpinned)} unpinned, "
+            f"{len(broken)} presets affected"
+            + (" (hover for details)" if broken or unpinned else "")
+        )
+        self.update_heatmap_styles()
+
+    def rebuild_combo(self, key, values):
+        combo = self.table.cellWidget(self.rows[key], 1)
+        combo.blockSignals(True)
+        # one model swap instead of re-adding thousands of items one by one
+        combo.setModel(QStringListModel(values, combo))
+        current = self.desired_cosmetics.get(key, self.skin_data.get(key))
+        if current in self.catalog[key]:
+            combo.setCurrentText(current)
+        combo.blockSignals(False)
+
+    # ---------------- Presets ----------------
+    def refresh_presets(self):
+        value = self.preset_filter.text().strip()
+        names = self.presets.using(value) if value else self.presets.presets
+        current = self.preset_combo.currentText()
+        self.preset_combo.clear()
+        self.preset_combo.addItems(sort_human(names))
+        if current in names:
+            self.preset_combo.setCurrentText(current)
+
+    def report_invalid_presets(self, problems=None):
+        """Status line plus a tooltip listing each broken preset and its bad entries."""
+        if problems is None:
+            problems = self.presets.validate(self.catalog)
+        if self.presets.skipped:
+            self.status_lbl.setText(f"{self.presets.skipped} malformed entries in presets.json skipped")
+        if problems:
+            self.status_lbl.setText(f"{len(problems)} presets use values no longer in the catalog")
+            self.status_lbl.setToolTip("\n".join(
+                f"{name}: " + ", ".join(f"{k}={v}" for k, v in pairs)
+                for name, pairs in sorted(problems.items())
+            ))
+
+    def apply_preset(self):
+        name = self.preset_combo.currentText()
+        outfit = self.presets.presets.get(name)
+        if not outfit:
+            return
+        usable = {k: v for k, v in outfit.items() if k in self.catalog and v in self.catalog[k]}
+        skipped = len(outfit) - len(usable)
+        self.show_intent(*self.set_intent(usable))
+        self.request_reconcile()
+        note = f" ({skipped} entries not in the catalog skipped)" if skipped else ""
+        self.status_lbl.setText(f"Applied preset {name}{note}")
+
+    def save_preset(self):
+        name, ok = QInputDialog.getText(self, "Save Preset", "Preset name:",
+                                        text=self.preset_combo.currentText())
+        name = name.strip()
+        if not ok or not name:
+            return
+        outfit = {key: value for key, value in self.desired_cosmetics.items() if key in self.catalog}
         try:
-            mtime = self.skin_path.stat().st_mtime
-        except FileNotFoundError:
+            self.presets.put(name, outfit)
+        except OSError as e:
+            self.status_lbl.setText(f"Could not save preset: {e}")
             return
+        self.refresh_presets()
+        self.preset_combo.setCurrentText(name)
 
-        if mtime != self.last_mtime:
-            # Game (or something else) wrote the file
-            self.last_mtime = mtime
-            self.last_write_seen_at = time.time()
-            disk = load_json(self.skin_path)
+    def delete_preset(self):
+        name = self.preset_combo.currentText()
+        if not name:
+            return
+        try:
+            self.presets.delete(name)
+        except OSError as e:
+            self.status_lbl.setText(f"Could not delete preset: {e}")
+            return
+        self.refresh_presets()
 
-            # Detect conflicts against desired intent
-            conflicts = []
-            for key, desired in self.desired_cosmetics.items():
-                if key in disk and disk.get(key) != desired:
-                    conflicts.append(key)
+    def show_history(self):
+        history = self.io_worker.history
+        timeline = list(history.timeline) if history is not None else []
+        if not timeline:
+            self.status_lbl.setText("No history recorded yet")
+            return
+        dialog = HistoryDialog(timeline, self)
+        self.io_worker.diff_ready.connect(dialog.on_diff)
+        dialog.exec()
+        self.io_worker.diff_ready.disconnect(dialog.on_diff)
 
-            # Record conflict history
-            for key in self.desired_cosmetics.keys():
-                self.conflict_history[key].append(1 if key in conflicts else 0)
+    def request_diff(self, old, new):
+        self.io_diff.emit(old, new, time.perf_counter())
 
-            self.skin_data = disk
-            self.populate_table()
+    def restore_version(self, digest):
+        if "restore" not in self.io_pending:
+            self.io_pending.add("restore")
+            self.io_restore.emit(digest, time.perf_counter())
 
-            if conflicts:
-                self.status_lbl.setText(
-                    f"Detected overwrite ({len(conflicts)} conflicts) – waiting cooldown"
-                )
+    # ---------------- I/O Results ----------------
+    def on_snapshot(self, snap):
+        self.io_delivery.append((time.perf_counter() - snap.posted_at) * 1000.0)
+        self.skin_path = snap.path
+
+        if snap.op == "loaded":
+            self.io_pending.discard("open")
+            self.header.setText(f"Editing newest cache: {snap.path.name}")
+            self.skin_data = snap.data
+            self.open_journal(snap.path)
+            self.populate_table()
+            self.update_undo_buttons()
+            pinned = [k for k, v in self.desired_cosmetics.items() if k in snap.data and snap.data[k] != v]
+            if pinned:
+                # intent recovered from the journal differs from the file: put it back
                 self.request_reconcile()
-            else:
-                self.status_lbl.setText("External write detected (no conflicts)")
+                self.status_lbl.setText(f"Recovered {len(pinned)} pinned choices from the journal")
+        elif snap.op == "external":
+            self.on_external_change(snap.data)
+        elif snap.op == "reloaded":
+            self.skin_data = snap.data
+            self.populate_table()
+            self.status_lbl.setText("Reloaded from disk")
+        elif snap.op == "restored":
+            self.skin_data = snap.data
+            self.core.seen_write(time.time())
+            # adopt the restored values as intent (one undo step) so reconcile keeps them
+            self.set_intent({k: v for k, v in snap.data.items() if k in self.catalog and v in self.catalog[k]})
+            self.populate_table()
+            self.status_lbl.setText("Restored version from history")
+        elif snap.op == "written":
+            self.skin_data = snap.data
+            self.core.seen_write(time.time())
+            self.status_lbl.setText("Reconciled to disk")
+            self.update_heatmap_styles()
 
-        # Attempt reconcile if quiet long enough
-        self.maybe_reconcile_after_cooldown()
+    def on_io_done(self, op, queued_ms, io_ms):
+        self.io_pending.discard(op)
+        self.io_latency.append((queued_ms, io_ms))
+        self.update_io_label()
 
-    def reload_from_disk(self):
-        self.skin_data = load_json(self.skin_path)
-        self.last_mtime = self.skin_path.stat().st_mtime
-        self.populate_table()
-        self.status_lbl.setText("Reloaded from disk")
+    def on_io_failed(self, op, message):
+        self.io_pending.discard(op)
+        if op == "write":
+            self.core.request()
+        self.status_lbl.setText(f"{op} failed: {message}")
+
+    def update_io_label(self):
+        def p95(values):
+            values = sorted(values)
+            return values[min(len(values) - 1, int(len(values) * 0.95))] if values else 0.0
+
+        self.io_lbl.setText(
+            f"I/O p95: queue {p95(q for q, _ in self.io_latency):.1f} ms · "
+            f"disk {p95(d for _, d in self.io_latency):.1f} ms · "
+            f"delivery {p95(self.io_delivery):.1f} ms"
+        )
 
     # ---------------- Heatmap ----------------
     def update_heatmap_styles(self):
         for row in range(self.table.rowCount()):
-            key = self.table.item(row, 0).text()
-            history = self.conflict_history.get(key)
-            if not history:
-                self.set_row_color(row, None)
-                continue
-
-            count = sum(history)
-            if count >= HEATMAP_ESCALATE[1]:
-                self.set_row_color(row, "red")
-            elif count >= HEATMAP_ESCALATE[0]:
-                self.set_row_color(row, "amber")
-            else:
-                self.set_row_color(row, None)
+            item = self.table.item(row, 0)
+            key = item.text()
+            self.set_row_color(row, self.conflicts.level(key))
+            item.setToolTip(
+                f"{self.conflicts.totals.get(key, 0)} conflicts recorded, "
+                f"{self.conflicts.rate(key):.1f} per hour"
+            )
 
     def set_row_color(self, row, level):
         if level == "red":
@@ -33363,9 +33937,109 @@ class CachedSkinEditor(QWidget):
                 if widget:
                     widget.setStyleSheet(widget_style)
 
+# ===================== HISTORY =====================
+class HistoryDialog(QDialog):
+    """Timeline of stored versions: diff any two, restore any one.
+
+    Diffs are computed by the I/O worker, which owns the history store, and
+    arrive in on_diff; only the answer to the current selection is shown.
+    """
+
+    def __init__(self, timeline, editor):
+        super().__init__(editor)
+        self.setWindowTitle("Skin History")
+        self.resize(760, 520)
+        self.editor = editor
+        self.wanted = None
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Select one version to diff it against the one before, or two to compare them."))
+
+        self.list = QListWidget()
+        self.list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.timeline = timeline
+        for i in range(len(timeline) - 1, -1, -1):
+            entry = timeline[i]
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["t"]))
+            item = QListWidgetItem(f"#{i + 1}  {stamp}  {entry['source']:<9}  {entry['hash'][:12]}")
+            item.setData(Qt.ItemDataRole.UserRole, i)
+            self.list.addItem(item)
+        self.list.itemSelectionChanged.connect(self.show_diff)
+        layout.addWidget(self.list)
+
+        self.diff_view = QPlainTextEdit()
+        self.diff_view.setReadOnly(True)
+        layout.addWidget(self.diff_view)
+
+        btns = QHBoxLayout()
+        restore = QPushButton("Restore Selected")
+        restore.clicked.connect(self.restore)
+        close = QPushButton("Close")
+        close.clicked.connect(self.reject)
+        btns.addWidget(restore)
+        btns.addWidget(close)
+        layout.addLayout(btns)
+        self.setLayout(layout)
+
+    def selected(self):
+        return sorted(item.data(Qt.ItemDataRole.UserRole) for item in self.list.selectedItems())
+
+    def show_diff(self):
+        picked = self.selected()
+        if not picked:
+            self.diff_view.clear()
+            return
+        new = picked[-1]
+        old = picked[0] if len(picked) > 1 else new - 1
+        if old < 0:
+            self.wanted = None
+            self.diff_view.setPlainText("First recorded version.")
+            return
+        self.wanted = (old, new)
+        self.diff_view.setPlainText("Reading versions…")
+        self.editor.request_diff(self.timeline[old]["hash"], self.timeline[new]["hash"])
+
+    def on_diff(self, old_hash, new_hash, changes):
+        if self.wanted is None:
+            return
+        old, new = self.wanted
+        if (self.timeline[old]["hash"], self.timeline[new]["hash"]) != (old_hash, new_hash):
+            return          # an answer for an earlier selection
+        if isinstance(changes, str):
+            self.diff_view.setPlainText(f"Could not read version: {changes}")
+            return
+        lines = [f"#{old + 1} -> #{new + 1}: {len(changes)} changed keys", ""]
+        for key, a, b in changes:
+            lines.append(f"{key}: {a if a is not None else '(missing)'} -> {b if b is not None else '(missing)'}")
+        self.diff_view.setPlainText("\n".join(lines))
+
+    def restore(self):
+        picked = self.selected()
+        if len(picked) == 1:
+            self.editor.restore_version(self.timeline[picked[0]]["hash"])
+            self.accept()
+
 # ===================== RUN =====================
+# Hot paths timed by --profile / HYTALE_EDITOR_PROFILE; untouched otherwise
+PROFILED_FUNCTIONS = ("load_json", "atomic_write", "sort_human", "newest_skin_file")
+PROFILED_METHODS = {
+    SkinIOWorker: ("poll", "reload", "write"),
+    CachedSkinEditor: ("populate_table", "update_heatmap_styles", "on_snapshot", "on_external_change"),
+    ReconcileCore: ("merge", "conflicts"),
+}
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    profiler, argv = profiler_from_argv(sys.argv)
+    if profiler:
+        profiler.instrument(globals(), PROFILED_FUNCTIONS)
+        for cls, names in PROFILED_METHODS.items():
+            profiler.instrument(cls, names)
+
+    app = QApplication(argv)
     w = CachedSkinEditor()
     w.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    if profiler:
+        profiler.stop()
+        print(profiler.report(), end="")
+    sys.exit(code)
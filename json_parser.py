@@ -1,3 +1,5 @@
+import os
+import ast
 import json
 from pathlib import Path
 import re
@@ -6,6 +8,7 @@ import re
 
 BODY_CHARACTERISTIC_RANGE = range(1, 47)  # 1–46 inclusive
 OUTPUT_FILE = "AllowedKeyValues.txt"
+CATALOG_JSON_FILE = "allowed_cosmetics.json"  # hot-reloaded by the editors
 
 HAIR_COLOR_FILE = "HairColors.json"
 GENERIC_COLOR_FILE = "GenericColors.json"
@@ -80,6 +83,25 @@ def sort_human_readable(values):
     return sorted(values, key=alphanum_key)
 
 
+def respects_restrictions(key, value):
+    """Check a formatted value ("Base.Color.Variant") against the kneepad and
+    earring metal-color rules used by generate_allowed_key_values."""
+    if key in IGNORE_COLOR_KEYS or key == "bodyCharacteristic":
+        return True
+    restricted = KNEEPADS_REGEX.search(value) or (
+        key == "earAccessory" and RESTRICTED_EARRING_REGEX.search(value)
+    )
+    if not restricted:
+        return True
+    return any(part in RESTRICTED_METAL_COLORS for part in value.split("."))
+
+
+def load_allowed_key_values(path=OUTPUT_FILE):
+    """Read back the ALLOWED_KEY_VALUES literal written by this script."""
+    text = Path(path).read_text(encoding="utf-8")
+    return ast.literal_eval(text.split("=", 1)[1].strip())
+
+
 def parse_file(path):
     """Parse JSON file and return list of tuples (base_id, variant_name)."""
     print(f"Parsing: {path}")
@@ -204,4 +226,10 @@ if __name__ == "__main__":
             f.write("    },\n")
         f.write("}\n")
 
-    print(f"Wrote {OUTPUT_FILE}")
+    # same catalog as JSON; written via a temp file so a watching editor never sees half of it
+    tmp = CATALOG_JSON_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({key: sort_human_readable(values) for key, values in allowed.items() if values}, f, indent=1)
+    os.replace(tmp, CATALOG_JSON_FILE)
+
+    print(f"Wrote {OUTPUT_FILE} and {CATALOG_JSON_FILE}")
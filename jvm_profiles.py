@@ -0,0 +1,192 @@
+import os
+import re
+import sys
+import glob
+import math
+
+# ---------- CONFIGURATION ----------
+
+# Named launch profiles: extra JVM flags placed before -jar.
+PROFILES = {
+    "default": {
+        "flags": [],
+        "pretouch": False,
+        "large_pages": False,
+    },
+    "low-latency (ZGC)": {
+        # generational ZGC is the only mode on the JDKs Hytale ships with
+        "flags": [
+            "-XX:+UseZGC",
+        ],
+        "pretouch": True,
+        "large_pages": True,
+    },
+    "throughput (G1)": {
+        "flags": [
+            "-XX:+UseG1GC",
+            "-XX:MaxGCPauseMillis=130",
+            "-XX:+UnlockExperimentalVMOptions",     # the two G1 young-gen sizes below need it
+            "-XX:G1NewSizePercent=30",
+            "-XX:G1MaxNewSizePercent=40",
+            "-XX:G1HeapRegionSize=8M",
+            "-XX:G1ReservePercent=20",
+            "-XX:InitiatingHeapOccupancyPercent=15",
+            "-XX:+ParallelRefProcEnabled",
+            "-XX:+DisableExplicitGC",
+        ],
+        "pretouch": True,
+        "large_pages": True,
+    },
+    "small footprint": {
+        "flags": [
+            "-XX:+UseSerialGC",
+            "-XX:MinHeapFreeRatio=10",
+            "-XX:MaxHeapFreeRatio=30",
+            "-Xss512k",
+        ],
+        "pretouch": False,
+        "large_pages": False,
+    },
+}
+DEFAULT_PROFILE = "default"
+
+# Relative to the server cwd so Windows drive colons never reach -Xlog parsing
+GC_LOG_FILE = os.path.join("logs", "gc.log")
+GC_LOG_FILES = 5
+GC_LOG_SIZE = "10M"
+
+AUTO_HEAP_SHARE = 0.5          # at most half of physical RAM
+AUTO_HEAP_AVAILABLE = 0.8      # and at most 80% of what is free right now
+
+
+# ---------- MEMORY ----------
+
+def read_meminfo(path="/proc/meminfo"):
+    """Return (total_gb, available_gb) from /proc/meminfo, or None off Linux."""
+    try:
+        with open(path, "r", encoding="ascii") as f:
+            info = {}
+            for line in f:
+                name, _, rest = line.partition(":")
+                info[name] = int(rest.split()[0])   # kB
+    except (OSError, ValueError, IndexError):
+        return None
+    if "MemTotal" not in info:
+        return None
+    total = info["MemTotal"] / 1048576
+    available = info.get("MemAvailable", info.get("MemFree", 0)) / 1048576
+    return total, available
+
+
+def auto_heap(min_range, max_range, pretouch=False, meminfo=None):
+    """Derive (xms, xmx) in GB from system memory, clamped to the slider ranges.
+
+    Pre-touching profiles commit the whole heap up front, so they get xms == xmx.
+    """
+    meminfo = meminfo or read_meminfo()
+    if not meminfo:
+        return None
+    total, available = meminfo
+
+    xmx = int(min(total * AUTO_HEAP_SHARE, available * AUTO_HEAP_AVAILABLE))
+    xmx = max(max_range[0], min(max_range[1], xmx))
+    xms = xmx if pretouch else xmx // 2
+    xms = max(min_range[0], min(min_range[1], xms, xmx))
+    return xms, xmx
+
+
+# ---------- COMMAND LINE ----------
+
+def build_java_args(profile, min_ram, max_ram, gc_log=True):
+    """JVM flags (without the java executable or -jar) for a profile."""
+    spec = PROFILES.get(profile, PROFILES[DEFAULT_PROFILE])
+    args = [
+        "-Dfile.encoding=UTF-8",
+        f"-Xms{min_ram}G",
+        f"-Xmx{max_ram}G",
+    ]
+    args += spec["flags"]
+    if spec["pretouch"]:
+        args.append("-XX:+AlwaysPreTouch")
+    if spec["large_pages"] and sys.platform.startswith("linux"):
+        # THP needs no hugetlbfs reservation, unlike -XX:+UseLargePages
+        args.append("-XX:+UseTransparentHugePages")
+    if gc_log:
+        args.append(
+            f"-Xlog:gc*:file={GC_LOG_FILE}:time,uptime,level,tags"
+            f":filecount={GC_LOG_FILES},filesize={GC_LOG_SIZE}"
+        )
+    return args
+
+
+# ---------- GC LOG SUMMARY ----------
+
+UPTIME_REGEX = re.compile(r"\[(\d+(?:\.\d+)?)s\]")
+PAUSE_REGEX = re.compile(r"\bPause\b.*?(\d+(?:\.\d+)?)ms\s*$")
+HEAP_REGEX = re.compile(r"(\d+)M(?:\(\d+%\))?->(\d+)M")
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+
+def gc_log_files(app_dir):
+    """Current GC log plus its rotations, oldest first."""
+    files = glob.glob(os.path.join(app_dir, GC_LOG_FILE + "*"))
+    return sorted(files, key=os.path.getmtime)
+
+
+def summarize_gc_log(paths):
+    """Pause p50/p99/max and allocation rate (MB/s) across GC log files."""
+    pauses = []
+    allocated = 0
+    prev_after = None
+    first_uptime = last_uptime = None
+
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if "[gc" not in line:
+                    continue
+                up = UPTIME_REGEX.search(line)
+                if up:
+                    uptime = float(up.group(1))
+                    if first_uptime is None or uptime < first_uptime:
+                        first_uptime = uptime
+                    last_uptime = uptime
+
+                m = PAUSE_REGEX.search(line)
+                if m:
+                    pauses.append(float(m.group(1)))
+
+                h = HEAP_REGEX.search(line)
+                if h:
+                    before, after = int(h.group(1)), int(h.group(2))
+                    if prev_after is not None and before >= prev_after:
+                        allocated += before - prev_after
+                    prev_after = after
+
+    pauses.sort()
+    elapsed = (last_uptime - first_uptime) if first_uptime is not None else 0
+    return {
+        "pauses": len(pauses),
+        "p50_ms": percentile(pauses, 50),
+        "p99_ms": percentile(pauses, 99),
+        "max_ms": pauses[-1] if pauses else 0.0,
+        "alloc_mb_s": allocated / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def format_gc_summary(summary):
+    if not summary["pauses"]:
+        return "No GC pauses logged yet.\n"
+    return (
+        f"GC pauses: {summary['pauses']}  "
+        f"p50 {summary['p50_ms']:.2f}ms  p99 {summary['p99_ms']:.2f}ms  "
+        f"max {summary['max_ms']:.2f}ms  "
+        f"alloc {summary['alloc_mb_s']:.1f} MB/s\n"
+    )
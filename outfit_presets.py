@@ -0,0 +1,114 @@
+import os
+import json
+
+# ---------- CONFIGURATION ----------
+
+PRESETS_FILE = "presets.json"         # {name: {key: value}}
+
+
+# ---------- LIBRARY ----------
+
+class PresetLibrary:
+    """Named outfits with an inverted index from (key, value) to preset names.
+
+    The index makes "which presets use Hope_Of_Gaia_Cape" a dict lookup, and
+    lets a catalog change be checked by looking up only the values it removed
+    instead of walking every preset.
+    """
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, PRESETS_FILE)
+        self.presets = {}
+        self.by_pair = {}       # (key, value) -> {names}
+        self.by_value = {}      # value -> {(key, value)}, for queries without a key
+        self.skipped = 0        # presets / entries in the file that were not {str: str}
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    loaded = json.load(f)
+            except (OSError, ValueError):
+                loaded = {}
+            if not isinstance(loaded, dict):
+                loaded = {}
+                self.skipped += 1
+            for name, outfit in loaded.items():
+                if not isinstance(outfit, dict):
+                    self.skipped += 1
+                    continue
+                good = {k: v for k, v in outfit.items() if isinstance(v, str)}
+                self.skipped += len(outfit) - len(good)
+                self.index(name, good)
+
+    # ----- index -----
+    def index(self, name, outfit):
+        self.presets[name] = dict(outfit)
+        for pair in outfit.items():
+            self.by_pair.setdefault(pair, set()).add(name)
+            self.by_value.setdefault(pair[1], set()).add(pair)
+
+    def unindex(self, name):
+        outfit = self.presets.pop(name)
+        for pair in outfit.items():
+            names = self.by_pair[pair]
+            names.discard(name)
+            if not names:
+                del self.by_pair[pair]
+                pairs = self.by_value[pair[1]]
+                pairs.discard(pair)
+                if not pairs:
+                    del self.by_value[pair[1]]
+        return outfit
+
+    # ----- edits -----
+    def save(self):
+        tmp = self.path + ".tmp"
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.presets, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def put(self, name, outfit):
+        if name in self.presets:
+            self.unindex(name)
+        self.index(name, outfit)
+        self.save()
+
+    def delete(self, name):
+        if name in self.presets:
+            self.unindex(name)
+            self.save()
+
+    # ----- queries -----
+    def using(self, value, key=None):
+        """Names of presets that set `value` (for `key`, or under any key)."""
+        if key is not None:
+            return set(self.by_pair.get((key, value), ()))
+        names = set()
+        for pair in self.by_value.get(value, ()):
+            names |= self.by_pair[pair]
+        return names
+
+    def validate(self, catalog):
+        """{name: [(key, value)]} of entries not allowed by `catalog` ({key: allowed values})."""
+        allowed = {key: set(values) for key, values in catalog.items()}
+        problems = {}
+        # one check per distinct pair, however many presets share it
+        for pair, names in self.by_pair.items():
+            key, value = pair
+            if key not in allowed or value not in allowed[key]:
+                for name in names:
+                    problems.setdefault(name, []).append(pair)
+        return problems
+
+    def invalidated_by(self, old_catalog, new_catalog):
+        """Presets broken by moving from `old_catalog` to `new_catalog`, looked up
+        through the index from the pairs the new catalog dropped."""
+        problems = {}
+        for key, values in old_catalog.items():
+            kept = set(new_catalog.get(key, ()))
+            for value in values:
+                if value in kept:
+                    continue
+                for name in self.by_pair.get((key, value), ()):
+                    problems.setdefault(name, []).append((key, value))
+        return problems
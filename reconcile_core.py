@@ -0,0 +1,60 @@
+# ---------- CONFIGURATION ----------
+
+WRITE_QUIET_MS = 600          # how long the file must be quiet before we reconcile
+RECONCILE_DELAY_MS = 80       # small delay after detecting overwrite
+
+
+# ---------- CORE ----------
+
+class ReconcileCore:
+    """The editor's cooldown reconcile rules, without Qt or a real clock.
+
+    Callers pass `now` in seconds from whatever clock they run on (time.time()
+    in the editor, a virtual clock in sim_reconcile.py) and perform the
+    actual reads, writes and the RECONCILE_DELAY_MS timer themselves.
+    """
+
+    def __init__(self, allowed, quiet_ms=WRITE_QUIET_MS, delay_ms=RECONCILE_DELAY_MS, now=0.0):
+        self.allowed = allowed
+        self.quiet = quiet_ms / 1000.0
+        self.delay = delay_ms / 1000.0
+        self.desired = {}               # authoritative cosmetic intent
+        self.last_write_seen_at = now
+        self.scheduled = False
+
+    def request(self):
+        self.scheduled = True
+
+    def seen_write(self, now):
+        """Any write to the file, ours included, restarts the quiet period."""
+        self.last_write_seen_at = now
+
+    def conflicts(self, disk):
+        """Keys whose value on disk differs from the desired one."""
+        return [key for key, desired in self.desired.items() if key in disk and disk.get(key) != desired]
+
+    def external_write(self, disk, now):
+        """Someone else wrote the file; schedules a reconcile if they overwrote intent."""
+        self.last_write_seen_at = now
+        conflicts = self.conflicts(disk)
+        if conflicts:
+            self.scheduled = True
+        return conflicts
+
+    def due(self, now):
+        """True once per request when the file has been quiet long enough;
+        the caller then writes merge() after `delay` seconds."""
+        if self.scheduled and now - self.last_write_seen_at >= self.quiet:
+            self.scheduled = False
+            return True
+        return False
+
+    def merge(self, base):
+        """`base` with desired values applied where the key exists and the value is allowed."""
+        merged = dict(base)
+        for key, val in self.desired.items():
+            if key in merged and key in self.allowed:
+                # Only overwrite if the value is allowed for that key
+                if val in self.allowed[key]:
+                    merged[key] = val
+        return merged
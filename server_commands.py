@@ -0,0 +1,119 @@
+import re
+import asyncio
+from collections import deque
+
+from jvm_profiles import percentile
+
+# ---------- CONFIGURATION ----------
+
+COMMAND_QUIET_MS = 300         # output window closes after this much silence
+COMMAND_TIMEOUT = 10.0         # hard cap on one command's window, seconds
+LATENCY_HISTORY = 200          # round-trips kept for stats
+
+
+# ---------- CAPTURE ----------
+
+class Capture:
+    """Output window of one command."""
+
+    def __init__(self, command_id, text, until=None):
+        self.id = command_id
+        self.text = text
+        self.until = re.compile(until) if until else None
+        self.lines = []
+        self.sent_at = None
+        self.first_at = None
+        self.last_at = None
+        self.matched = False
+        self.activity = asyncio.Event()
+
+    def result(self, ended_at, timed_out):
+        return {
+            "command_id": self.id,
+            "command": self.text,
+            "lines": self.lines,
+            "first_output_ms": round((self.first_at - self.sent_at) * 1000, 1) if self.first_at else None,
+            "total_ms": round((ended_at - self.sent_at) * 1000, 1),
+            "matched": self.matched,
+            "timed_out": timed_out,
+        }
+
+
+# ---------- PIPELINE ----------
+
+class CommandPipeline:
+    """Sends console commands one at a time and attributes the following output.
+
+    A window closes when `until` matches, after COMMAND_QUIET_MS of silence, or
+    at the timeout. Silence counts from the send, so a command that prints
+    nothing returns quickly; with `until` it counts only once output started.
+    Commands queue behind the open window so two commands never share output.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.lock = asyncio.Lock()
+        self.active = None
+        self.next_id = 0
+        self.latencies = deque(maxlen=LATENCY_HISTORY)
+
+    def feed(self, lines):
+        cap = self.active
+        if cap is None:
+            return
+        now = asyncio.get_running_loop().time()
+        for line in lines:
+            cap.lines.append(line)
+            if cap.first_at is None:
+                cap.first_at = now
+            if cap.until and cap.until.search(line):
+                cap.matched = True
+                break
+        cap.last_at = now
+        cap.activity.set()
+
+    async def execute(self, text, until=None, quiet_ms=COMMAND_QUIET_MS, timeout=COMMAND_TIMEOUT):
+        loop = asyncio.get_running_loop()
+        async with self.lock:
+            self.next_id += 1
+            cap = Capture(self.next_id, text, until)
+            self.active = cap
+            cap.sent_at = loop.time()
+            self.server.send(text)
+
+            quiet = quiet_ms / 1000
+            deadline = cap.sent_at + timeout
+            timed_out = False
+            try:
+                while not cap.matched:
+                    now = loop.time()
+                    if now >= deadline:
+                        timed_out = True
+                        break
+                    wait = deadline - now
+                    since = cap.last_at or (None if cap.until else cap.sent_at)
+                    if since is not None:
+                        left = quiet - (now - since)
+                        if left <= 0:
+                            break
+                        wait = min(wait, left)
+                    cap.activity.clear()
+                    try:
+                        await asyncio.wait_for(cap.activity.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self.active = None
+
+            if cap.first_at is not None:
+                self.latencies.append((cap.first_at - cap.sent_at) * 1000)
+            return cap.result(loop.time(), timed_out)
+
+    def stats(self):
+        values = sorted(self.latencies)
+        return {
+            "commands": len(values),
+            "p50_ms": round(percentile(values, 50), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "max_ms": round(values[-1], 1) if values else 0.0,
+        }
@@ -0,0 +1,691 @@
+import os
+import re
+import sys
+import json
+import socket
+import signal
+import asyncio
+import argparse
+
+from server_supervisor import (
+    Supervisor, SupervisorListener, ServerProcess, ShutdownHistory, format_shutdown,
+)
+from server_instances import InstanceManager, MAIN_INSTANCE
+from server_readiness import BootHistory, load_ready_patterns
+from server_commands import CommandPipeline, COMMAND_QUIET_MS, COMMAND_TIMEOUT
+from addon_inventory import AddonInventory
+from server_logs import LogParser, LogFilter, LEVELS, TRACE, parse_level
+from server_metrics import MetricStore, MetricsExporter, poll_loop, METRICS, METRIC_TIERS, METRICS_PORT
+from assets_check import AssetsIndex, AssetsError
+from jvm_profiles import PROFILES
+
+# ---------- CONFIGURATION ----------
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTROL_SOCKET = "control.sock"     # inside logs/, next to server.log
+SUBSCRIBER_BUFFER = 4 * 1024 * 1024 # drop event subscribers that stop reading
+
+# Protocol: one JSON object per line in each direction.
+#   request:  {"id": 1, "op": "start", "instance": "main", ...}
+#   response: {"id": 1, "ok": true, ...}  or  {"id": 1, "ok": false, "error": "..."}
+#             (long-running ops such as "command" may answer after later requests)
+#   event:    {"event": "output", "instance": "main", "text": "..."}   (after "subscribe")
+
+
+def control_socket_path(app_dir=APP_DIR):
+    return os.path.join(app_dir, "logs", CONTROL_SOCKET)
+
+
+def unix_sockets_supported():
+    return hasattr(socket, "AF_UNIX") and sys.platform != "win32"
+
+
+# ---------- CORE ----------
+
+class ControlCore(SupervisorListener):
+    """Qt-free launcher: owns the supervisor, instances and boot history.
+
+    handle() and the listener callbacks both run on the supervisor loop, so the
+    state here is only ever touched from that one thread.
+    """
+
+    def __init__(self, app_dir=APP_DIR, supervisor=None):
+        self.app_dir = app_dir
+        self.log_dir = os.path.join(app_dir, "logs")
+        os.makedirs(self.log_dir, exist_ok=True)
+
+        self.supervisor = supervisor or Supervisor()
+        self.instances = InstanceManager(app_dir)
+        self.boot_history = BootHistory(self.log_dir)
+        self.shutdown_history = ShutdownHistory(self.log_dir)
+        self.servers = {}
+        self.pipelines = {}
+        self.states = {}
+        self.logs = {}
+        self.metrics = {}
+        self.pollers = {}
+        self.inventories = {}
+        self.assets_index = AssetsIndex(self.log_dir)
+        self.assets_lock = None
+        self.subscribers = set()
+
+    # ----- events -----
+
+    def publish(self, event):
+        for push in list(self.subscribers):
+            try:
+                push(event)
+            except Exception:
+                self.subscribers.discard(push)
+
+    def set_state(self, name, status, **extra):
+        state = self.states.setdefault(name, {"status": "stopped", "pid": None, "summary": ""})
+        state["status"] = status
+        state.update(extra)
+
+    def on_output(self, name, text):
+        lines = text.splitlines(keepends=True)
+        log = self.logs.get(name)
+        if log is None:
+            log = self.logs[name] = LogParser()
+        log.feed(lines)
+        self.metric_store(name).feed(lines)
+        pipeline = self.pipelines.get(name)
+        if pipeline:
+            pipeline.feed(lines)
+        self.publish({"event": "output", "instance": name, "text": text})
+
+    def on_booting(self, name):
+        self.stop_polling(name)
+        server = self.servers.get(name)
+        if server and not server.stop_requested:
+            self.set_state(name, "starting", pid=None)
+        self.publish({"event": "booting", "instance": name})
+
+    def on_spawned(self, name, pid):
+        self.set_state(name, self.states[name]["status"], pid=pid)
+        self.publish({"event": "spawned", "instance": name, "pid": pid})
+
+    def on_ready(self, name, pattern, duration):
+        server = self.servers.get(name)
+        inventory = self.inventory(name)
+        self.set_state(name, "running")
+        self.boot_history.record(
+            duration,
+            inventory.names(),
+            server.min_ram if server else None,
+            server.max_ram if server else None,
+            pattern,
+            instance=name,
+            fingerprint=inventory.fingerprint(),
+        )
+        self.publish({"event": "ready", "instance": name, "pattern": pattern, "duration": duration})
+        self.start_polling(name)
+
+    def on_crashed(self, name, summary):
+        self.stop_polling(name)
+        self.set_state(name, "crashed", pid=None, summary=summary)
+        self.inventory(name).note_crash(summary)
+        self.publish({"event": "crashed", "instance": name, "summary": summary})
+
+    def on_shutdown(self, name, report):
+        self.shutdown_history.record(report, instance=name)
+        self.on_output(name, format_shutdown(report))
+        self.publish({"event": "shutdown", "instance": name, **report})
+
+    def on_stopped(self, name, crashed):
+        self.stop_polling(name)
+        self.metric_store(name).reset_players()
+        self.servers.pop(name, None)
+        self.pipelines.pop(name, None)
+        self.set_state(name, "crashed" if crashed else "stopped", pid=None)
+        self.publish({"event": "stopped", "instance": name, "crashed": crashed})
+
+    # ----- metrics -----
+
+    def metric_store(self, name):
+        store = self.metrics.get(name)
+        if store is None:
+            store = self.metrics[name] = MetricStore()
+        return store
+
+    def start_polling(self, name):
+        command = self.instances.get(name).poll_command
+        pipeline = self.pipelines.get(name)
+        if command and pipeline and name not in self.pollers:
+            self.pollers[name] = asyncio.ensure_future(poll_loop(pipeline, command))
+
+    def stop_polling(self, name):
+        task = self.pollers.pop(name, None)
+        if task:
+            task.cancel()
+
+    async def start_exporter(self, port=METRICS_PORT):
+        """Serve /metrics for Prometheus; returns the exporter (close() it on exit)."""
+        exporter = MetricsExporter(lambda: self.metrics, port=port)
+        await exporter.start()
+        return exporter
+
+    # ----- requests -----
+
+    def handle(self, req):
+        """Response dict, or a coroutine resolving to one for long-running ops."""
+        op = req.get("op")
+        handler = getattr(self, f"op_{op}", None) if isinstance(op, str) else None
+        if handler is None:
+            return {"ok": False, "error": f"unknown op {op!r}"}
+        try:
+            result = handler(req)
+        except (KeyError, ValueError, RuntimeError, OSError) as e:
+            return {"ok": False, "error": str(e)}
+        if asyncio.iscoroutine(result):
+            return self.finish(result)
+        return {"ok": True, **(result or {})}
+
+    async def finish(self, coro):
+        try:
+            result = await coro
+        except (KeyError, ValueError, RuntimeError, OSError, re.error) as e:
+            return {"ok": False, "error": str(e)}
+        return {"ok": True, **(result or {})}
+
+    def inventory(self, name):
+        if name not in self.inventories:
+            cfg = self.instances.get(name)
+            self.inventories[name] = AddonInventory(cfg.root, cfg.log_dir)
+        return self.inventories[name]
+
+    def instance(self, req):
+        name = req.get("instance", MAIN_INSTANCE)
+        if name not in self.instances.instances:
+            raise KeyError(f"unknown instance {name!r}")
+        return name
+
+    def op_status(self, req):
+        return {"instances": {
+            cfg.name: {
+                "port": cfg.port,
+                **self.states.get(cfg.name, {"status": "stopped", "pid": None, "summary": ""}),
+            }
+            for cfg in self.instances
+        }}
+
+    def op_instances(self, req):
+        return {"instances": [cfg.to_dict() for cfg in self.instances]}
+
+    def op_add_instance(self, req):
+        settings = {k: req[k] for k in ("min_ram", "max_ram", "profile", "cpus", "nice", "poll_command")
+                    if k in req}
+        cfg = self.instances.create(req.get("instance"), **settings)
+        return {"instance": cfg.to_dict()}
+
+    def op_start(self, req):
+        name = self.instance(req)
+        if name in self.servers:
+            raise RuntimeError(f"{name} is already running")
+        cfg = self.instances.get(name)
+        for key in ("min_ram", "max_ram", "profile"):
+            if key in req:
+                setattr(cfg, key, req[key])
+        if cfg.profile not in PROFILES:
+            raise ValueError(f"unknown profile {cfg.profile!r}")
+        self.instances.save()
+        os.makedirs(cfg.log_dir, exist_ok=True)
+
+        # claim the name now so a second start can't race the scan below
+        self.servers[name] = None
+        self.set_state(name, "starting", pid=None, summary="")
+        return self.launch(name, cfg, req.get("auto_restart", True))
+
+    async def check_assets(self, name):
+        """Pre-flight Assets.zip check; instances starting together share one run."""
+        loop = asyncio.get_running_loop()
+        if self.assets_lock is None:
+            self.assets_lock = asyncio.Lock()
+
+        def progress(done, total):
+            loop.call_soon_threadsafe(self.publish, {
+                "event": "output", "instance": name,
+                "text": f"[Launcher] Verifying Assets.zip: {done}/{total} members\n",
+            })
+
+        async with self.assets_lock:
+            try:
+                stats = await loop.run_in_executor(
+                    None, self.assets_index.check, self.instances.assets, progress
+                )
+            except AssetsError as e:
+                raise RuntimeError(f"Assets.zip failed the integrity check: {e}")
+        if not stats["cached"]:
+            self.publish({
+                "event": "output", "instance": name,
+                "text": f"[Launcher] Assets.zip OK: {stats['checked']} of {stats['members']} "
+                        f"members verified in {stats['seconds']:.1f}s\n",
+            })
+
+    async def launch(self, name, cfg, auto_restart):
+        inventory = self.inventory(name)
+        try:
+            await self.check_assets(name)
+            # hashing new/changed jars is blocking disk work; keep it off the loop
+            changes = await asyncio.get_running_loop().run_in_executor(None, inventory.scan)
+        except BaseException:
+            # includes cancellation (the requesting client went away): release the
+            # name claimed in op_start, or the instance stays "starting" for good
+            self.servers.pop(name, None)
+            self.set_state(name, "stopped")
+            raise
+
+        server = ServerProcess(
+            name,
+            self.instances.command(cfg),
+            cfg.root,
+            cfg.log_file,
+            self,
+            auto_restart=auto_restart,
+            ready_patterns=load_ready_patterns(cfg.root),
+            min_ram=cfg.min_ram,
+            max_ram=cfg.max_ram,
+            after_spawn=lambda pid: self.instances.apply_scheduling(cfg, pid),
+            stop_deadline=cfg.stop_deadline,
+        )
+        self.servers[name] = server
+        self.pipelines[name] = CommandPipeline(server)
+        self.supervisor.add(server)
+        return {"instance": name, "addons": [
+            f"{rel} [{inventory.files[rel]['sha256'][:8]}]" for rel in inventory.names()
+        ], "addon_changes": changes}
+
+    def op_stop(self, req):
+        name = self.instance(req)
+        server = self.servers.get(name)
+        if not server:
+            raise RuntimeError(f"{name} is not running" if name not in self.servers
+                               else f"{name} is still starting")
+        self.set_state(name, "stopping")
+        deadline = req.get("deadline")
+        server.stop(float(deadline) if deadline is not None else None)
+        return {"instance": name, "deadline": server.stop_deadline}
+
+    def op_send(self, req):
+        name = self.instance(req)
+        server = self.servers.get(name)
+        if not server:
+            raise RuntimeError(f"{name} is not running")
+        server.send(str(req["text"]))
+        return {"instance": name}
+
+    def op_command(self, req):
+        """Send a command and return the output window that answered it."""
+        name = self.instance(req)
+        pipeline = self.pipelines.get(name)
+        if name not in self.servers or not pipeline:
+            raise RuntimeError(f"{name} is not running")
+
+        async def run():
+            result = await pipeline.execute(
+                str(req["text"]),
+                until=req.get("until"),
+                quiet_ms=float(req.get("quiet_ms", COMMAND_QUIET_MS)),
+                timeout=float(req.get("timeout", COMMAND_TIMEOUT)),
+            )
+            return {"instance": name, **result}
+        return run()
+
+    def op_command_stats(self, req):
+        name = self.instance(req)
+        pipeline = self.pipelines.get(name)
+        return {"instance": name, **(pipeline.stats() if pipeline else CommandPipeline(None).stats())}
+
+    def op_tail(self, req):
+        """Recent lines, optionally only those at `level` or above and/or from `logger`."""
+        name = self.instance(req)
+        n = int(req.get("lines", 50))
+        log = self.logs.get(name)
+        if log is None or n <= 0:
+            return {"instance": name, "lines": []}
+        flt = LogFilter(parse_level(req["level"]) if req.get("level") else TRACE, req.get("logger"))
+        return {"instance": name, "lines": log.view(flt, n)}
+
+    def op_metrics(self, req):
+        """Latest values and [[time, value], ...] per metric at one downsampling tier."""
+        name = self.instance(req)
+        tier = int(req.get("tier", 0))
+        if not 0 <= tier < len(METRIC_TIERS):
+            raise ValueError(f"tier must be 0-{len(METRIC_TIERS) - 1}")
+        store = self.metric_store(name)
+        return {
+            "instance": name,
+            "bucket": METRIC_TIERS[tier][0],
+            "latest": store.latest(),
+            "series": {m: store.points(m, tier) for m in METRICS},
+        }
+
+    def op_log_stats(self, req):
+        name = self.instance(req)
+        log = self.logs.get(name) or LogParser(0)
+        return {"instance": name, **log.stats()}
+
+    def op_boot_stats(self, req):
+        name = self.instance(req)
+        records = [r for r in self.boot_history.records if r.get("instance") in (name, None)]
+        return {"report": self.boot_history.report() + self.inventory(name).report(records)
+                + self.shutdown_history.report(name)}
+
+    def op_addons(self, req):
+        name = self.instance(req)
+        inventory = self.inventory(name)
+        return {"instance": name, "fingerprint": inventory.fingerprint(),
+                "files": inventory.files, "changes": inventory.changes[-20:]}
+
+    def stop_all(self, deadline=None):
+        for name, server in list(self.servers.items()):
+            if server is None:
+                continue
+            self.set_state(name, "stopping")
+            server.stop(deadline)
+
+
+# ---------- SOCKET SERVER ----------
+
+class ControlServer:
+    """Line-delimited JSON over a Unix domain socket, served on the core's loop."""
+
+    def __init__(self, core, path=None):
+        self.core = core
+        self.path = path or control_socket_path(core.app_dir)
+        self.server = None
+
+    async def start(self):
+        if os.path.exists(self.path):
+            if daemon_running(self.path):
+                raise RuntimeError(f"another launcher is serving {self.path}")
+            os.unlink(self.path)
+        self.server = await asyncio.start_unix_server(self.client, self.path)
+        os.chmod(self.path, 0o600)
+
+    def close(self):
+        if self.server:
+            self.server.close()
+            self.server = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    async def client(self, reader, writer):
+        def send(msg):
+            writer.write((json.dumps(msg) + "\n").encode("utf-8"))
+
+        def push(event):
+            if writer.transport.get_write_buffer_size() > SUBSCRIBER_BUFFER:
+                raise ConnectionError("subscriber is not reading")
+            send(event)
+
+        async def reply(req_id, pending):
+            # long-running ops answer out of order, matched up by id
+            resp = await pending
+            resp["id"] = req_id
+            send(resp)
+
+        running = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    req = json.loads(line)
+                    if not isinstance(req, dict):
+                        raise ValueError
+                except ValueError:
+                    send({"ok": False, "error": "malformed request"})
+                    continue
+
+                if req.get("op") == "subscribe":
+                    self.core.subscribers.add(push)
+                    resp = {"ok": True}
+                else:
+                    resp = self.core.handle(req)
+                    if asyncio.iscoroutine(resp):
+                        task = asyncio.create_task(reply(req.get("id"), resp))
+                        running.add(task)
+                        task.add_done_callback(running.discard)
+                        continue
+                resp["id"] = req.get("id")
+                send(resp)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for task in running:
+                task.cancel()
+            self.core.subscribers.discard(push)
+            writer.close()
+
+
+# ---------- CLIENT ----------
+
+def daemon_running(path):
+    if not unix_sockets_supported() or not os.path.exists(path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+class ControlConnection:
+    """Blocking client for scripts and cron jobs."""
+
+    def __init__(self, path=None, timeout=10):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path or control_socket_path())
+        self.file = self.sock.makefile("rwb")
+        self.next_id = 0
+
+    def request(self, op, **params):
+        self.next_id += 1
+        req = {"id": self.next_id, "op": op, **params}
+        self.file.write((json.dumps(req) + "\n").encode("utf-8"))
+        self.file.flush()
+        for msg in self.messages():
+            if msg.get("id") == self.next_id:
+                return msg
+        raise ConnectionError("daemon closed the connection")
+
+    def messages(self):
+        for line in self.file:
+            yield json.loads(line)
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+# ---------- DAEMON ----------
+
+def serve(app_dir, start=(), stop_deadline=None, metrics_port=METRICS_PORT):
+    """Run the supervisor and control socket on this thread until SIGTERM/SIGINT."""
+    core = ControlCore(app_dir)
+    loop = core.supervisor.loop
+    asyncio.set_event_loop(loop)
+    server = ControlServer(core)
+    loop.run_until_complete(server.start())
+    print(f"Listening on {server.path}", flush=True)
+    exporter = None
+    if metrics_port:
+        try:
+            exporter = loop.run_until_complete(core.start_exporter(metrics_port))
+            print(f"Metrics on http://{exporter.host}:{exporter.port}/metrics", flush=True)
+        except OSError as e:
+            print(f"Metrics exporter disabled: {e}", flush=True)
+
+    for name in start:
+        resp = core.handle({"op": "start", "instance": name})
+        if asyncio.iscoroutine(resp):
+            resp = loop.run_until_complete(resp)
+        print(json.dumps(resp), flush=True)
+
+    def shutdown():
+        if not core.servers:
+            loop.stop()
+            return
+        core.stop_all(stop_deadline)
+        core.subscribers.add(lambda ev: ev["event"] == "stopped" and not core.servers and loop.stop())
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, shutdown)
+    try:
+        loop.run_forever()
+    finally:
+        server.close()
+        if exporter:
+            exporter.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Hytale server launcher and control client.")
+    parser.add_argument("--socket", help="control socket path")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("serve", help="run the supervisor without Qt")
+    p.add_argument("--start", action="append", default=[], metavar="INSTANCE")
+    p.add_argument("--stop-deadline", type=float, help="seconds allowed for each server to stop on SIGTERM")
+    p.add_argument("--metrics-port", type=int, default=METRICS_PORT, help="Prometheus port, 0 to disable")
+
+    sub.add_parser("status")
+
+    p = sub.add_parser("start")
+    p.add_argument("instance", nargs="?", default=MAIN_INSTANCE)
+    p.add_argument("--min-ram", type=int)
+    p.add_argument("--max-ram", type=int)
+    p.add_argument("--profile", choices=list(PROFILES))
+    p.add_argument("--no-restart", action="store_true")
+
+    p = sub.add_parser("stop")
+    p.add_argument("instance", nargs="?", default=MAIN_INSTANCE)
+    p.add_argument("--deadline", type=float, help="seconds before SIGTERM/SIGKILL escalation")
+
+    p = sub.add_parser("send")
+    p.add_argument("instance")
+    p.add_argument("text", nargs="+")
+
+    p = sub.add_parser("cmd", help="send a command and print the output that answered it")
+    p.add_argument("instance")
+    p.add_argument("text", nargs="+")
+    p.add_argument("--until", help="regex that ends the output window")
+    p.add_argument("--timeout", type=float, default=COMMAND_TIMEOUT)
+
+    p = sub.add_parser("batch", help="run one command per line from a file (- for stdin)")
+    p.add_argument("instance")
+    p.add_argument("file")
+    p.add_argument("--timeout", type=float, default=COMMAND_TIMEOUT)
+
+    p = sub.add_parser("tail")
+    p.add_argument("instance", nargs="?", default=MAIN_INSTANCE)
+    p.add_argument("-n", "--lines", type=int, default=50)
+    p.add_argument("-f", "--follow", action="store_true")
+    p.add_argument("--level", type=str.upper, choices=LEVELS, help="only this level and above")
+    p.add_argument("--logger", help="only lines from this logger")
+
+    p = sub.add_parser("metrics", help="latest TPS, tick time, lag and player count")
+    p.add_argument("instance", nargs="?", default=MAIN_INSTANCE)
+    p.add_argument("--tier", type=int, default=0, help="downsampling tier for the series")
+    p.add_argument("--series", action="store_true", help="include the time series")
+
+    p = sub.add_parser("log-stats", help="per-level and per-logger line counts")
+    p.add_argument("instance", nargs="?", default=MAIN_INSTANCE)
+
+    args = parser.parse_args(argv)
+
+    if not unix_sockets_supported():
+        parser.error("the control socket needs Unix domain sockets")
+
+    if args.cmd == "serve":
+        serve(APP_DIR, args.start, args.stop_deadline, args.metrics_port)
+        return 0
+
+    try:
+        conn = ControlConnection(args.socket)
+    except OSError as e:
+        print(f"Launcher not running ({e})", file=sys.stderr)
+        return 2
+
+    if args.cmd == "status":
+        resp = conn.request("status")
+    elif args.cmd == "start":
+        params = {"instance": args.instance, "auto_restart": not args.no_restart}
+        if args.min_ram:
+            params["min_ram"] = args.min_ram
+        if args.max_ram:
+            params["max_ram"] = args.max_ram
+        if args.profile:
+            params["profile"] = args.profile
+        resp = conn.request("start", **params)
+    elif args.cmd == "stop":
+        params = {"instance": args.instance}
+        if args.deadline is not None:
+            params["deadline"] = args.deadline
+        resp = conn.request("stop", **params)
+    elif args.cmd == "send":
+        resp = conn.request("send", instance=args.instance, text=" ".join(args.text))
+    elif args.cmd == "cmd":
+        conn.sock.settimeout(args.timeout + 5)
+        resp = conn.request("command", instance=args.instance, text=" ".join(args.text),
+                            until=args.until, timeout=args.timeout)
+    elif args.cmd == "batch":
+        conn.sock.settimeout(args.timeout + 5)
+        f = sys.stdin if args.file == "-" else open(args.file, "r", encoding="utf-8")
+        failed = 0
+        with f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                resp = conn.request("command", instance=args.instance, text=line, timeout=args.timeout)
+                failed += not resp.get("ok")
+                print(json.dumps(resp), flush=True)
+        conn.close()
+        return 1 if failed else 0
+    elif args.cmd == "metrics":
+        resp = conn.request("metrics", instance=args.instance, tier=args.tier)
+        if resp.get("ok") and not args.series:
+            del resp["series"]
+    elif args.cmd == "log-stats":
+        resp = conn.request("log_stats", instance=args.instance)
+    else:
+        if args.follow:
+            conn.request("subscribe")
+        resp = conn.request("tail", instance=args.instance, lines=args.lines,
+                            level=args.level, logger=args.logger)
+        if resp.get("ok"):
+            sys.stdout.write("".join(resp["lines"]))
+            sys.stdout.flush()
+            if args.follow:
+                conn.sock.settimeout(None)
+                log = LogParser(0)
+                flt = LogFilter(parse_level(args.level) if args.level else TRACE, args.logger)
+                try:
+                    for msg in conn.messages():
+                        if msg.get("event") == "output" and msg.get("instance") == args.instance:
+                            lines = msg["text"].splitlines(keepends=True)
+                            if flt.active:
+                                lines = [r.line for r in log.feed(lines) if flt.accepts(r)]
+                            sys.stdout.write("".join(lines))
+                            sys.stdout.flush()
+                except KeyboardInterrupt:
+                    pass
+            conn.close()
+            return 0
+
+    conn.close()
+    print(json.dumps(resp, indent=2))
+    return 0 if resp.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
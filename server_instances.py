@@ -0,0 +1,213 @@
+import os
+import sys
+import json
+import shutil
+import socket
+
+from jvm_profiles import DEFAULT_PROFILE, build_java_args
+
+# ---------- CONFIGURATION ----------
+
+INSTANCES_FILE = "instances.json"
+INSTANCES_DIR = "instances"
+MAIN_INSTANCE = "main"          # the original server rooted at the launcher folder
+
+BASE_PORT = 5520                # Hytale's default QUIC/UDP port
+PORT_SPAN = 100                 # ports searched above BASE_PORT
+BIND_HOST = "0.0.0.0"
+
+# Point the launcher at another "java", e.g. fake_server.py for load tests
+JAVA_ENV = "HYTALE_JAVA"
+
+
+# ---------- CONFIG ----------
+
+class InstanceConfig:
+    """One server: its working directory, port, heap, profile and scheduling."""
+
+    FIELDS = ("name", "root", "port", "min_ram", "max_ram", "profile", "cpus", "nice",
+              "stop_deadline", "poll_command")
+
+    def __init__(self, name, root, port, min_ram=4, max_ram=6,
+                 profile=DEFAULT_PROFILE, cpus=None, nice=0, stop_deadline=None,
+                 poll_command=None):
+        self.name = name
+        self.root = root
+        self.port = port
+        self.min_ram = min_ram
+        self.max_ram = max_ram
+        self.profile = profile
+        self.cpus = cpus        # None = all CPUs, "auto" = share of the host, or a list
+        self.nice = nice
+        self.stop_deadline = stop_deadline     # seconds from /stop until SIGKILL (None = default)
+        self.poll_command = poll_command       # console command whose reply carries metrics
+
+    def to_dict(self):
+        return {f: getattr(self, f) for f in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{f: data[f] for f in cls.FIELDS if f in data})
+
+    @property
+    def log_dir(self):
+        return os.path.join(self.root, "logs")
+
+    @property
+    def log_file(self):
+        return os.path.join(self.log_dir, "server.log")
+
+
+def java_command():
+    """argv prefix that starts the JVM ($HYTALE_JAVA or java; .py runs under this Python)."""
+    java = os.environ.get(JAVA_ENV) or "java"
+    if java.endswith(".py"):
+        return [sys.executable, java]
+    return [java]
+
+
+def port_free(port, host=BIND_HOST):
+    """True when nothing on this host holds the UDP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        try:
+            s.bind((host, port))
+        except OSError:
+            return False
+    return True
+
+
+def host_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+# ---------- MANAGER ----------
+
+class InstanceManager:
+    """Instance configs persisted in instances.json; every instance shares one
+    HytaleServer.jar and one read-only Assets.zip."""
+
+    def __init__(self, app_dir):
+        self.app_dir = app_dir
+        self.path = os.path.join(app_dir, INSTANCES_FILE)
+        self.jar = os.path.join(app_dir, "HytaleServer.jar")
+        self.assets = os.path.join(app_dir, "..", "Assets.zip")
+        self.instances = {}
+
+        if os.path.isfile(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for data in json.load(f):
+                    cfg = InstanceConfig.from_dict(data)
+                    self.instances[cfg.name] = cfg
+
+        if MAIN_INSTANCE not in self.instances:
+            self.instances = {
+                MAIN_INSTANCE: InstanceConfig(MAIN_INSTANCE, app_dir, BASE_PORT),
+                **self.instances,
+            }
+        self.instances[MAIN_INSTANCE].root = app_dir
+
+    def __iter__(self):
+        return iter(self.instances.values())
+
+    def get(self, name):
+        return self.instances[name]
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([cfg.to_dict() for cfg in self], f, indent=4)
+        os.replace(tmp, self.path)
+
+    # ----- creation -----
+
+    def allocate_port(self):
+        taken = {cfg.port for cfg in self}
+        for port in range(BASE_PORT, BASE_PORT + PORT_SPAN):
+            if port not in taken and port_free(port):
+                return port
+        raise RuntimeError(f"No free port in {BASE_PORT}-{BASE_PORT + PORT_SPAN - 1}")
+
+    def create(self, name=None, **settings):
+        if name is None:
+            n = len(self.instances) + 1
+            while f"world{n}" in self.instances:
+                n += 1
+            name = f"world{n}"
+        if name in self.instances:
+            raise ValueError(f"Instance {name!r} already exists")
+
+        settings.setdefault("cpus", "auto")
+        root = os.path.join(self.app_dir, INSTANCES_DIR, name)
+        os.makedirs(os.path.join(root, "logs"), exist_ok=True)
+        cfg = InstanceConfig(name, root, self.allocate_port(), **settings)
+        self.instances[name] = cfg
+        self.save()
+        return cfg
+
+    # ----- launch -----
+
+    def command(self, cfg):
+        return [
+            *self.scheduling_prefix(cfg),
+            *java_command(),
+            *build_java_args(cfg.profile, cfg.min_ram, cfg.max_ram),
+            "-jar",
+            self.jar,
+            "--assets",
+            self.assets,
+            "--bind",
+            f"{BIND_HOST}:{cfg.port}",
+            "--auth-mode",
+            "offline",
+        ]
+
+    def cpu_plan(self):
+        """CPU set per instance. "auto" instances share the CPUs nobody pinned
+        explicitly in disjoint slices; while any exist, unpinned (None)
+        instances get a slice too instead of floating over the others'."""
+        cpus = host_cpus()
+        plan = {}
+        pinned = set()
+        for cfg in self:
+            if isinstance(cfg.cpus, list):
+                plan[cfg.name] = [c for c in cfg.cpus if c in cpus] or cpus
+                pinned.update(plan[cfg.name])
+        if any(cfg.cpus == "auto" for cfg in self):
+            pool = [c for c in cpus if c not in pinned] or cpus
+            shared = [cfg for cfg in self if cfg.cpus in (None, "auto")]
+            share = max(1, len(pool) // len(shared))
+            for i, cfg in enumerate(shared):
+                chunk = pool[i * share:(i + 1) * share] if len(pool) >= len(shared) else pool
+                plan[cfg.name] = chunk or pool
+        return plan
+
+    def scheduling_prefix(self, cfg):
+        """taskset/nice argv in front of the JVM, so affinity and priority are
+        set before its first thread starts. POSIX only; empty when there is
+        nothing to apply or the tool is missing (see apply_scheduling)."""
+        if sys.platform == "win32":
+            return []
+        prefix = []
+        cpus = self.cpu_plan().get(cfg.name)
+        if cpus and shutil.which("taskset"):
+            prefix += ["taskset", "-c", ",".join(map(str, cpus))]
+        if cfg.nice and shutil.which("nice"):
+            prefix += ["nice", "-n", str(cfg.nice)]
+        return prefix
+
+    def apply_scheduling(self, cfg, pid):
+        """Fallback for a host without taskset/nice: set affinity and priority
+        on the spawned process. Threads the JVM started before this keep
+        the old settings, so the argv prefix is preferred."""
+        if sys.platform == "win32":
+            return
+        cpus = self.cpu_plan().get(cfg.name)
+        try:
+            if cpus and hasattr(os, "sched_setaffinity") and not shutil.which("taskset"):
+                os.sched_setaffinity(pid, cpus)
+            if cfg.nice and not shutil.which("nice"):
+                os.setpriority(os.PRIO_PROCESS, pid, cfg.nice)
+        except OSError:
+            pass        # the child already exited
@@ -0,0 +1,145 @@
+import re
+from collections import deque
+
+# ---------- CONFIGURATION ----------
+
+LEVELS = ("TRACE", "DEBUG", "INFO", "WARN", "ERROR", "FATAL")
+TRACE, DEBUG, INFO, WARN, ERROR, FATAL = range(len(LEVELS))
+
+# java.util.logging and other spellings folded onto LEVELS
+LEVEL_ALIASES = {
+    "FINEST": TRACE, "FINER": TRACE, "FINE": DEBUG, "CONFIG": INFO,
+    "WARNING": WARN, "SEVERE": ERROR, "CRITICAL": FATAL,
+    **{name: i for i, name in enumerate(LEVELS)},
+}
+
+LOG_HISTORY = 20000             # parsed lines kept per instance for filtered views
+LAUNCHER_LOGGER = "Launcher"    # logger given to the launcher's own console notes
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[\d;]*m")
+
+# Line formats, most likely first. The parser remembers which one matched last
+# and tries it first, so a steady stream costs one regex per line.
+LINE_FORMATS = [
+    # Hytale: [2026/01/13 18:33:20   INFO]      [World|default] message
+    re.compile(r"\[(?P<ts>\d{4}/\d\d/\d\d \d\d:\d\d:\d\d(?:\.\d+)?)\s+(?P<level>[A-Z]+)\]"
+               r"\s+\[(?P<logger>[^\]]*)\]\s?"),
+    # log4j console: [18:33:20] [Server thread/INFO] [logger]: message
+    re.compile(r"\[(?P<ts>\d\d:\d\d:\d\d)\] \[(?P<thread>[^\]/]+)/(?P<level>[A-Z]+)\]"
+               r"(?: \[(?P<logger>[^\]]+)\])?:? ?"),
+    # logback/slf4j: 2026-01-13 18:33:20.123 INFO [main] com.example.Foo - message
+    re.compile(r"(?P<ts>\d{4}-\d\d-\d\d[ T]\d\d:\d\d:\d\d(?:[.,]\d+)?)\s+(?P<level>[A-Z]+)"
+               r"\s+\[(?P<thread>[^\]]+)\]\s+(?P<logger>\S+)\s+-\s?"),
+]
+
+
+def parse_level(name):
+    """Level index for a name like "warn" or "SEVERE"; ValueError if unknown."""
+    try:
+        return LEVEL_ALIASES[name.upper()]
+    except KeyError:
+        raise ValueError(f"unknown log level {name!r}")
+
+
+# ---------- RECORDS ----------
+
+class LogRecord:
+    __slots__ = ("ts", "level", "thread", "logger", "line")
+
+    def __init__(self, ts, level, thread, logger, line):
+        self.ts = ts
+        self.level = level
+        self.thread = thread
+        self.logger = logger
+        self.line = line
+
+
+class LogFilter:
+    """Minimum level and/or one logger; the default passes everything."""
+
+    def __init__(self, min_level=TRACE, logger=None):
+        self.min_level = min_level
+        self.logger = logger
+
+    @property
+    def active(self):
+        return self.min_level > TRACE or self.logger is not None
+
+    def accepts(self, record):
+        return record.level >= self.min_level and (self.logger is None or record.logger == self.logger)
+
+
+# ---------- PARSER ----------
+
+class LogParser:
+    """Streaming line parser with per-level counters and a ring of parsed lines.
+
+    Lines that match no format (stack traces, wrapped messages) inherit the
+    fields of the line before them, so a filtered view keeps them together.
+    """
+
+    def __init__(self, history=LOG_HISTORY):
+        self.records = deque(maxlen=history)
+        self.counts = [0] * len(LEVELS)
+        self.loggers = {}
+        self.last = LogRecord(None, INFO, None, None, "")
+        self.fast = 0
+
+    def parse_line(self, line):
+        plain = ANSI_ESCAPE.sub("", line) if "\x1b" in line else line
+        m = LINE_FORMATS[self.fast].match(plain)
+        if m is None:
+            for i, fmt in enumerate(LINE_FORMATS):
+                if i != self.fast:
+                    m = fmt.match(plain)
+                    if m:
+                        self.fast = i
+                        break
+        if m is None:
+            prev = self.last
+            return LogRecord(None, prev.level, prev.thread, prev.logger, line)
+
+        groups = m.groupdict()
+        level = LEVEL_ALIASES.get(groups["level"], self.last.level)
+        return LogRecord(groups["ts"], level, groups.get("thread"), groups.get("logger"), line)
+
+    def feed(self, lines):
+        """Parse whole lines (keepends) and return their records."""
+        out = []
+        for line in lines:
+            record = self.parse_line(line)
+            self.add(record)
+            out.append(record)
+        return out
+
+    def annotate(self, text, level=INFO, logger=LAUNCHER_LOGGER):
+        """Store launcher-side text with fixed fields so views can rebuild it."""
+        out = []
+        for line in text.splitlines(keepends=True):
+            record = LogRecord(None, level, None, logger, line)
+            self.records.append(record)
+            out.append(record)
+        return out
+
+    def add(self, record):
+        self.records.append(record)
+        self.counts[record.level] += 1
+        if record.logger is not None:
+            self.loggers[record.logger] = self.loggers.get(record.logger, 0) + 1
+        self.last = record
+
+    def view(self, flt, limit=None):
+        """Lines in the ring that pass the filter, oldest first."""
+        lines = [r.line for r in self.records if flt.accepts(r)]
+        return lines[-limit:] if limit else lines
+
+    def stats(self):
+        return {
+            "levels": {LEVELS[i]: n for i, n in enumerate(self.counts)},
+            "loggers": dict(sorted(self.loggers.items(), key=lambda kv: -kv[1])),
+        }
+
+    def summary(self, min_level=INFO):
+        """Compact counter line, e.g. "INFO 120  WARN 3  ERROR 1"."""
+        return "  ".join(f"{LEVELS[i]} {n}" for i, n in enumerate(self.counts)
+                         if i >= min_level and n)
@@ -0,0 +1,210 @@
+import re
+import math
+import time
+import asyncio
+from array import array
+
+# ---------- CONFIGURATION ----------
+
+# name -> (help text, regex whose "value" group is the reading). The regexes are
+# folded into one alternation, run only on lines containing one of METRIC_KEYWORDS.
+METRICS = {
+    "tps": ("Server ticks per second", r"\bTPS\b[^\d\n]{0,20}(?P<value>\d+(?:\.\d+)?)"),
+    "tick_ms": ("Average tick duration in milliseconds",
+                r"(?i:\bMSPT\b|tick (?:time|duration))[^\d\n]{0,20}(?P<value>\d+(?:\.\d+)?)\s*ms"),
+    "lag_ms": ("Milliseconds the server fell behind",
+               r"(?i:can't keep up|running behind|behind by)\D{0,60}?(?P<value>\d+)\s*ms"),
+    "players": ("Players online",
+                r"(?i:there are |players? online:?\s*|online players:?\s*)(?P<value>\d+)"),
+}
+PLAYER_JOIN = r"(?i:\b(?:joined the (?:game|server)|has joined)\b)"
+PLAYER_LEAVE = r"(?i:\b(?:left the (?:game|server)|has (?:left|disconnected))\b)"
+# lowercase words every pattern above needs; a cheap prefilter for ordinary lines
+METRIC_KEYWORDS = ("tps", "mspt", "tick", "behind", "keep up", "there are", "online",
+                   "joined", "left", "disconnected")
+
+POLL_INTERVAL = 15.0            # seconds between poll commands, when one is configured
+
+# (bucket seconds, buckets kept): 10 min at 1 s, 2 h at 10 s, 24 h at 1 min
+METRIC_TIERS = ((1, 600), (10, 720), (60, 1440))
+
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9520             # Prometheus scrape port; 0 disables the exporter
+METRIC_PREFIX = "hytale_"
+
+
+# ---------- STORE ----------
+
+class Tier:
+    """Fixed-size ring of (bucket start, mean, max) in flat float arrays."""
+
+    def __init__(self, bucket, size):
+        self.bucket = bucket
+        self.size = size
+        self.times = array("d", [0.0]) * size
+        self.means = array("d", [0.0]) * size
+        self.maxes = array("d", [0.0]) * size
+        self.count = 0          # buckets written, ever
+        self.open_at = None     # start of the bucket being accumulated
+        self.sum = 0.0
+        self.n = 0
+        self.max = -math.inf
+
+    def add(self, value, now):
+        start = now - now % self.bucket
+        if self.open_at is not None and start != self.open_at:
+            self.flush()
+        self.open_at = start
+        self.sum += value
+        self.n += 1
+        if value > self.max:
+            self.max = value
+
+    def flush(self):
+        if not self.n:
+            return
+        i = self.count % self.size
+        self.times[i] = self.open_at
+        self.means[i] = self.sum / self.n
+        self.maxes[i] = self.max
+        self.count += 1
+        self.sum = 0.0
+        self.n = 0
+        self.max = -math.inf
+
+    def points(self, field="means"):
+        """(time, value) oldest first, including the open bucket."""
+        values = getattr(self, field)
+        n = min(self.count, self.size)
+        first = self.count - n
+        out = [(self.times[i % self.size], values[i % self.size]) for i in range(first, self.count)]
+        if self.n:
+            out.append((self.open_at, self.sum / self.n if field == "means" else self.max))
+        return out
+
+
+class MetricSeries:
+    """One metric: latest value plus every downsampling tier."""
+
+    def __init__(self, tiers=METRIC_TIERS):
+        self.tiers = [Tier(bucket, size) for bucket, size in tiers]
+        self.value = None
+        self.updated = None
+
+    def add(self, value, now=None):
+        now = time.time() if now is None else now
+        self.value = value
+        self.updated = now
+        for tier in self.tiers:
+            tier.add(value, now)
+
+
+class MetricStore:
+    """Metrics of one server, fed from its console output."""
+
+    def __init__(self):
+        self.series = {name: MetricSeries() for name in METRICS}
+        names = list(METRICS)
+        parts = [f"(?P<m{i}>{METRICS[name][1].replace('(?P<value>', f'(?P<v{i}>')})"
+                 for i, name in enumerate(names)]
+        parts.append(f"(?P<join>{PLAYER_JOIN})")
+        parts.append(f"(?P<leave>{PLAYER_LEAVE})")
+        self.names = names
+        self.regex = re.compile("|".join(parts))
+        self.hint = re.compile("|".join(map(re.escape, METRIC_KEYWORDS)))
+
+    def feed(self, lines, now=None):
+        """Scan whole lines; returns {metric: value} for what was found."""
+        found = {}
+        for line in lines:
+            if self.hint.search(line.lower()) is None:
+                continue
+            m = self.regex.search(line)
+            if m is None:
+                continue
+            group = m.lastgroup
+            if group in ("join", "leave"):
+                players = self.series["players"].value
+                if players is None:
+                    continue
+                name, value = "players", max(0.0, players + (1 if group == "join" else -1))
+            else:
+                i = int(group[1:])
+                name, value = self.names[i], float(m.group(f"v{i}"))
+            self.series[name].add(value, now)
+            found[name] = value
+        return found
+
+    def reset_players(self, now=None):
+        self.series["players"].add(0.0, now)
+
+    def latest(self):
+        return {name: s.value for name, s in self.series.items() if s.value is not None}
+
+    def points(self, name, tier=0, field="means"):
+        return self.series[name].tiers[tier].points(field)
+
+
+# ---------- POLLING ----------
+
+async def poll_loop(pipeline, command, interval=POLL_INTERVAL):
+    """Send `command` every `interval` seconds through the command pipeline so
+    its reply is captured as one window and never mixes with typed commands."""
+    while True:
+        await asyncio.sleep(interval)
+        await pipeline.execute(command)
+
+
+# ---------- PROMETHEUS ----------
+
+def prometheus_text(stores):
+    """Exposition format (text 0.0.4) for {instance: MetricStore}."""
+    lines = []
+    for name, (help_text, _) in METRICS.items():
+        metric = METRIC_PREFIX + name
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} gauge")
+        for instance, store in sorted(stores.items()):
+            s = store.series[name]
+            if s.value is not None:
+                lines.append(f'{metric}{{instance="{instance}"}} {s.value:g}')
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Minimal HTTP endpoint serving /metrics from the core's event loop."""
+
+    def __init__(self, stores, host=METRICS_HOST, port=METRICS_PORT):
+        self.stores = stores
+        self.host = host
+        self.port = port
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.client, self.host, self.port)
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+
+    async def client(self, reader, writer):
+        try:
+            request = await asyncio.wait_for(reader.readline(), 5)
+            while (await asyncio.wait_for(reader.readline(), 5)) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request.split()
+            if len(parts) >= 2 and parts[0] == b"GET" and parts[1].split(b"?")[0] in (b"/", b"/metrics"):
+                status, body = "200 OK", prometheus_text(self.stores()).encode("utf-8")
+            else:
+                status, body = "404 Not Found", b"not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode("ascii") + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
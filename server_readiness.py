@@ -0,0 +1,143 @@
+import os
+import re
+import json
+import time
+
+# ---------- CONFIGURATION ----------
+
+# Lines that mean the server finished booting and accepts players.
+# Override by placing one regex per line in ready_patterns.txt next to the launcher.
+READY_PATTERNS = [
+    r"Hytale Server Booted",
+    r"Server (?:started|ready)",
+    r"Universe ready",
+    r"Listening on .*:\d+",
+]
+READY_PATTERNS_FILE = "ready_patterns.txt"
+
+BOOT_HISTORY_FILE = "boot_history.json"
+BOOT_HISTORY_LIMIT = 500
+BOOT_BUCKETS = (5, 10, 15, 20, 30, 45, 60, 90, 120, 180)   # seconds, upper bounds
+
+
+# ---------- MATCHER ----------
+
+def load_ready_patterns(app_dir):
+    """Patterns from ready_patterns.txt if present, otherwise the defaults."""
+    path = os.path.join(app_dir, READY_PATTERNS_FILE)
+    if not os.path.isfile(path):
+        return list(READY_PATTERNS)
+    with open(path, "r", encoding="utf-8") as f:
+        patterns = [l.strip() for l in f if l.strip() and not l.startswith("#")]
+    return patterns or list(READY_PATTERNS)
+
+
+class PatternSet:
+    """Several regexes compiled into one alternation so each line is scanned once."""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        if self.patterns:
+            self.regex = re.compile(
+                "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(self.patterns))
+            )
+        else:
+            self.regex = None
+
+    def match(self, line):
+        """Return the source pattern that matched the line, or None."""
+        if self.regex is None:
+            return None
+        m = self.regex.search(line)
+        if not m:
+            return None
+        return self.patterns[int(m.lastgroup[1:])]
+
+
+# ---------- BOOT HISTORY ----------
+
+class BootHistory:
+    """Persisted boot durations with the addon set and heap flags of each boot."""
+
+    def __init__(self, log_dir):
+        self.path = os.path.join(log_dir, BOOT_HISTORY_FILE)
+        self.records = []
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.records = json.load(f)
+            except (OSError, ValueError):
+                self.records = []
+
+    def record(self, duration, addons, min_ram, max_ram, pattern=None, instance=None,
+               fingerprint=None):
+        self.records.append({
+            "time": time.time(),
+            "instance": instance,
+            "fingerprint": fingerprint,
+            "duration": round(duration, 3),
+            "addons": sorted(addons),
+            "min_ram": min_ram,
+            "max_ram": max_ram,
+            "pattern": pattern,
+        })
+        del self.records[:-BOOT_HISTORY_LIMIT]
+        self.save()
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.records, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def histogram(self):
+        """Counts per BOOT_BUCKETS bucket; the last entry is the overflow bucket."""
+        counts = [0] * (len(BOOT_BUCKETS) + 1)
+        for r in self.records:
+            for i, upper in enumerate(BOOT_BUCKETS):
+                if r["duration"] <= upper:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def addon_impact(self):
+        """Mean boot time with vs without each addon, slowest first."""
+        if not self.records:
+            return []
+        total = sum(r["duration"] for r in self.records)
+        with_addon = {}
+        for r in self.records:
+            for addon in r["addons"]:
+                n, s = with_addon.get(addon, (0, 0.0))
+                with_addon[addon] = (n + 1, s + r["duration"])
+
+        rows = []
+        for addon, (n, s) in with_addon.items():
+            rest = len(self.records) - n
+            without = (total - s) / rest if rest else None
+            rows.append((addon, s / n, without, n))
+        rows.sort(key=lambda r: r[1] - (r[2] if r[2] is not None else r[1]), reverse=True)
+        return rows
+
+    def report(self):
+        """Plain-text histogram and addon table for the console."""
+        if not self.records:
+            return "No boots recorded yet.\n"
+
+        counts = self.histogram()
+        peak = max(counts) or 1
+        labels = [f"<={b}s" for b in BOOT_BUCKETS] + [f">{BOOT_BUCKETS[-1]}s"]
+        lines = [f"Boot times ({len(self.records)} boots):"]
+        for label, n in zip(labels, counts):
+            if n:
+                lines.append(f"  {label:>6} {'#' * max(1, n * 30 // peak)} {n}")
+
+        impact = self.addon_impact()
+        if impact:
+            lines.append("Addon impact (mean boot with / without):")
+            for addon, mean_with, mean_without, n in impact:
+                without = f"{mean_without:.1f}s" if mean_without is not None else "n/a"
+                lines.append(f"  {addon}: {mean_with:.1f}s / {without} ({n} boots)")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,415 @@
+import os
+import sys
+import json
+import time
+import codecs
+import asyncio
+import threading
+from collections import deque
+
+from server_readiness import PatternSet
+from crash_guard import Backoff, CrashLoopBreaker, classify_crash, CRASH_TAIL_LINES
+from jvm_profiles import percentile
+
+# ---------- CONFIGURATION ----------
+
+READ_CHUNK = 64 * 1024         # bytes per non-blocking stdout read
+STDIN_QUEUE_LIMIT = 1000       # queued console commands per process
+
+# Shutdown: /stop, then SIGTERM, then SIGKILL. The deadline bounds /stop -> SIGKILL.
+STOP_DEADLINE = 60.0           # seconds
+TERM_GRACE = 10.0              # tail of the deadline reserved for SIGTERM
+KILL_WAIT = 5.0                # wait for the kernel to reap after SIGKILL
+SAVE_PATTERNS = [
+    r"Saved? (?:all )?(?:worlds?|chunks?|universe|players?)",
+    r"Shutdown complete",
+    r"Server stopped",
+]
+SHUTDOWN_HISTORY_FILE = "shutdown_history.json"
+SHUTDOWN_HISTORY_LIMIT = 500
+
+
+# ---------- LISTENER ----------
+
+class SupervisorListener:
+    """Callbacks fired on the supervisor thread. Override what you need.
+
+    Output arrives as whole-line chunks (one call per read, not per line).
+    """
+
+    def on_output(self, name, text):
+        pass
+
+    def on_booting(self, name):
+        pass
+
+    def on_spawned(self, name, pid):
+        pass
+
+    def on_ready(self, name, pattern, duration):
+        pass
+
+    def on_crashed(self, name, summary):
+        pass
+
+    def on_shutdown(self, name, report):
+        pass
+
+    def on_stopped(self, name, crashed):
+        pass
+
+
+# ---------- PROCESS ----------
+
+class ServerProcess:
+    """One supervised server: spawn/restart loop, chunked stdout, queued stdin."""
+
+    def __init__(self, name, cmd, cwd, log_file, listener,
+                 auto_restart=True, ready_patterns=(), min_ram=None, max_ram=None,
+                 after_spawn=None, stop_deadline=STOP_DEADLINE):
+        self.name = name
+        self.cmd = list(cmd)
+        self.cwd = cwd
+        self.log_file = log_file
+        self.listener = listener
+        self.auto_restart = auto_restart
+        self.min_ram = min_ram
+        self.max_ram = max_ram
+        self.after_spawn = after_spawn      # called with the new pid, on the loop
+        self.ready_matcher = PatternSet(ready_patterns)
+        self.save_matcher = PatternSet(SAVE_PATTERNS)
+        self.stop_deadline = stop_deadline or STOP_DEADLINE
+
+        self.process = None
+        self.stop_requested = False
+        self.tail = deque(maxlen=CRASH_TAIL_LINES)
+        self.backoff = Backoff()
+        self.breaker = CrashLoopBreaker()
+
+        # created on the supervisor loop in run()
+        self.loop = None
+        self.stdin_queue = None
+        self.stop_event = None
+        self.saved = None
+        self.shutdown_task = None
+
+    @property
+    def pid(self):
+        """PID of the live child, or None between runs."""
+        p = self.process
+        if p is None or p.returncode is not None:
+            return None
+        return p.pid
+
+    # ----- thread-safe API -----
+
+    def send(self, text):
+        """Queue a console line; never blocks the caller."""
+        if self.loop is None or self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self._enqueue, text)
+
+    def stop(self, deadline=None):
+        """Shut down within `deadline` seconds (default: stop_deadline)."""
+        self.stop_requested = True
+        if deadline is not None:
+            self.stop_deadline = deadline
+        if self.loop is None or self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self._request_stop)
+
+    def _enqueue(self, text):
+        try:
+            self.stdin_queue.put_nowait(text)
+        except asyncio.QueueFull:
+            pass
+
+    def _request_stop(self):
+        self.stop_event.set()
+        self.begin_shutdown()
+
+    def begin_shutdown(self):
+        if self.shutdown_task is None and self.pid is not None:
+            self.saved = asyncio.Event()
+            self.shutdown_task = asyncio.ensure_future(self.shutdown(self.process))
+
+    # ----- shutdown -----
+
+    async def shutdown(self, process):
+        """/stop -> save seen -> exit, escalating to SIGTERM and SIGKILL.
+
+        Returns {"phases": [{"phase", "seconds"}...], "total", "saved", "escalated"}.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.stop_deadline
+        term_at = deadline - min(TERM_GRACE, self.stop_deadline / 2)
+        phases = []
+        escalated = None
+
+        async def wait_exit(until, also=None):
+            waits = {asyncio.ensure_future(process.wait())}
+            if also is not None:
+                waits.add(asyncio.ensure_future(also.wait()))
+            try:
+                await asyncio.wait(waits, timeout=max(0.0, until - loop.time()),
+                                   return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for w in waits:
+                    w.cancel()
+            return process.returncode is not None
+
+        mark = started
+        self._enqueue("/stop")
+        exited = await wait_exit(term_at, self.saved)
+        if self.saved.is_set():
+            phases.append({"phase": "save", "seconds": loop.time() - mark})
+            mark = loop.time()
+            exited = await wait_exit(term_at)
+            phases.append({"phase": "exit", "seconds": loop.time() - mark})
+        else:
+            phases.append({"phase": "stop", "seconds": loop.time() - mark})
+
+        for phase, signal_child in (("sigterm", process.terminate), ("sigkill", process.kill)):
+            if exited:
+                break
+            escalated = phase
+            mark = loop.time()
+            try:
+                signal_child()
+            except ProcessLookupError:
+                pass
+            exited = await wait_exit(deadline if phase == "sigterm" else mark + KILL_WAIT)
+            phases.append({"phase": phase, "seconds": loop.time() - mark})
+
+        for p in phases:
+            p["seconds"] = round(p["seconds"], 3)
+        return {
+            "phases": phases,
+            "total": round(loop.time() - started, 3),
+            "saved": self.saved.is_set(),
+            "escalated": escalated,
+        }
+
+    # ----- supervisor loop -----
+
+    async def run(self):
+        self.loop = asyncio.get_running_loop()
+        self.stdin_queue = asyncio.Queue(STDIN_QUEUE_LIMIT)
+        self.stop_event = asyncio.Event()
+        if self.stop_requested:
+            self.stop_event.set()
+
+        while True:
+            started = time.monotonic()
+            try:
+                exit_code = await self.run_once()
+            except OSError as e:
+                self.listener.on_output(self.name, f"\n[Failed to start server: {e}]\n")
+                self.listener.on_stopped(self.name, True)
+                return
+
+            if self.stop_requested:
+                if self.shutdown_task is not None:
+                    report = await self.shutdown_task
+                    self.shutdown_task = None
+                    self.listener.on_shutdown(self.name, report)
+                self.listener.on_stopped(self.name, False)
+                return
+
+            report = classify_crash(exit_code, self.tail)
+            self.listener.on_output(self.name, "\n[Server crashed]\n")
+            self.listener.on_crashed(self.name, report.summary())
+            if not self.auto_restart:
+                self.listener.on_stopped(self.name, True)
+                return
+
+            if self.breaker.record():
+                self.listener.on_output(
+                    self.name,
+                    f"[Crash loop: {self.breaker.limit} crashes within "
+                    f"{self.breaker.window}s – auto-restart paused]\n",
+                )
+                self.listener.on_stopped(self.name, True)
+                return
+
+            delay = self.backoff.next_delay(time.monotonic() - started)
+            self.listener.on_output(self.name, f"Restarting server in {delay:.1f}s...\n")
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), delay)
+                self.listener.on_stopped(self.name, False)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+    async def spawn(self):
+        return await asyncio.create_subprocess_exec(
+            *self.cmd,
+            cwd=self.cwd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            creationflags=0x08000000 if sys.platform == "win32" else 0,  # CREATE_NO_WINDOW
+        )
+
+    async def run_once(self):
+        self.listener.on_booting(self.name)
+        self.tail.clear()
+        while not self.stdin_queue.empty():
+            # commands typed while the server was down are dropped, as before
+            self.stdin_queue.get_nowait()
+        self.saved = None
+        self.process = await self.spawn()
+        if self.after_spawn is not None:
+            self.after_spawn(self.process.pid)
+        self.listener.on_spawned(self.name, self.process.pid)
+        if self.stop_event.is_set():
+            # stop() arrived while the process was being spawned
+            self.begin_shutdown()
+
+        writer = asyncio.ensure_future(self.write_stdin(self.process))
+        try:
+            await self.read_stdout(self.process, time.monotonic())
+            return await self.process.wait()
+        finally:
+            writer.cancel()
+
+    async def read_stdout(self, process, boot_started):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        booted = False
+
+        with open(self.log_file, "a", encoding="utf-8", errors="replace") as log:
+            while True:
+                data = await process.stdout.read(READ_CHUNK)
+                if data:
+                    pending += decoder.decode(data)
+                    cut = pending.rfind("\n") + 1
+                    if not cut:
+                        continue
+                    text, pending = pending[:cut], pending[cut:]
+                else:
+                    text, pending = pending + decoder.decode(b"", final=True), ""
+                    if not text:
+                        break
+
+                log.write(text)
+                lines = text.splitlines(keepends=True)
+                self.tail.extend(lines)
+                self.listener.on_output(self.name, text)
+
+                if self.saved is not None and not self.saved.is_set():
+                    if any(self.save_matcher.match(line) for line in lines):
+                        self.saved.set()
+
+                if not booted:
+                    for line in lines:
+                        pattern = self.ready_matcher.match(line)
+                        if pattern:
+                            booted = True
+                            self.listener.on_ready(self.name, pattern, time.monotonic() - boot_started)
+                            break
+
+                if not data:
+                    break
+
+    async def write_stdin(self, process):
+        while True:
+            text = await self.stdin_queue.get()
+            if process.returncode is not None:
+                continue
+            try:
+                process.stdin.write((text + "\n").encode("utf-8"))
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+
+# ---------- SUPERVISOR ----------
+
+class Supervisor:
+    """One asyncio loop supervising any number of ServerProcess objects."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.processes = {}
+        self.thread = None
+
+    def start_thread(self):
+        """Run the loop on a single background thread (used next to a GUI loop)."""
+        if self.thread is None:
+            self.thread = threading.Thread(
+                target=self.loop.run_forever, name="server-supervisor", daemon=True
+            )
+            self.thread.start()
+        return self
+
+    def add(self, proc):
+        """Start supervising a process; safe to call from any thread."""
+        self.processes[proc.name] = proc
+
+        def done(_):
+            if self.processes.get(proc.name) is proc:
+                del self.processes[proc.name]
+
+        future = asyncio.run_coroutine_threadsafe(proc.run(), self.loop)
+        future.add_done_callback(done)
+        return future
+
+    def get(self, name):
+        return self.processes.get(name)
+
+    def stop_all(self, deadline=None):
+        for proc in list(self.processes.values()):
+            proc.stop(deadline)
+
+
+# ---------- SHUTDOWN HISTORY ----------
+
+class ShutdownHistory:
+    """Persisted shutdown reports, so host restarts can be planned around them."""
+
+    def __init__(self, log_dir):
+        self.path = os.path.join(log_dir, SHUTDOWN_HISTORY_FILE)
+        self.records = []
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.records = json.load(f)
+            except (OSError, ValueError):
+                self.records = []
+
+    def record(self, report, instance=None):
+        self.records.append({"time": time.time(), "instance": instance, **report})
+        self.records = self.records[-SHUTDOWN_HISTORY_LIMIT:]
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.records, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def report(self, instance=None):
+        records = [r for r in self.records if instance is None or r.get("instance") == instance]
+        if not records:
+            return "No shutdowns recorded yet.\n"
+        totals = sorted(r["total"] for r in records)
+        lines = [
+            f"Shutdowns ({len(records)}): p50 {percentile(totals, 50):.1f}s, "
+            f"p95 {percentile(totals, 95):.1f}s, max {totals[-1]:.1f}s",
+        ]
+        by_phase = {}
+        for r in records:
+            for p in r["phases"]:
+                by_phase.setdefault(p["phase"], []).append(p["seconds"])
+        for phase in ("stop", "save", "exit", "sigterm", "sigkill"):
+            values = sorted(by_phase.get(phase, ()))
+            if values:
+                lines.append(f"  {phase:<8} {len(values):4d}x  p50 {percentile(values, 50):6.1f}s  "
+                             f"max {values[-1]:6.1f}s")
+        escalated = sum(1 for r in records if r["escalated"])
+        lines.append(f"  escalated past /stop: {escalated} of {len(records)}")
+        return "\n".join(lines) + "\n"
+
+
+def format_shutdown(report):
+    phases = ", ".join(f"{p['phase']} {p['seconds']:.1f}s" for p in report["phases"])
+    return f"[Shutdown in {report['total']:.1f}s: {phases}]\n"
@@ -0,0 +1,168 @@
+import os
+import csv
+import time
+from collections import deque
+
+# ---------- CONFIGURATION ----------
+
+TELEMETRY_INTERVAL_MS = 1000   # how often the launcher samples the server process
+TELEMETRY_HISTORY = 600        # samples kept in the ring buffer (10 min at 1s)
+
+CSV_FIELDS = (
+    "time", "cpu_percent", "rss_bytes", "threads",
+    "read_bytes", "write_bytes", "voluntary_ctxt", "nonvoluntary_ctxt",
+)
+
+try:
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+except (AttributeError, ValueError, OSError):
+    CLOCK_TICKS = 100
+
+try:
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    PAGE_SIZE = 4096
+
+
+# ---------- SAMPLES ----------
+
+class ProcSample:
+    """One reading of a process' resource usage."""
+    __slots__ = CSV_FIELDS
+
+    def __init__(self, **values):
+        for field in CSV_FIELDS:
+            setattr(self, field, values.get(field, 0))
+
+    def as_row(self):
+        return [getattr(self, field) for field in CSV_FIELDS]
+
+
+def proc_supported():
+    """True when /proc exposes per-process stats (Linux)."""
+    return os.path.isfile("/proc/self/stat")
+
+
+# ---------- SAMPLER ----------
+
+class ProcSampler:
+    """Reads /proc/<pid>/{stat,status,io} without spawning anything.
+
+    The files are opened once and re-read with pread, so a sample costs a
+    handful of syscalls. Samples land in a fixed-size deque.
+    """
+
+    def __init__(self, history=TELEMETRY_HISTORY):
+        self.samples = deque(maxlen=history)
+        self.pid = None
+        self._fds = {}
+        self._last_cpu = None
+        self._last_time = None
+
+    # ----- lifecycle -----
+
+    def attach(self, pid):
+        if pid == self.pid:
+            return
+        self.detach()
+        self.pid = pid
+        for name in ("stat", "status", "io"):
+            try:
+                self._fds[name] = os.open(f"/proc/{pid}/{name}", os.O_RDONLY)
+            except OSError:
+                # io is root/owner only on some kernels; stat vanishes with the process
+                pass
+
+    def detach(self):
+        for fd in self._fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds.clear()
+        self.pid = None
+        self._last_cpu = None
+        self._last_time = None
+
+    # ----- reading -----
+
+    def _read(self, name):
+        fd = self._fds.get(name)
+        if fd is None:
+            return None
+        try:
+            return os.pread(fd, 8192, 0).decode("ascii", "replace")
+        except OSError:
+            return None
+
+    def sample(self):
+        """Take one sample; returns it, or None if the process is gone."""
+        stat = self._read("stat")
+        if not stat:
+            return None
+
+        # comm may contain spaces/parens, so split after the last ')'
+        fields = stat[stat.rfind(")") + 2:].split()
+        cpu_ticks = int(fields[11]) + int(fields[12])   # utime + stime
+        threads = int(fields[17])
+        rss = int(fields[21]) * PAGE_SIZE
+
+        now = time.monotonic()
+        cpu_percent = 0.0
+        if self._last_cpu is not None and now > self._last_time:
+            cpu_percent = (cpu_ticks - self._last_cpu) / CLOCK_TICKS / (now - self._last_time) * 100.0
+        self._last_cpu = cpu_ticks
+        self._last_time = now
+
+        values = {
+            "time": time.time(),
+            "cpu_percent": round(cpu_percent, 1),
+            "rss_bytes": rss,
+            "threads": threads,
+        }
+
+        status = self._read("status")
+        if status:
+            for line in status.splitlines():
+                if line.startswith("voluntary_ctxt_switches:"):
+                    values["voluntary_ctxt"] = int(line.split()[1])
+                elif line.startswith("nonvoluntary_ctxt_switches:"):
+                    values["nonvoluntary_ctxt"] = int(line.split()[1])
+
+        io = self._read("io")
+        if io:
+            for line in io.splitlines():
+                if line.startswith("read_bytes:"):
+                    values["read_bytes"] = int(line.split()[1])
+                elif line.startswith("write_bytes:"):
+                    values["write_bytes"] = int(line.split()[1])
+
+        s = ProcSample(**values)
+        self.samples.append(s)
+        return s
+
+    def series(self, field):
+        """Values of one field across the ring buffer, oldest first."""
+        return [getattr(s, field) for s in self.samples]
+
+    def rate_series(self, field):
+        """Per-second deltas of a cumulative counter (I/O bytes, ctxt switches)."""
+        out = []
+        prev = None
+        for s in self.samples:
+            if prev is not None and s.time > prev.time:
+                out.append(max(0, getattr(s, field) - getattr(prev, field)) / (s.time - prev.time))
+            prev = s
+        return out
+
+
+# ---------- EXPORT ----------
+
+def export_csv(samples, path):
+    """Write samples to a CSV file, one row per sample."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        for s in samples:
+            writer.writerow(s.as_row())
+    return path
@@ -0,0 +1,233 @@
+import sys
+import json
+import heapq
+import random
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+from reconcile_core import ReconcileCore, WRITE_QUIET_MS, RECONCILE_DELAY_MS
+
+# Discrete-event race between the game's cosmetic sync and the editor's
+# cooldown reconcile, on a virtual clock:
+#   python sim_reconcile.py --trials 500
+#   python sim_reconcile.py --sweep quiet_ms=200,400,600,1000 --sweep delay_ms=0,80,250
+#   python sim_reconcile.py --trace login_trace.json
+
+# ---------- CONFIGURATION ----------
+
+POLL_MS = 200                 # editor poll interval (json_gui_editor's QTimer)
+SIM_KEYS = 6                  # pinned keys the game fights over
+SIM_TRIALS = 200
+SIM_SETTLE_S = 10.0           # virtual time after the last game write before scoring
+
+# randomised game behaviour (all times ms)
+GAME_DEFAULTS = {
+    "bursts": 2,              # sync bursts per trial (e.g. login, world change)
+    "burst_gap": 20000,       # mean time between bursts
+    "writes": 4,              # mean writes per burst (at least 1)
+    "write_gap": 350,         # mean gap between writes inside a burst
+    "react_prob": 0.3,        # chance the game re-syncs after seeing our write ...
+    "react_ms": 400,          # ... this long (mean) afterwards
+    "overwrite": 0.7,         # fraction of pinned keys each game write resets
+}
+
+
+# ---------- TRACES ----------
+
+def random_trace(rng, game=GAME_DEFAULTS, keys=SIM_KEYS):
+    """[(t seconds, [key indexes])] of game writes."""
+    trace = []
+    t = 0.5
+    for _ in range(game["bursts"]):
+        for _ in range(max(1, round(rng.expovariate(1 / game["writes"])))):
+            touched = [k for k in range(keys) if rng.random() < game["overwrite"]] or [rng.randrange(keys)]
+            trace.append((t, touched))
+            t += rng.expovariate(1000 / game["write_gap"])
+        t += rng.expovariate(1000 / game["burst_gap"])
+    return trace
+
+
+def load_trace(path, keys=SIM_KEYS):
+    """Scripted trace: JSON list of {"t_ms": ..., "keys": [indexes]} (keys default to all)."""
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    return [(e["t_ms"] / 1000.0, e.get("keys", list(range(keys)))) for e in entries]
+
+
+# ---------- SIMULATION ----------
+
+def simulate(trace, quiet_ms=WRITE_QUIET_MS, delay_ms=RECONCILE_DELAY_MS, poll_ms=POLL_MS,
+             game=GAME_DEFAULTS, keys=SIM_KEYS, seed=0):
+    """Run one trace; returns {won, intent_share, converge_s, editor_writes, game_writes, last_game_s}.
+    intent_share is the fraction of virtual time from the first game write to
+    the end that every pinned key was on disk; converge_s lists, for each time
+    the game broke intent, how long until the editor's write restored it."""
+    if poll_ms <= 0:
+        raise ValueError(f"poll_ms must be positive (got {poll_ms})")
+    rng = random.Random(seed)
+    names = [f"key{i}" for i in range(keys)]
+    allowed = {name: {"mine", "game"} for name in names}
+    core = ReconcileCore(allowed, quiet_ms, delay_ms)
+    core.desired = {name: "mine" for name in names}
+
+    disk = {name: "mine" for name in names}
+    version = seen = 0          # disk version, and the last one the editor has seen
+    reconcile_pending = False
+    editor_writes = game_writes = 0
+    last_game = 0.0
+    converge = []
+    diverged_at = None
+    start = min((t for t, _ in trace), default=0.0)
+    lost_s = 0.0                # time intent was not on disk since `start`
+
+    events = []
+    order = itertools.count()
+    for t, touched in trace:
+        heapq.heappush(events, (t, next(order), "game", touched))
+    end = (trace[-1][0] if trace else 0.0) + SIM_SETTLE_S
+    heapq.heappush(events, (poll_ms / 1000.0, next(order), "poll", None))
+
+    while events:
+        now, _, kind, payload = heapq.heappop(events)
+        if now > end:
+            break
+        if kind == "game":
+            for i in payload:
+                disk[names[i]] = "game"
+            version += 1
+            game_writes += 1
+            last_game = now
+            if diverged_at is None and core.conflicts(disk):
+                diverged_at = now
+        elif kind == "poll":
+            if version != seen:
+                seen = version
+                core.external_write(disk, now)
+            if core.due(now) and not reconcile_pending:
+                reconcile_pending = True
+                heapq.heappush(events, (now + core.delay, next(order), "reconcile", None))
+            heapq.heappush(events, (now + poll_ms / 1000.0, next(order), "poll", None))
+        elif kind == "reconcile":
+            reconcile_pending = False
+            merged = core.merge(disk)
+            if merged != disk:
+                disk = merged
+                version += 1
+                seen = version
+                editor_writes += 1
+                core.seen_write(now)
+                if not core.conflicts(disk) and diverged_at is not None:
+                    converge.append(now - diverged_at)
+                    lost_s += now - diverged_at
+                    diverged_at = None
+                if rng.random() < game["react_prob"]:
+                    # the game noticed our write and pushes its own state again
+                    react = now + rng.expovariate(1000 / game["react_ms"])
+                    touched = [i for i in range(keys) if rng.random() < game["overwrite"]]
+                    if touched and react <= end:
+                        heapq.heappush(events, (react, next(order), "game", touched))
+
+    if diverged_at is not None:
+        lost_s += end - diverged_at
+    span = end - start
+    won = not core.conflicts(disk)
+    return {
+        "won": won,
+        "intent_share": 1.0 - lost_s / span if span > 0 else 1.0,
+        "converge_s": converge,
+        "editor_writes": editor_writes,
+        "game_writes": game_writes,
+        "last_game_s": last_game,
+    }
+
+
+def run_setting(args):
+    """All trials of one parameter setting (a process-pool task)."""
+    params, trials, seed, trace = args
+    game = {**GAME_DEFAULTS, **params.get("game", {})}
+    wins = writes = bursts = 0
+    share = 0.0
+    times = []
+    for trial in range(trials):
+        trial_seed = seed + trial   # same traces for every setting
+        t = trace if trace is not None else random_trace(random.Random(trial_seed), game)
+        r = simulate(t, params["quiet_ms"], params["delay_ms"], params["poll_ms"], game, seed=trial_seed)
+        wins += r["won"]
+        share += r["intent_share"]
+        writes += r["editor_writes"]
+        bursts += game["bursts"] if trace is None else 1
+        times.extend(r["converge_s"])
+    times.sort()
+    return {
+        **{k: params[k] for k in ("quiet_ms", "delay_ms", "poll_ms")},
+        "intent_share": share / trials,
+        "win_rate": wins / trials,
+        "converge_p50_s": times[len(times) // 2] if times else None,
+        "converge_p95_s": times[min(len(times) - 1, int(len(times) * 0.95))] if times else None,
+        "writes_per_burst": writes / bursts,
+    }
+
+
+def sweep(grid, trials=SIM_TRIALS, seed=1, trace=None, workers=None):
+    """Every combination in `grid` ({param: [values]}), one process-pool task each;
+    best settings first (share of time intent was on disk, then win rate,
+    then convergence, then fewer writes). The final win rate alone barely
+    separates settings: the settle period almost always lets the editor write last."""
+    names = list(grid)
+    settings = [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run_setting, [(s, trials, seed, trace) for s in settings]))
+    never = float("inf")
+    return sorted(results, key=lambda r: (
+        -r["intent_share"],
+        -r["win_rate"],
+        never if r["converge_p50_s"] is None else r["converge_p50_s"],
+        r["writes_per_burst"],
+    ))
+
+
+# ---------- MAIN ----------
+
+def parse_sweep(specs):
+    grid = {"quiet_ms": [WRITE_QUIET_MS], "delay_ms": [RECONCILE_DELAY_MS], "poll_ms": [POLL_MS]}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in grid:
+            raise SystemExit(f"unknown sweep parameter {name!r} (use {', '.join(grid)})")
+        grid[name] = [float(v) for v in values.split(",") if v]
+        if any(v <= 0 if name == "poll_ms" else v < 0 for v in grid[name]):
+            raise SystemExit(f"{name} values must be {'positive' if name == 'poll_ms' else 'non-negative'}")
+    return grid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate the editor's reconcile race against the game.")
+    parser.add_argument("--trials", type=int, default=SIM_TRIALS)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--sweep", action="append", default=[], metavar="PARAM=V1,V2",
+                        help="quiet_ms, delay_ms or poll_ms values to try (repeatable)")
+    parser.add_argument("--trace", help="scripted game writes instead of random ones")
+    parser.add_argument("--workers", type=int, help="process pool size (default: CPU count)")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    trace = load_trace(args.trace) if args.trace else None
+    trials = 1 if trace is not None else args.trials
+    results = sweep(parse_sweep(args.sweep), trials, args.seed, trace, args.workers)
+
+    print(f"{'quiet_ms':>9}{'delay_ms':>9}{'poll_ms':>8}{'intent':>8}{'win':>8}{'conv p50':>10}{'conv p95':>10}"
+          f"{'writes/burst':>14}")
+    for r in results:
+        p50 = f"{r['converge_p50_s']:.2f}s" if r["converge_p50_s"] is not None else "-"
+        p95 = f"{r['converge_p95_s']:.2f}s" if r["converge_p95_s"] is not None else "-"
+        print(f"{r['quiet_ms']:>9g}{r['delay_ms']:>9g}{r['poll_ms']:>8g}{r['intent_share']:>8.1%}{r['win_rate']:>8.1%}"
+              f"{p50:>10}{p95:>10}{r['writes_per_burst']:>14.2f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+import os
+import json
+import time
+import zlib
+import hashlib
+from collections import OrderedDict
+
+# ---------- CONFIGURATION ----------
+
+TIMELINE_FILE = "timeline.jsonl"      # one line per version change, oldest first
+OBJECTS_DIR = "objects"               # <sha256> -> zlib(JSON full copy or delta)
+HISTORY_CHAIN_MAX = 20                # deltas in a row before storing a full copy
+HISTORY_CACHE = 32                    # materialised versions kept in memory
+
+
+def canonical(data):
+    """Byte form the hash is taken over; key order and whitespace do not count."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# ---------- STORE ----------
+
+class SkinHistory:
+    """Content-addressed versions of one skin file.
+
+    Each distinct content is stored once under its SHA-256, as a delta
+    (changed and removed top-level keys) against the version before it, with
+    a full copy every HISTORY_CHAIN_MAX versions to keep restores short. The
+    timeline only grows when the content actually changes, so a game that
+    rewrites the same file every few seconds costs nothing.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.objects = os.path.join(directory, OBJECTS_DIR)
+        self.timeline_path = os.path.join(directory, TIMELINE_FILE)
+        os.makedirs(self.objects, exist_ok=True)
+        self.timeline = []
+        self.cache = OrderedDict()
+        self.depth = {}
+        if os.path.isfile(self.timeline_path):
+            good = 0
+            with open(self.timeline_path, "rb") as f:
+                for line in f:
+                    try:
+                        self.timeline.append(json.loads(line))
+                    except ValueError:
+                        break           # torn last line; cut it so appends stay parseable
+                    good += len(line)
+            if good != os.path.getsize(self.timeline_path):
+                os.truncate(self.timeline_path, good)
+        self.head = self.timeline[-1]["hash"] if self.timeline else None
+
+    # ----- objects -----
+    def object_path(self, digest):
+        return os.path.join(self.objects, digest)
+
+    def read_object(self, digest):
+        with open(self.object_path(digest), "rb") as f:
+            return json.loads(zlib.decompress(f.read()))
+
+    def write_object(self, digest, obj):
+        tmp = self.object_path(digest) + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(zlib.compress(canonical(obj)))
+        os.replace(tmp, self.object_path(digest))
+
+    def load(self, digest):
+        """Full content of a version (a fresh dict the caller may modify)."""
+        if digest in self.cache:
+            self.cache.move_to_end(digest)
+            return dict(self.cache[digest])
+        obj = self.read_object(digest)
+        if obj["base"] is None:
+            data = obj["data"]
+        else:
+            data = self.load(obj["base"])
+            data.update(obj["set"])
+            for key in obj["del"]:
+                data.pop(key, None)
+        self.depth[digest] = obj["depth"]
+        self.remember(digest, data)
+        return dict(data)
+
+    def remember(self, digest, data):
+        self.cache[digest] = data
+        self.cache.move_to_end(digest)
+        if len(self.cache) > HISTORY_CACHE:
+            self.cache.popitem(last=False)
+
+    # ----- recording -----
+    def record(self, data, source):
+        """Add `data` to the timeline if it differs from the head; returns the entry or None."""
+        digest = hashlib.sha256(canonical(data)).hexdigest()
+        if digest == self.head:
+            return None
+        if not os.path.exists(self.object_path(digest)):
+            obj = self.encode(data)
+            self.write_object(digest, obj)
+            self.depth[digest] = obj["depth"]
+
+        entry = {"t": time.time(), "hash": digest, "source": source}
+        with open(self.timeline_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        self.timeline.append(entry)
+        self.head = digest
+        self.remember(digest, dict(data))
+        return entry
+
+    def encode(self, data):
+        """Delta against the head when that is smaller and the chain is short enough."""
+        full = {"base": None, "depth": 0, "data": data}
+        if self.head is None:
+            return full
+        try:
+            base = self.load(self.head)
+            if self.head not in self.depth:
+                self.depth[self.head] = self.read_object(self.head)["depth"]
+        except (OSError, ValueError):
+            return full
+        depth = self.depth[self.head] + 1
+        if depth > HISTORY_CHAIN_MAX:
+            return full
+        changed = {k: v for k, v in data.items() if k not in base or base[k] != v}
+        removed = [k for k in base if k not in data]
+        if len(changed) + len(removed) >= len(data):
+            return full
+        return {"base": self.head, "depth": depth, "set": changed, "del": removed}
+
+    # ----- queries -----
+    def diff(self, old, new):
+        """[(key, old value, new value)] between two versions; None marks a missing key."""
+        a, b = self.load(old), self.load(new)
+        return [(k, a.get(k), b.get(k)) for k in sorted(a.keys() | b.keys()) if a.get(k) != b.get(k)]
+
+    def size(self):
+        """Bytes on disk: objects plus timeline."""
+        total = sum(e.stat().st_size for e in os.scandir(self.objects))
+        if os.path.isfile(self.timeline_path):
+            total += os.path.getsize(self.timeline_path)
+        return total
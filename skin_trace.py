@@ -0,0 +1,322 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+
+from reconcile_core import ReconcileCore, WRITE_QUIET_MS, RECONCILE_DELAY_MS
+from sim_reconcile import POLL_MS, SIM_SETTLE_S
+
+# Record what actually happens in CachedPlayerSkins, then replay it offline:
+#   python skin_trace.py record "D:\...\CachedPlayerSkins" -o login.trace.jsonl --contents
+#   python skin_trace.py replay-core login.trace.jsonl --quiet-ms 400
+#   python skin_trace.py replay-dir login.trace.jsonl replay_skins --speed 10
+# Record with the editor closed to capture the game alone; with it open the
+# trace also holds the editor's own writes, which replay treats as external.
+
+# ---------- CONFIGURATION ----------
+
+TRACE_VERSION = 1
+RECORD_POLL_MS = 50           # directory scan interval while recording
+RECORD_PATTERN = ".json"      # only skin files
+
+
+# ---------- RECORDING ----------
+
+def scan(directory):
+    """{name: (size, mtime_ns)} of the skin files in `directory`."""
+    out = {}
+    with os.scandir(directory) as entries:
+        for e in entries:
+            if e.name.endswith(RECORD_PATTERN) and e.is_file():
+                st = e.stat()
+                out[e.name] = (st.st_size, st.st_mtime_ns)
+    return out
+
+
+def file_digest(path):
+    """(sha256, bytes) of a file, or (None, None) if it vanished meanwhile."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None, None
+    return hashlib.sha256(data).hexdigest(), data
+
+
+class TraceRecorder:
+    """Polls a directory and appends one JSON line per observed change."""
+
+    def __init__(self, directory, out, contents=False, interval_ms=RECORD_POLL_MS):
+        self.directory = directory
+        self.out = out
+        self.contents = contents
+        self.interval = interval_ms / 1000.0
+        self.started = time.monotonic()
+        self.seen = scan(directory)
+        self.hashes = {}
+        self.events = 0
+        self.write({"trace": TRACE_VERSION, "dir": os.path.abspath(directory), "started": time.time(),
+                    "interval_ms": interval_ms, "contents": contents})
+        # the starting state, so a replay begins from the same files
+        for name in sorted(self.seen):
+            self.change("initial", name, self.seen[name])
+
+    def write(self, record):
+        self.out.write(json.dumps(record) + "\n")
+        self.out.flush()
+
+    def change(self, event, name, stat):
+        record = {"t": round(time.monotonic() - self.started, 6), "wall": time.time(),
+                  "event": event, "name": name}
+        if stat is not None:
+            digest, data = file_digest(os.path.join(self.directory, name))
+            if digest is None:
+                return
+            if event == "modified" and self.hashes.get(name) == digest:
+                record["event"] = "touched"     # rewritten with identical bytes
+            self.hashes[name] = digest
+            record.update(size=len(data), mtime_ns=stat[1], sha256=digest)
+            if self.contents:
+                record["content"] = data.decode("utf-8", errors="replace")
+        else:
+            self.hashes.pop(name, None)
+        self.write(record)
+        self.events += 1
+
+    def poll(self):
+        now = scan(self.directory)
+        for name, stat in now.items():
+            old = self.seen.get(name)
+            if old is None:
+                self.change("created", name, stat)
+            elif old != stat:
+                self.change("modified", name, stat)
+        for name in self.seen.keys() - now.keys():
+            self.change("deleted", name, None)
+        self.seen = now
+
+    def run(self, duration=None):
+        end = None if duration is None else time.monotonic() + duration
+        while end is None or time.monotonic() < end:
+            time.sleep(self.interval)
+            self.poll()
+
+
+# ---------- LOADING ----------
+
+def load_trace(path):
+    """(header, [event records]) from a trace file."""
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("trace") != TRACE_VERSION:
+            raise ValueError(f"{path}: not a skin trace (version {header.get('trace')!r})")
+        events = []
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                break           # recorder killed mid-line
+    return header, events
+
+
+def busiest_file(events):
+    counts = {}
+    for e in events:
+        if e["event"] in ("created", "modified", "touched"):
+            counts[e["name"]] = counts.get(e["name"], 0) + 1
+    if not counts:
+        raise ValueError("trace has no file changes")
+    return max(counts, key=counts.get)
+
+
+# ---------- REPLAY ----------
+
+def replay_core(events, name, desired=None, quiet_ms=WRITE_QUIET_MS, delay_ms=RECONCILE_DELAY_MS,
+                poll_ms=POLL_MS):
+    """Feed one file's recorded contents to ReconcileCore on a virtual clock.
+
+    `desired` defaults to the file's first recorded content (the outfit the
+    user had), so every later change away from it counts as a game overwrite.
+    Contents the recorder caught mid-write don't parse; they are skipped and
+    counted as "torn_skipped".
+    """
+    if poll_ms <= 0:
+        raise ValueError(f"poll_ms must be positive (got {poll_ms})")
+    writes = []
+    torn = 0
+    for e in events:
+        if e["name"] != name or e["event"] == "deleted" or "content" not in e:
+            continue
+        try:
+            data = json.loads(e["content"])
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            torn += 1
+            continue
+        writes.append((e["t"], data))
+    if not writes:
+        raise ValueError(f"no recorded contents for {name} (record with --contents)")
+    allowed = {}
+    for _, data in writes:
+        for key, value in data.items():
+            if isinstance(value, str):
+                allowed.setdefault(key, set()).add(value)
+    core = ReconcileCore(allowed, quiet_ms, delay_ms, now=writes[0][0])
+    core.desired = dict(desired if desired is not None else
+                        {k: v for k, v in writes[0][1].items() if k in allowed})
+
+    started = time.perf_counter()
+    disk = writes[0][1]
+    version = seen = 0
+    poll = poll_ms / 1000.0
+    next_poll = writes[0][0] + poll
+    end = writes[-1][0] + SIM_SETTLE_S
+    never = float("inf")
+    i = 1
+    reconcile_at = None
+    editor_writes = conflicted = 0
+    diverged_at = None
+    converge = []
+    while True:
+        t_write = writes[i][0] if i < len(writes) else never
+        t_reconcile = never if reconcile_at is None else reconcile_at
+        now = min(t_write, t_reconcile, next_poll)
+        if now > end:
+            break
+        if now == t_write:
+            # the game's write, as recorded; it knows nothing of ours
+            disk = writes[i][1]
+            version += 1
+            i += 1
+            if diverged_at is None and core.conflicts(disk):
+                diverged_at = now
+        elif now == t_reconcile:
+            reconcile_at = None
+            merged = core.merge(disk)
+            if merged != disk:
+                disk = merged
+                version += 1
+                seen = version
+                editor_writes += 1
+                core.seen_write(now)
+                if diverged_at is not None and not core.conflicts(disk):
+                    converge.append(now - diverged_at)
+                    diverged_at = None
+        else:
+            # the editor only learns about writes when it polls
+            if version != seen:
+                seen = version
+                if core.external_write(disk, now):
+                    conflicted += 1
+            if reconcile_at is None and core.due(now):
+                reconcile_at = now + core.delay
+            next_poll += poll
+    converge.sort()
+    return {
+        "file": name,
+        "game_writes": len(writes) - 1,
+        "torn_skipped": torn,
+        "conflicts_seen": conflicted,
+        "editor_writes": editor_writes,
+        "won": not core.conflicts(disk),
+        "converge_p50_s": round(converge[len(converge) // 2], 3) if converge else None,
+        "converge_max_s": round(converge[-1], 3) if converge else None,
+        "replay_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+def replay_dir(events, target, speed=1.0):
+    """Re-create the recorded changes in `target` at `speed` times real time,
+    e.g. for a live editor pointed there with HYTALE_SKINS_DIR."""
+    os.makedirs(target, exist_ok=True)
+    started = time.monotonic()
+    done = 0
+    for e in events:
+        delay = e["t"] / speed - (time.monotonic() - started)
+        if delay > 0:
+            time.sleep(delay)
+        path = os.path.join(target, e["name"])
+        if e["event"] == "deleted":
+            if os.path.exists(path):
+                os.remove(path)
+        elif "content" in e:
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(e["content"])
+            os.replace(tmp, path)
+        else:
+            continue
+        done += 1
+    return done
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record and replay CachedPlayerSkins change traces.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("record", help="log every change in a skin directory")
+    p.add_argument("directory")
+    p.add_argument("-o", "--out", required=True)
+    p.add_argument("--contents", action="store_true", help="store file contents (needed for replay)")
+    p.add_argument("--duration", type=float, help="seconds to record (default: until Ctrl+C)")
+    p.add_argument("--interval-ms", type=float, default=RECORD_POLL_MS)
+
+    p = sub.add_parser("replay-core", help="run the reconcile core over a trace, offline")
+    p.add_argument("trace")
+    p.add_argument("--file", help="skin file to replay (default: the most changed one)")
+    p.add_argument("--desired", help="JSON {key: value} intent (default: the file's first content)")
+    p.add_argument("--quiet-ms", type=float, default=WRITE_QUIET_MS)
+    p.add_argument("--delay-ms", type=float, default=RECONCILE_DELAY_MS)
+    p.add_argument("--poll-ms", type=float, default=POLL_MS)
+
+    p = sub.add_parser("replay-dir", help="re-create the changes in a directory in real time")
+    p.add_argument("trace")
+    p.add_argument("target")
+    p.add_argument("--speed", type=float, default=1.0, help="2 = twice as fast")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        if not os.path.isdir(args.directory):
+            print(f"ERROR: {args.directory} is not a directory", file=sys.stderr)
+            return 1
+        try:
+            with open(args.out, "w", encoding="utf-8") as out:
+                recorder = TraceRecorder(args.directory, out, args.contents, args.interval_ms)
+                print(f"Recording {args.directory} -> {args.out} (Ctrl+C to stop)")
+                try:
+                    recorder.run(args.duration)
+                except KeyboardInterrupt:
+                    pass
+        except OSError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        print(f"{recorder.events} events recorded")
+        return 0
+
+    try:
+        header, events = load_trace(args.trace)
+        if args.command == "replay-dir":
+            done = replay_dir(events, args.target, args.speed)
+            print(f"Replayed {done} changes into {args.target}")
+            return 0
+        desired = None
+        if args.desired:
+            with open(args.desired, "r", encoding="utf-8") as f:
+                desired = json.load(f)
+        result = replay_core(events, args.file or busiest_file(events), desired,
+                             args.quiet_ms, args.delay_ms, args.poll_ms)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    for key, value in result.items():
+        print(f"{key:<20} {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())